@@ -0,0 +1,172 @@
+"""Microbenchmark of the time PyMDbScraper spends extracting information from each page.
+
+Pages are generated locally and served by an in-memory transport without any rate limit,
+so only parsing and extraction are measured. Run from the repository's root directory::
+
+    python benchmarks/extraction.py --iterations 200
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymdb.ratelimit import RateLimiter  # noqa: E402
+from pymdb.scraper import PyMDbScraper  # noqa: E402
+from pymdb.transport import Transport, TransportResponse  # noqa: E402
+
+_CAST_SIZE = 150
+_CREW_SIZE = 150
+_FILMOGRAPHY_SIZE = 200
+_COMPANY_PAGE_SIZE = 50
+
+
+def _title_page():
+    cast_rows = ''.join(
+        f'<tr class="{"odd" if i % 2 else "even"}"><td class="primary_photo"></td>'
+        f'<td><a href="/name/nm{i:07d}/">Actor {i}</a></td><td class="ellipsis">...</td>'
+        f'<td class="character"><a href="/title/tt0076759/characters/nm{i:07d}">Character {i}</a>'
+        f'<a class="toggle-episodes" href="#">{i} episodes, 1999-2013</a></td></tr>'
+        for i in range(15)
+    )
+    details = ''.join(
+        f'<div class="txt-block"><h4 class="inline">{label}:</h4> {content}</div>' for label, content in (
+            ('Country', '<a href="/search/title?country_of_origin=us">USA</a>'),
+            ('Language', '<a href="/search/title?title_type=feature&primary_language=en">English</a>'),
+            ('Release Date', '25 May 1977 (USA) <span class="see-more inline"><a href="releaseinfo">See more</a></span>'),
+            ('Budget', '$11,000,000 <span class="attribute">(estimated)</span>'),
+            ('Opening Weekend USA', '$1,554,475, <span class="attribute">29 May 1977</span>'),
+            ('Gross USA', '$460,998,507'),
+            ('Cumulative Worldwide Gross', '$775,398,007'),
+            ('Production Co', ''.join(f'<a href="/company/co{i:07d}">Company {i}</a>, ' for i in range(5))),
+        )
+    )
+    return f'''<html><body>
+    <div class="title_wrapper"><h1>Star Wars: Episode IV - A New Hope <span id="titleYear">(1977)</span></h1>
+        <div class="subtext">PG <span class="ghost">|</span> <time>2h 1min</time> <span class="ghost">|</span>
+        <a href="/search/title?genres=action">Action</a>, <a href="/title/tt0076759/releaseinfo">TV Series (1999–2013)</a></div>
+    </div>
+    <div class="summary_text">Luke Skywalker joins forces with a Jedi Knight.</div>
+    <div id="titleStoryLine"><div><p><span>The Imperial Forces hold Princess Leia hostage.</span></p></div></div>
+    <table class="cast_list">{cast_rows}</table>
+    <div id="titleDetails">{details}</div>
+    <div class="bp_heading">Season 3 <span>|</span> Episode 12</div>
+    </body></html>'''
+
+
+def _full_credits_page():
+    cast_rows = ''.join(
+        f'<tr class="{"odd" if i % 2 else "even"}"><td class="primary_photo"></td>'
+        f'<td><a href="/name/nm{i:07d}/">Actor {i}</a></td><td class="ellipsis">...</td>'
+        f'<td class="character">Character {i}\n   <a class="toggle-episodes" href="#">{i} episodes, 1999-2013</a></td></tr>'
+        for i in range(_CAST_SIZE)
+    )
+    crew = ''.join(
+        f'<h4 class="dataHeaderWithBorder">{job} <span>&nbsp;</span></h4><table class="simpleCreditsTable">' +
+        ''.join(f'<tr><td class="name"><a href="/name/nm{i:07d}/">Person {i}</a></td><td>...</td>'
+                f'<td class="credit">(credit {i}) ({i} episodes, 1999-2013)</td></tr>'
+                for i in range(_CREW_SIZE // 5)) +
+        '</table>'
+        for job in ('Directed by', 'Writing Credits', 'Produced by', 'Music by', 'Cinematography by')
+    )
+    return f'''<html><body><div id="fullcredits_content">
+    <h4 class="dataHeaderWithBorder" id="cast">Cast</h4><table class="cast_list">{cast_rows}</table>
+    {crew}</div></body></html>'''
+
+
+def _name_bio_page():
+    return '''<html><body><div id="main"><div><div><div><h3><a href="/name/nm0000434/">Mark Hamill</a></h3></div></div></div>
+    <div id="bio_content"><table id="overviewTable">
+        <tr><td class="label">Born</td><td><time datetime="1951-9-25">September 25, 1951</time> in
+            <a href="/search/name?birth_place=Oakland">Oakland, California, USA</a></td></tr>
+        <tr><td class="label">Birth Name</td><td>Mark Richard Hamill</td></tr>
+        <tr><td class="label">Nicknames</td><td>Mark<br/>Luke</td></tr>
+        <tr><td class="label">Height</td><td>5' 9" (1.75 m)</td></tr>
+    </table></div></div></body></html>'''
+
+
+def _filmography_page():
+    rows = ''.join(
+        f'<div class="filmo-row {"odd" if i % 2 else "even"}" id="actor-tt{i:07d}">'
+        f'<span class="year_column">&nbsp;1999-2013</span><b><a href="/title/tt{i:07d}/">Title {i}</a></b> '
+        f'(TV Series) (voice)<br/>Character {i}'
+        f'<div class="filmo-episodes">- <a href="/title/tt{i + 1:07d}/">Episode</a> (2001) ... Character {i}</div>'
+        f'</div>'
+        for i in range(_FILMOGRAPHY_SIZE)
+    )
+    return f'<html><body><div id="filmography"><div class="filmo-category-section">{rows}</div></div></body></html>'
+
+
+def _company_page():
+    rows = ''.join(
+        f'<span class="lister-item-header"><span class="lister-item-index">{i}.</span>'
+        f'<span><a href="/title/tt{i:07d}/">Title {i}</a> <span class="lister-item-year">(2005– TV Series)</span></span></span>'
+        for i in range(1, _COMPANY_PAGE_SIZE + 1)
+    )
+    return f'''<html><body><div class="article"><h1 class="header">Lucasfilm</h1>
+    <div class="desc"><span>1-{_COMPANY_PAGE_SIZE} of {_COMPANY_PAGE_SIZE} titles.</span></div>
+    <div class="lister-list">{rows}</div></div></body></html>'''
+
+
+def _tech_specs_page():
+    specs = (
+        ('Runtime', '2 hr 1 min (121 min)'),
+        ('Sound Mix', 'Dolby Stereo | 70 mm 6-Track'),
+        ('Color', 'Color (Technicolor)'),
+        ('Aspect Ratio', '2.39 : 1<br/>2.20 : 1 (70 mm prints)'),
+        ('Camera', 'Panavision Panaflex, Panavision Lenses and Arriflex 35 IIC'),
+        ('Laboratory', 'DeLuxe, Hollywood<br/>Technicolor, London'),
+        ('Negative Format', '35 mm'),
+        ('Cinematographic Process', 'Panavision (anamorphic)<br/>Dykstraflex'),
+        ('Printed Film Format', '35 mm (anamorphic)'),
+    )
+    rows = ''.join(f'<tr class="{"odd" if i % 2 else "even"}"><td class="label">{label}</td><td>{content}</td></tr>'
+                   for i, (label, content) in enumerate(specs))
+    return f'<html><body><div id="technical_content"><table>{rows}</table></div></body></html>'
+
+
+_PAGES = {
+    '/fullcredits': _full_credits_page(),
+    '/technical/': _tech_specs_page(),
+    '/bio': _name_bio_page(),
+    '/search/title/': _company_page(),
+    '/name/': _filmography_page(),
+    '/title/': _title_page(),
+}
+
+
+class _PageTransport(Transport):
+    def get(self, url, headers=None, timeout=None):
+        for pattern, page in _PAGES.items():
+            if pattern in url:
+                return TransportResponse(url, 200, page)
+        return TransportResponse(url, 404, '')
+
+
+_BENCHMARKS = (
+    ('get_title', lambda scraper: scraper.get_title('tt0076759')),
+    ('get_full_credits', lambda scraper: list(scraper.get_full_credits('tt0076759'))),
+    ('get_name', lambda scraper: scraper.get_name('nm0000434')),
+    ('get_name_credits', lambda scraper: list(scraper.get_name_credits('nm0000434'))),
+    ('get_company', lambda scraper: list(scraper.get_company('co0071326'))),
+    ('get_tech_specs', lambda scraper: scraper.get_tech_specs('tt0076759')),
+)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--iterations', type=int, default=200, help='times each page is extracted')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='runs of each benchmark, keeping the fastest')
+    args = arg_parser.parse_args()
+
+    scraper = PyMDbScraper(rate_limiter=RateLimiter(0), transport=_PageTransport())
+    print(f'{"page":<20}{"ms per page":>12}')
+    for name, benchmark in _BENCHMARKS:
+        timings = timeit.repeat(lambda: benchmark(scraper), number=args.iterations, repeat=args.repeat)
+        print(f'{name:<20}{min(timings) / args.iterations * 1000:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,6 @@
+from .async_scraper import AsyncPyMDbScraper
+from .exporter import PyMDbSQLiteExporter
+from .indexes import PyMDbGroupedIndex, PyMDbIndex
 from .parser import PyMDbParser
 from .scraper import PyMDbScraper
 from .models import *
@@ -0,0 +1,195 @@
+"""Module containing the AsyncPyMDbScraper class."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from weakref import WeakKeyDictionary
+from pymdb.scraper import PyMDbScraper
+
+_DEFAULT_MAX_CONCURRENCY = 10
+
+
+def _to_list(function, *args, **kwargs):
+    """Private function to consume a scraper generator into a list.
+
+    Args:
+        function (:obj:`callable`): The scraper's generator function.
+        *args: The function's arguments.
+        **kwargs: The function's keyword arguments.
+
+    Returns:
+        :obj:`list`: Every object yielded by the generator.
+    """
+
+    return list(function(*args, **kwargs))
+
+
+class AsyncPyMDbScraper:
+    """Scrapes various information from IMDb web pages using coroutines.
+
+    Provides a coroutine for each method of :class:`~.scraper.PyMDbScraper`, so many pages can be
+    scraped concurrently (ex: with :func:`asyncio.gather`). Each page is requested and scraped by a
+    :class:`~.scraper.PyMDbScraper` on a pool of worker threads, sharing its extraction logic and pooled
+    HTTP session. At most `max_concurrency` pages are scraped at once, and every request still waits
+    for the scraper's rate limiter.
+
+    Args:
+        rate_limit (:obj:`int`, optional): The amount of milliseconds between the start of each request.
+        max_concurrency (:obj:`int`, optional): The maximum amount of pages scraped at once.
+        burst (:obj:`int`, optional): The amount of requests that can be sent back to back before
+            the rate limit applies.
+        rate_limiter (:class:`~.ratelimit.RateLimiter`, optional): The rate limiter to use instead of
+            the one shared by `rate_limit` and `burst`.
+        scraper (:class:`~.scraper.PyMDbScraper`, optional): The scraper used for each page, or `None` to
+            create one from the other arguments.
+
+    Raises:
+        ValueError: If `max_concurrency` is less than 1.
+    """
+
+    def __init__(self, rate_limit=1000, max_concurrency=_DEFAULT_MAX_CONCURRENCY, burst=1, rate_limiter=None,
+                 scraper=None):
+        if max_concurrency < 1:
+            raise ValueError(f'Invalid max concurrency: {max_concurrency}')
+        if scraper is None:
+            scraper = PyMDbScraper(rate_limit=rate_limit, pool_maxsize=max_concurrency, burst=burst,
+                                   rate_limiter=rate_limiter)
+        self._scraper = scraper
+        self._max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._semaphores = WeakKeyDictionary()
+
+    async def get_title(self, title_id, include_taglines=False):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_title`."""
+
+        return await self._run(self._scraper.get_title, title_id, include_taglines=include_taglines)
+
+    async def get_full_cast(self, title_id, include_episodes=False):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_full_cast`.
+
+        The scraper's generator is consumed in full, so the credits are returned as a list.
+
+        Returns:
+            :obj:`list` of :class:`~.models.name.CreditScrape`: The title's cast.
+        """
+
+        return await self._run(_to_list, self._scraper.get_full_cast, title_id, include_episodes=include_episodes)
+
+    async def get_full_crew(self, title_id):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_full_crew`.
+
+        The scraper's generator is consumed in full, so the credits are returned as a list.
+
+        Returns:
+            :obj:`list` of :class:`~.models.name.CreditScrape`: The title's crew.
+        """
+
+        return await self._run(_to_list, self._scraper.get_full_crew, title_id)
+
+    async def get_full_credits(self, title_id, include_episodes=False):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_full_credits`.
+
+        The scraper's generator is consumed in full, so the credits are returned as a list.
+
+        Returns:
+            :obj:`list` of :class:`~.models.name.CreditScrape`: The title's cast and crew.
+        """
+
+        return await self._run(_to_list, self._scraper.get_full_credits, title_id, include_episodes=include_episodes)
+
+    async def get_full_credits_as_dict(self, title_id, include_episodes=False):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_full_credits_as_dict`."""
+
+        return await self._run(self._scraper.get_full_credits_as_dict, title_id, include_episodes=include_episodes)
+
+    async def get_name(self, name_id, include_known_for_titles=False):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_name`."""
+
+        return await self._run(self._scraper.get_name, name_id, include_known_for_titles=include_known_for_titles)
+
+    async def get_name_credits(self, name_id, include_episodes=False):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_name_credits`.
+
+        The scraper's generator is consumed in full, so the credits are returned as a list.
+
+        Returns:
+            :obj:`list` of :class:`~.models.name.NameCreditScrape`: The person's credits.
+        """
+
+        return await self._run(_to_list, self._scraper.get_name_credits, name_id, include_episodes=include_episodes)
+
+    async def get_company(self, company_id):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_company`.
+
+        The scraper's generator is consumed in full, so the titles are returned as a list.
+
+        Returns:
+            :obj:`list` of :class:`~.models.company.CompanyScrape`: The titles the company is credited for.
+        """
+
+        return await self._run(_to_list, self._scraper.get_company, company_id)
+
+    async def get_company_credits(self, title_id):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_company_credits`.
+
+        The scraper's generator is consumed in full, so the credits are returned as a list.
+
+        Returns:
+            :obj:`list` of :class:`~.models.company.CompanyCreditScrape`: The title's company credits.
+        """
+
+        return await self._run(_to_list, self._scraper.get_company_credits, title_id)
+
+    async def get_tech_specs(self, title_id):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_tech_specs`."""
+
+        return await self._run(self._scraper.get_tech_specs, title_id)
+
+    async def get_search_results(self, keyword):
+        """Coroutine version of :meth:`~.scraper.PyMDbScraper.get_search_results`."""
+
+        return await self._run(self._scraper.get_search_results, keyword)
+
+    def close(self):
+        """Shut down the worker threads and close the scraper's HTTP session."""
+
+        self._executor.shutdown(wait=True)
+        self._scraper.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def _run(self, function, *args, **kwargs):
+        """Private coroutine to call a scraper function on a worker thread.
+
+        Args:
+            function (:obj:`callable`): The function to call.
+            *args: The function's arguments.
+            **kwargs: The function's keyword arguments.
+
+        Returns:
+            The function's result.
+        """
+
+        loop = asyncio.get_event_loop()
+        async with self._get_semaphore(loop):
+            return await loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
+
+    def _get_semaphore(self, loop):
+        """Private function to get the semaphore bounding concurrent pages within an event loop.
+
+        Semaphores are created per event loop, since they cannot be shared between loops.
+
+        Args:
+            loop (:obj:`asyncio.AbstractEventLoop`): The running event loop.
+
+        Returns:
+            :obj:`asyncio.Semaphore`: The loop's semaphore.
+        """
+
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphores[loop]
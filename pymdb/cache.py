@@ -0,0 +1,327 @@
+"""Module containing the DatasetCache class.
+
+The cache stores a parsed IMDb dataset in a compact binary columnar file so later
+parses can memory-map it instead of tokenizing the `tsv` file again.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+_MAGIC = b'PYMDBC01'
+_FOOTER = struct.Struct('<Q8s')
+_VERSION = 2
+_ALIGNMENT = 8
+_SAMPLE_SIZE = 1024 * 1024  # bytes
+_SEPARATOR = '\t'  # never appears within a dataset value
+_DEFAULT_BLOCK_SIZE = 65536  # rows
+
+
+def _source_key(path):
+    """Private function to build the key identifying the contents of a source file.
+
+    The hash covers the first and last megabyte of the file so validating a cache
+    does not require reading the whole source.
+
+    Args:
+        path (:obj:`str`): The system path to the source file.
+
+    Returns:
+        :obj:`dict`: The source file's size, modification time, and hash.
+    """
+
+    stat = os.stat(path)
+    sha1 = hashlib.sha1()
+    with open(path, mode='rb') as f:
+        sha1.update(f.read(_SAMPLE_SIZE))
+        if stat.st_size > _SAMPLE_SIZE:
+            f.seek(max(stat.st_size - _SAMPLE_SIZE, _SAMPLE_SIZE))
+            sha1.update(f.read())
+    return {
+        'size': stat.st_size,
+        'mtime': stat.st_mtime_ns,
+        'hash': sha1.hexdigest()
+    }
+
+
+class DatasetCache:
+    """Binary columnar cache of a single dataset file.
+
+    Rows are stored in blocks. Within a block, each numeric column is a fixed-width array and each
+    string column is a heap of its UTF-8 values separated by tabs, which is decoded with a single split.
+    Every column also has a mask marking its missing values.
+    The cache is keyed by the source file's size, modification time, and hash, and is ignored once
+    the source file changes.
+
+    Args:
+        cache_dir (:obj:`str`): The system path to the directory the cache file is stored in.
+        source_path (:obj:`str`): The system path to the dataset file being cached.
+        columns (:obj:`tuple` of (:obj:`str`, :obj:`str`)): The name of each column and the
+            :obj:`array.array` typecode it is stored as, or `None` if it is stored as a string.
+        block_size (:obj:`int`, optional): The amount of rows stored in each block.
+    """
+
+    __slots__ = '_source_path', '_columns', '_block_size', '_path'
+
+    def __init__(self, cache_dir, source_path, columns, block_size=_DEFAULT_BLOCK_SIZE):
+        self._source_path = source_path
+        self._columns = tuple(columns)
+        self._block_size = block_size
+        path_hash = hashlib.sha1(os.path.abspath(source_path).encode('utf8')).hexdigest()[:16]
+        self._path = os.path.join(cache_dir, f'{os.path.basename(source_path)}.{path_hash}.cache')
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def source_path(self):
+        return self._source_path
+
+    def is_valid(self):
+        """Determine if the cache file exists and matches the current source file.
+
+        Returns:
+            :obj:`bool`: If the cache can be read instead of the source file.
+        """
+
+        if not os.path.exists(self._path) or not os.path.exists(self._source_path):
+            return False
+        try:
+            with open(self._path, mode='rb') as f:
+                metadata = self._read_metadata(f)
+        except (OSError, ValueError):
+            return False
+        return metadata['version'] == _VERSION and metadata['byteorder'] == sys.byteorder and \
+            metadata['columns'] == [list(column) for column in self._columns] and \
+            metadata['source'] == _source_key(self._source_path)
+
+    def read_rows(self):
+        """Read every row stored in the cache.
+
+        Numeric values are returned already converted, with `None` for missing values.
+
+        Yields:
+            :obj:`tuple`: The values of each row.
+        """
+
+        for row_count, columns, masks in self.read_blocks():
+            values = []
+            for name, typecode in self._columns:
+                # Views of the block are popped so none are held once the memory map is closed
+                column = columns.pop(name)
+                mask = masks.pop(name).tolist()
+                column = column.tolist() if typecode is not None else column()
+                if any(mask):
+                    column = [None if missing else value for value, missing in zip(column, mask)]
+                values.append(column)
+            yield from zip(*values)
+
+    def read_blocks(self, names=None):
+        """Read each block of the cache as memory-mapped columns.
+
+        Numeric columns are returned as :obj:`memoryview` objects over the memory-mapped file.
+        String columns are returned as functions that decode the column into a list of
+        strings, so columns that are never used are never decoded. The file is unmapped once every
+        block is read and none of the returned columns are still referenced.
+
+        Args:
+            names (:obj:`list` of :obj:`str`, optional): The names of the columns to read, or `None` to read all.
+
+        Yields:
+            (:obj:`int`, :obj:`dict`, :obj:`dict`): The amount of rows in the block, a dictionary of each column's
+                name to its values, and a dictionary of each column's name to its missing value mask.
+        """
+
+        typecodes = dict(self._columns)
+        if names is None:
+            names = list(typecodes.keys())
+        with open(self._path, mode='rb') as f:
+            metadata = self._read_metadata(f)
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(buffer)
+        try:
+            for block in metadata['blocks']:
+                yield self._read_block(view, block, names, typecodes)
+        finally:
+            view.release()
+            try:
+                buffer.close()
+            except BufferError:
+                # The caller still holds views of the file, which is unmapped once they are released
+                pass
+
+    def write(self, rows):
+        """Write rows to the cache while passing them through.
+
+        The cache file is only created once every row has been read. If the rows are not read
+        in full, such as when a consumer stops iterating, no cache file is written.
+
+        Args:
+            rows (:obj:`iterable`): The rows being cached. Each row's values must already be converted
+                for numeric columns, with `None` for missing values.
+
+        Yields:
+            Each row, unchanged.
+        """
+
+        os.makedirs(os.path.dirname(self._path) or '.', exist_ok=True)
+        source = _source_key(self._source_path)
+        tmp_path = f'{self._path}.{os.getpid()}.tmp'
+        blocks = []
+        completed = False
+        try:
+            with open(tmp_path, mode='wb') as f:
+                f.write(_MAGIC)
+                block = []
+                for row in rows:
+                    block.append(row)
+                    if len(block) >= self._block_size:
+                        blocks.append(self._write_block(f, block))
+                        block = []
+                    yield row
+                if block:
+                    blocks.append(self._write_block(f, block))
+                metadata = json.dumps({
+                    'version': _VERSION,
+                    'byteorder': sys.byteorder,
+                    'columns': [list(column) for column in self._columns],
+                    'source': source,
+                    'blocks': blocks
+                }).encode('utf8')
+                f.write(metadata)
+                f.write(_FOOTER.pack(len(metadata), _MAGIC))
+            os.replace(tmp_path, self._path)
+            completed = True
+        finally:
+            if not completed and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _write_block(self, f, rows):
+        """Private function to write a block of rows to the cache file.
+
+        Args:
+            f (:obj:`file`): The cache file being written.
+            rows (:obj:`list`): The rows in the block.
+
+        Returns:
+            :obj:`dict`: The block's metadata, containing the offset and length of each segment.
+        """
+
+        block = {'rows': len(rows), 'columns': {}}
+        for (name, typecode), values in zip(self._columns, zip(*rows)):
+            mask = array('B', (value is None for value in values))
+            segments = {'mask': self._write_segment(f, mask.tobytes())}
+            if typecode is not None:
+                column = array(typecode, (0 if value is None else value for value in values))
+                segments['values'] = self._write_segment(f, column.tobytes())
+            else:
+                heap = _SEPARATOR.join('' if value is None else value for value in values).encode('utf8')
+                segments['values'] = self._write_segment(f, heap)
+            block['columns'][name] = segments
+        return block
+
+    @staticmethod
+    def _write_segment(f, data):
+        """Private function to write a segment aligned to 8 bytes.
+
+        Args:
+            f (:obj:`file`): The cache file being written.
+            data (:obj:`bytes`): The segment's data.
+
+        Returns:
+            :obj:`list` of :obj:`int`: The offset and length of the segment.
+        """
+
+        padding = -f.tell() % _ALIGNMENT
+        if padding:
+            f.write(bytes(padding))
+        offset = f.tell()
+        f.write(data)
+        return [offset, len(data)]
+
+    def _read_block(self, view, block, names, typecodes):
+        """Private function to view the columns of a block in the memory-mapped cache.
+
+        Args:
+            view (:obj:`memoryview`): A view of the whole cache file.
+            block (:obj:`dict`): The block's metadata.
+            names (:obj:`list` of :obj:`str`): The names of the columns to read.
+            typecodes (:obj:`dict`): The :obj:`array.array` typecode of each column, or `None` for strings.
+
+        Returns:
+            (:obj:`int`, :obj:`dict`, :obj:`dict`): The amount of rows in the block, a dictionary of each column's
+                name to its values, and a dictionary of each column's name to its missing value mask.
+        """
+
+        columns = {}
+        masks = {}
+        for name in names:
+            segments = block['columns'][name]
+            masks[name] = self._segment(view, segments['mask'], 'B')
+            if typecodes[name] is not None:
+                columns[name] = self._segment(view, segments['values'], typecodes[name])
+            else:
+                columns[name] = self._string_decoder(view, segments['values'])
+        return block['rows'], columns, masks
+
+    @staticmethod
+    def _segment(view, segment, typecode):
+        """Private function to view a segment of the memory-mapped cache as a typed array.
+
+        Args:
+            view (:obj:`memoryview`): A view of the whole cache file.
+            segment (:obj:`list` of :obj:`int`): The offset and length of the segment.
+            typecode (:obj:`str`): The segment's :obj:`array.array` typecode.
+
+        Returns:
+            :obj:`memoryview`: The segment's values.
+        """
+
+        offset, length = segment
+        return view[offset:offset + length].cast(typecode)
+
+    @staticmethod
+    def _string_decoder(view, segment):
+        """Private function to build a function that decodes a string heap segment.
+
+        Args:
+            view (:obj:`memoryview`): A view of the whole cache file.
+            segment (:obj:`list` of :obj:`int`): The offset and length of the heap.
+
+        Returns:
+            :obj:`callable`: A function returning the :obj:`list` of :obj:`str` in the heap.
+        """
+
+        offset, length = segment
+        heap = view[offset:offset + length]
+        return lambda: str(heap, 'utf8').split(_SEPARATOR)
+
+    @staticmethod
+    def _read_metadata(f):
+        """Private function to read the metadata stored at the end of a cache file.
+
+        Args:
+            f (:obj:`file`): The cache file opened in binary mode.
+
+        Returns:
+            :obj:`dict`: The cache's metadata.
+
+        Raises:
+            ValueError: If the file is not a valid cache file.
+        """
+
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size < len(_MAGIC) + _FOOTER.size:
+            raise ValueError('Invalid cache file')
+        f.seek(size - _FOOTER.size)
+        length, magic = _FOOTER.unpack(f.read(_FOOTER.size))
+        if magic != _MAGIC or length > size - _FOOTER.size:
+            raise ValueError('Invalid cache file')
+        f.seek(size - _FOOTER.size - length)
+        return json.loads(f.read(length).decode('utf8'))
@@ -0,0 +1,196 @@
+"""Module containing functions to read IMDb web pages that were saved locally.
+
+Each function yields the URL and HTML of every saved page, which can be scraped without using
+the network by :meth:`~.scraper.PyMDbScraper.scrape_pages`, for example to scrape a corpus of
+pages again after an extraction bug is fixed.
+"""
+
+import gzip
+import os
+import zlib
+from requests.structures import CaseInsensitiveDict
+
+_DEFAULT_BASE_URL = 'https://www.imdb.com'
+_HTML_EXTENSIONS = ('.html', '.htm')
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+def read_directory(directory, base_url=_DEFAULT_BASE_URL):
+    """Reads every HTML file in a directory of saved IMDb web pages.
+
+    Each file's URL is built from its path within the directory, using the layout of a mirror
+    downloaded by `wget --mirror --adjust-extension`: `title/tt0076759/index.html` is the page of
+    `/title/tt0076759/`, `title/tt0076759/fullcredits.html` is the page of `/title/tt0076759/fullcredits`,
+    and a query is kept after the file name (ex: `search/title/index.html?companies=co0071326`).
+    Files are read in sorted order, one at a time.
+
+    Args:
+        directory (:obj:`str`): The system path to the directory.
+        base_url (:obj:`str`, optional): The scheme and host the pages were downloaded from.
+
+    Yields:
+        :obj:`tuple` of (:obj:`str`, :obj:`str`): The URL and HTML of each page.
+    """
+
+    base_url = base_url.rstrip('/')
+    for root, directories, filenames in os.walk(directory):
+        directories.sort()
+        for filename in sorted(filenames):
+            file_path = os.path.join(root, filename)
+            path = os.path.relpath(file_path, directory).replace(os.sep, '/')
+            url_path = _get_url_path(path)
+            if url_path is not None:
+                with open(file_path, mode='r', encoding='utf8', errors='replace') as f:
+                    yield base_url + url_path, f.read()
+
+
+def read_warc(warc_path):
+    """Reads every successful HTML response in a WARC archive of IMDb web pages.
+
+    Both uncompressed archives and archives compressed with gzip, either as a whole or record
+    by record, are read. Records are read one at a time, and records that are not a response with
+    a status of 200 and an HTML body are skipped.
+
+    Args:
+        warc_path (:obj:`str`): The system path to the WARC archive.
+
+    Yields:
+        :obj:`tuple` of (:obj:`str`, :obj:`str`): The URL and HTML of each page.
+
+    Raises:
+        ValueError: If the archive contains an invalid record.
+    """
+
+    with open(warc_path, mode='rb') as f:
+        compressed = f.read(2) == _GZIP_MAGIC
+    with (gzip.open(warc_path, mode='rb') if compressed else open(warc_path, mode='rb')) as warc:
+        while True:
+            line = warc.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            if not line.startswith(b'WARC/'):
+                raise ValueError(f'Invalid WARC record: {line[:50]}')
+            headers = _read_headers(warc)
+            block = warc.read(int(headers.get('Content-Length', 0)))
+            if headers.get('WARC-Type') != 'response' or \
+                    not headers.get('Content-Type', '').startswith('application/http'):
+                continue
+            html = _get_response_html(block)
+            if html is not None:
+                yield headers.get('WARC-Target-URI', '').strip('<>'), html
+
+
+def _get_url_path(path):
+    """Private function to get the URL path of a saved page from its path within a mirrored directory.
+
+    Args:
+        path (:obj:`str`): The file's path within the directory, separated by `/`.
+
+    Returns:
+        :obj:`str`: The URL's path and query, or `None` if the file is not an HTML page.
+    """
+
+    path, separator, query = path.partition('?')
+    name = path.rsplit('/', 1)[-1]
+    if name in ('index.html', 'index.htm'):
+        path = path[:-len(name)]
+    elif path.endswith(_HTML_EXTENSIONS):
+        path = os.path.splitext(path)[0]
+    else:
+        return None
+    return f'/{path}{separator}{query}'
+
+
+def _read_headers(stream):
+    """Private function to read header lines up to the blank line that ends them.
+
+    Args:
+        stream (:obj:`file object`): The binary stream, positioned after the record's or response's first line.
+
+    Returns:
+        :class:`CaseInsensitiveDict`: The headers.
+    """
+
+    headers = CaseInsensitiveDict()
+    for line in iter(stream.readline, b''):
+        line = line.decode('latin-1').strip()
+        if not line:
+            break
+        name, _, value = line.partition(':')
+        headers[name.strip()] = value.strip()
+    return headers
+
+
+def _get_response_html(block):
+    """Private function to get the HTML body of an HTTP response stored in a WARC record.
+
+    Bodies are decoded using the charset of their `Content-Type`, or UTF-8 if they do not have one.
+
+    Args:
+        block (:obj:`bytes`): The record's block, containing the raw HTTP response.
+
+    Returns:
+        :obj:`str`: The response's HTML, or `None` if it was not successful or not HTML.
+    """
+
+    head, _, body = block.partition(b'\r\n\r\n')
+    status_line, _, header_lines = head.partition(b'\r\n')
+    status = status_line.split()
+    if len(status) < 2 or status[1] != b'200':
+        return None
+    headers = CaseInsensitiveDict()
+    for line in header_lines.decode('latin-1').split('\r\n'):
+        name, _, value = line.partition(':')
+        headers[name.strip()] = value.strip()
+    content_type = headers.get('Content-Type', 'text/html')
+    if 'html' not in content_type:
+        return None
+
+    if 'chunked' in headers.get('Transfer-Encoding', '').lower():
+        body = _decode_chunked(body)
+    content_encoding = headers.get('Content-Encoding', '').lower()
+    if content_encoding in ('gzip', 'deflate'):
+        try:
+            # 32 + MAX_WBITS detects the gzip and zlib headers
+            body = zlib.decompress(body, 32 + zlib.MAX_WBITS)
+        except zlib.error:
+            pass
+
+    charset = 'utf8'
+    for parameter in content_type.split(';')[1:]:
+        name, _, value = parameter.partition('=')
+        if name.strip().lower() == 'charset' and value.strip():
+            charset = value.strip().strip('"')
+    try:
+        return body.decode(charset, errors='replace')
+    except LookupError:
+        return body.decode('utf8', errors='replace')
+
+
+def _decode_chunked(body):
+    """Private function to join the chunks of a body sent with a chunked `Transfer-Encoding`.
+
+    Args:
+        body (:obj:`bytes`): The chunked body.
+
+    Returns:
+        :obj:`bytes`: The joined body, or the body unchanged if it is not validly chunked.
+    """
+
+    chunks = []
+    position = 0
+    while position < len(body):
+        line_end = body.find(b'\r\n', position)
+        if line_end < 0:
+            return body
+        try:
+            size = int(body[position:line_end].split(b';')[0], 16)
+        except ValueError:
+            return body
+        if size == 0:
+            break
+        chunks.append(body[line_end + 2:line_end + 2 + size])
+        position = line_end + 2 + size + 2
+    return b''.join(chunks)
@@ -0,0 +1,286 @@
+"""Module containing the PyMDbSQLiteExporter class.
+
+The exporter loads the datasets provided by IMDb into a normalized SQLite database,
+where each list column (ex: `genres`) is stored in its own child table.
+"""
+
+import sqlite3
+from pymdb.parser import (
+    PyMDbParser,
+    _BOOL,
+    _CHARACTERS,
+    _FLOAT,
+    _INT,
+    _LIST,
+    _NAME_BASICS,
+    _TITLE_AKAS,
+    _TITLE_BASICS,
+    _TITLE_CREW,
+    _TITLE_EPISODE,
+    _TITLE_PRINCIPALS,
+    _TITLE_RATINGS
+)
+
+_DEFAULT_BATCH_SIZE = 50000  # rows
+_SQL_TYPES = {
+    _BOOL: 'INTEGER',
+    _FLOAT: 'REAL',
+    _INT: 'INTEGER',
+}
+_BULK_LOAD_PRAGMAS = (
+    'PRAGMA journal_mode = MEMORY',
+    'PRAGMA synchronous = OFF',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA cache_size = -262144',  # KiB
+    'PRAGMA locking_mode = EXCLUSIVE',
+)
+_DEFAULT_PRAGMAS = (
+    'PRAGMA journal_mode = DELETE',
+    'PRAGMA synchronous = FULL',
+    'PRAGMA locking_mode = NORMAL',
+)
+
+
+class _ExportedDataset:
+    """Private class to describe the tables a dataset is exported to.
+
+    Args:
+        dataset (:class:`~.parser._IMDbDataset`): The dataset being exported.
+        method (:obj:`str`): The name of the :class:`~.parser.PyMDbParser` method that parses the dataset.
+        table (:obj:`str`): The name of the table storing the dataset's scalar columns.
+        children (:obj:`tuple` of (:obj:`str`, :obj:`str`, :obj:`str`)): The table name, list column name,
+            and value column name of each child table storing one of the dataset's list columns.
+        indexes (:obj:`tuple` of (:obj:`str`, :obj:`str`)): The table name and column name of each
+            secondary index, built after the dataset is loaded.
+    """
+
+    __slots__ = 'dataset', 'method', 'table', 'key_columns', 'columns', 'children', 'indexes'
+
+    def __init__(self, dataset, method, table, children=(), indexes=()):
+        self.dataset = dataset
+        self.method = method
+        self.table = table
+        self.key_columns = tuple(name for name, _ in dataset.columns[:dataset.key_size])
+        self.columns = tuple((name, kind) for name, kind in dataset.columns if kind not in (_LIST, _CHARACTERS))
+        self.children = children
+        self.indexes = indexes
+
+    @property
+    def tables(self):
+        return (self.table,) + tuple(table for table, _, _ in self.children)
+
+    def create_statements(self):
+        """Build the statements creating the dataset's tables, without any indexes.
+
+        Returns:
+            :obj:`list` of :obj:`str`: The SQL statements.
+        """
+
+        columns = ', '.join(f'{name} {_SQL_TYPES.get(kind, "TEXT")}' for name, kind in self.columns)
+        statements = [f'CREATE TABLE {self.table} ({columns})']
+        key_columns = ', '.join(f'{name} {_SQL_TYPES.get(kind, "TEXT")}' for name, kind in self.columns
+                                if name in self.key_columns)
+        for table, _, value_column in self.children:
+            statements.append(f'CREATE TABLE {table} ({key_columns}, {value_column} TEXT)')
+        return statements
+
+    def index_statements(self):
+        """Build the statements creating the dataset's indexes.
+
+        Returns:
+            :obj:`list` of :obj:`str`: The SQL statements.
+        """
+
+        key_columns = ', '.join(self.key_columns)
+        statements = [f'CREATE UNIQUE INDEX {self.table}_key ON {self.table} ({key_columns})']
+        for table, _, _ in self.children:
+            statements.append(f'CREATE INDEX {table}_key ON {table} ({key_columns})')
+        for table, column in self.indexes:
+            statements.append(f'CREATE INDEX {table}_{column} ON {table} ({column})')
+        return statements
+
+    def insert_statements(self):
+        """Build the statements inserting a row into each of the dataset's tables.
+
+        Returns:
+            :obj:`list` of :obj:`str`: The SQL statements, starting with the dataset's main table
+                followed by each child table.
+        """
+
+        statements = [f'INSERT INTO {self.table} VALUES ({", ".join("?" * len(self.columns))})']
+        for table, _, _ in self.children:
+            statements.append(f'INSERT INTO {table} VALUES ({", ".join("?" * (len(self.key_columns) + 1))})')
+        return statements
+
+
+_EXPORTED_DATASETS = {exported.dataset.default_filename: exported for exported in (
+    _ExportedDataset(_TITLE_AKAS, 'get_title_akas', 'title_akas', children=(
+        ('title_akas_types', 'types', 'type'),
+        ('title_akas_attributes', 'attributes', 'attribute'),
+    )),
+    _ExportedDataset(_TITLE_BASICS, 'get_title_basics', 'title_basics', children=(
+        ('title_genres', 'genres', 'genre'),
+    ), indexes=(('title_genres', 'genre'),)),
+    _ExportedDataset(_TITLE_CREW, 'get_title_crew', 'title_crew', children=(
+        ('title_directors', 'director_ids', 'name_id'),
+        ('title_writers', 'writer_ids', 'name_id'),
+    ), indexes=(('title_directors', 'name_id'), ('title_writers', 'name_id'))),
+    _ExportedDataset(_TITLE_EPISODE, 'get_title_episodes', 'title_episodes',
+                     indexes=(('title_episodes', 'parent_title_id'),)),
+    _ExportedDataset(_TITLE_PRINCIPALS, 'get_title_principals', 'title_principals', children=(
+        ('title_principals_characters', 'characters', 'character'),
+    ), indexes=(('title_principals', 'name_id'),)),
+    _ExportedDataset(_TITLE_RATINGS, 'get_title_ratings', 'title_ratings'),
+    _ExportedDataset(_NAME_BASICS, 'get_name_basics', 'name_basics', children=(
+        ('name_professions', 'primary_professions', 'profession'),
+        ('name_known_for_titles', 'known_for_titles', 'title_id'),
+    ), indexes=(('name_known_for_titles', 'title_id'),)),
+)}
+
+
+class PyMDbSQLiteExporter:
+    """Exports the datasets provided by IMDb into a normalized SQLite database.
+
+    Each dataset is parsed with a :class:`~.parser.PyMDbParser` and loaded into its own tables in a
+    single transaction using batched inserts, with the database tuned for bulk loading. Indexes are
+    built once each dataset has been loaded. Exporting a dataset again replaces its tables.
+
+    Tables created for each dataset:
+
+    - "`title.akas.tsv`": `title_akas`, `title_akas_types`, `title_akas_attributes`
+    - "`title.basics.tsv`": `title_basics`, `title_genres`
+    - "`title.crew.tsv`": `title_crew`, `title_directors`, `title_writers`
+    - "`title.episode.tsv`": `title_episodes`
+    - "`title.principals.tsv`": `title_principals`, `title_principals_characters`
+    - "`title.ratings.tsv`": `title_ratings`
+    - "`name.basics.tsv`": `name_basics`, `name_professions`, `name_known_for_titles`
+
+    Column names match the member variable names of the dataset's PyMDb object. Child tables store
+    the key columns of their row (`title_id` or `name_id`, plus `ordering` for akas and principals)
+    and one value from the list column.
+
+    Args:
+        db_path (:obj:`str`): The system path to the SQLite database file.
+        parser (:class:`~.parser.PyMDbParser`, optional): The parser used to read the datasets,
+            or `None` to use one with the default settings.
+        batch_size (:obj:`int`, optional): The amount of rows inserted with each `executemany` call.
+    """
+
+    def __init__(self, db_path, parser=None, batch_size=_DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError(f'Invalid batch size: {batch_size}')
+        self._db_path = db_path
+        self._parser = parser if parser is not None else PyMDbParser()
+        self._batch_size = batch_size
+
+    def export(self, path, datasets=None, contains_headers=True, processes=None):
+        """Export datasets provided by IMDb into the database.
+
+        Args:
+            path (:obj:`str` or :obj:`dict`): The system path to the directory containing the dataset files.
+                If the parser is not using default filenames, this is a dictionary of each dataset's default
+                filename to its file path.
+            datasets (:obj:`list` of :obj:`str`, optional): The default filenames of the datasets to export,
+                such as "`title.basics.tsv`", or `None` to export all of them.
+            contains_headers (:obj:`bool`, optional): Determine if the first line of each file is column titles
+                or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse each dataset in
+                parallel, or `None` to parse it in the current process.
+
+        Returns:
+            :obj:`dict`: A dictionary of each exported dataset's default filename to the amount of rows loaded.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If a dataset is unknown.
+        """
+
+        if datasets is None:
+            datasets = list(_EXPORTED_DATASETS.keys())
+        unknown = [dataset for dataset in datasets if dataset not in _EXPORTED_DATASETS]
+        if unknown:
+            raise ValueError(f'Unknown datasets {unknown}, expected some of: {", ".join(_EXPORTED_DATASETS)}')
+
+        counts = {}
+        connection = sqlite3.connect(self._db_path, isolation_level=None)
+        try:
+            for statement in _BULK_LOAD_PRAGMAS:
+                connection.execute(statement)
+            for dataset in datasets:
+                dataset_path = path[dataset] if isinstance(path, dict) else path
+                counts[dataset] = self._export_dataset(connection, _EXPORTED_DATASETS[dataset], dataset_path,
+                                                       contains_headers, processes)
+            connection.execute('ANALYZE')
+            for statement in _DEFAULT_PRAGMAS:
+                connection.execute(statement)
+        finally:
+            connection.close()
+        return counts
+
+    def _export_dataset(self, connection, exported, path, contains_headers, processes):
+        """Private function to load a single dataset into its tables.
+
+        Args:
+            connection (:obj:`sqlite3.Connection`): The connection to the database.
+            exported (:class:`_ExportedDataset`): The dataset being exported.
+            path (:obj:`str`): The system path to the dataset file, or the directory containing it.
+            contains_headers (:obj:`bool`): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`): The amount of worker processes, or `None` to parse serially.
+
+        Returns:
+            :obj:`int`: The amount of rows loaded.
+        """
+
+        columns = [name for name, _ in exported.columns]
+        key_columns = [name for name in columns if name in exported.key_columns]
+        list_columns = [list_column for _, list_column, _ in exported.children]
+        inserts = exported.insert_statements()
+        count = 0
+
+        connection.execute('BEGIN')
+        try:
+            for table in exported.tables:
+                connection.execute(f'DROP TABLE IF EXISTS {table}')
+            for statement in exported.create_statements():
+                connection.execute(statement)
+
+            batches = [[] for _ in inserts]
+            objs = getattr(self._parser, exported.method)(path, contains_headers=contains_headers,
+                                                          processes=processes)
+            for obj in objs:
+                batches[0].append(tuple(getattr(obj, name) for name in columns))
+                if list_columns:
+                    key = tuple(getattr(obj, name) for name in key_columns)
+                    for batch, list_column in zip(batches[1:], list_columns):
+                        values = getattr(obj, list_column)
+                        # Characters that are not written as a list are kept as a single string
+                        if isinstance(values, str):
+                            values = [values]
+                        batch.extend(key + (value,) for value in values)
+                count += 1
+                if len(batches[0]) >= self._batch_size:
+                    self._insert(connection, inserts, batches)
+            self._insert(connection, inserts, batches)
+
+            for statement in exported.index_statements():
+                connection.execute(statement)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        return count
+
+    @staticmethod
+    def _insert(connection, inserts, batches):
+        """Private function to insert and clear batches of rows.
+
+        Args:
+            connection (:obj:`sqlite3.Connection`): The connection to the database.
+            inserts (:obj:`list` of :obj:`str`): The insert statement of each table.
+            batches (:obj:`list` of :obj:`list`): The rows to insert into each table.
+        """
+
+        for statement, batch in zip(inserts, batches):
+            if batch:
+                connection.executemany(statement, batch)
+                batch.clear()
@@ -0,0 +1,453 @@
+"""Module containing the precompiled patterns and extraction rules used to scrape IMDb pages.
+
+Sections of a page made of labeled rows (ex: the technical specifications of a title) are
+described by a registry of :class:`LabelRule` objects for each page, instead of being matched
+by hand within each :class:`~.scraper.PyMDbScraper` method.
+
+The contents within here are not intended to be used outside of the PyMDb package.
+"""
+
+import re
+from pymdb.utils import (
+    get_company_id,
+    get_denomination,
+    is_money_string,
+    remove_tags,
+    split_by_br,
+    trim_money_string,
+)
+
+CAMERA_SEPARATOR_PATTERN = re.compile(r'(and|,)')
+CAST_LIST_END_PATTERN = re.compile(r'</table\s*>')
+CAST_LIST_START_PATTERN = re.compile(r'<table\b[^>]*\bclass="[^"]*\bcast_list\b')
+CAST_ROW_PATTERN = re.compile(r'<tr[\s>]')
+CREDITS_HEADING_PATTERN = re.compile(r'<h4\b[^>]*\bclass="[^"]*\bdataHeaderWithBorder\b')
+DIGITS_PATTERN = re.compile(r'\d+')
+EPISODE_DETAILS_PATTERN = re.compile(r'\(\d+\s*episodes?,\s*\d{4}(-\d{4})?\)')
+EPISODE_NUMBER_PATTERN = re.compile(r'episode\s*\d+')
+FILMOGRAPHY_ROW_PATTERN = re.compile(r'<div\b[^>]*\bclass="[^"]*\bfilmo-row\b')
+HEIGHT_PATTERN = re.compile(r'\(\d+\.*\d*')
+LINK_TAG_PATTERN = re.compile(r'(<\s*a.*?>|<.*?a\s*>)')
+NOTES_PATTERN = re.compile(r'([A-Za-z]+\s*)+')
+PARENTHESES_PATTERN = re.compile(r'\(.*\)')
+PARENTHESES_WRAPPED_PATTERN = re.compile(r'^\(.*\)$')
+PARENTHESIZED_PATTERN = re.compile(r'\(.*?\)')
+PARENTHESIZED_YEAR_PATTERN = re.compile(r'\([\d]{4}\)')
+RATING_SEPARATOR_PATTERN = re.compile(r'(\s|,)*')
+RELEASE_DATE_PATTERN = re.compile(r'\d+?\s*\w+?\s*[\d]{4}')
+RUNTIME_PATTERN = re.compile(r'\d+.*min')
+RUNTIME_PARENTHESIZED_PATTERN = re.compile(r'\(\d+.*min\)')
+RUNTIME_SEPARATOR_PATTERN = re.compile(r'[()\smin]+')
+SEASON_NUMBER_PATTERN = re.compile(r'season\s*\d+')
+SERIES_DATES_PATTERN = re.compile(r'[\d]{4}[-–][\d]{4}')
+SERIES_PATTERN = re.compile(r'series')
+TAG_PATTERN = re.compile(r'<.*?>')
+TD_TAG_PATTERN = re.compile(r'</*td>')
+TITLE_COUNT_PATTERN = re.compile(r'([\d,]+)\s+titles?\b')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+YEAR_RANGE_PATTERN = re.compile(r'(\d|–|-)+')
+YEAR_RANGE_SEPARATOR_PATTERN = re.compile(r'[–\-]+')
+YEAR_SEPARATOR_PATTERN = re.compile(r'[-–]')
+
+
+class LabelRule:
+    """Describes how a field is extracted from a labeled row of an IMDb page.
+
+    Args:
+        label (:obj:`str`): The lowercase text identifying the row's label.
+        field (:obj:`str`): The name of the field the extracted value is stored as.
+        extract (:obj:`callable`): The function called with the row's node, returning the
+            field's value or `None` if the row does not contain it.
+        exact (:obj:`bool`, optional): Determine if the label must equal `label`, instead of containing it.
+    """
+
+    __slots__ = '_label', '_field', '_extract', '_exact'
+
+    def __init__(self, label, field, extract, exact=False):
+        self._label = label
+        self._field = field
+        self._extract = extract
+        self._exact = exact
+
+    @property
+    def label(self):
+        return self._label
+
+    @property
+    def field(self):
+        return self._field
+
+    def matches(self, label):
+        """Determine if the rule applies to a row.
+
+        Args:
+            label (:obj:`str`): The row's lowercase label.
+
+        Returns:
+            :obj:`bool`: If the rule applies to the row.
+        """
+
+        return label == self._label if self._exact else self._label in label
+
+    def extract(self, node):
+        """Extract the rule's field from a row.
+
+        Args:
+            node (:class:`Node`): The row's node.
+
+        Returns:
+            The field's value, or `None` if the row does not contain it.
+        """
+
+        return self._extract(node)
+
+
+_RULES = {}
+
+
+def register_rules(page, rules):
+    """Register the rules used to extract the labeled rows of a page.
+
+    Args:
+        page (:obj:`str`): The name of the page (ex: "`tech_specs`").
+        rules (:obj:`list` of :class:`LabelRule`): The page's rules.
+    """
+
+    _RULES[page] = tuple(rules)
+
+
+def get_rules(page):
+    """Get the rules used to extract the labeled rows of a page.
+
+    Args:
+        page (:obj:`str`): The name of the page.
+
+    Returns:
+        :obj:`tuple` of :class:`LabelRule`: The page's rules.
+
+    Raises:
+        KeyError: If no rules are registered for the page.
+    """
+
+    return _RULES[page]
+
+
+def extract_labeled_fields(page, rows):
+    """Extract the fields from the labeled rows of a page.
+
+    Every rule matching a row's label is applied to it. If several rows give the same field
+    a value, the last one is kept.
+
+    Args:
+        page (:obj:`str`): The name of the page.
+        rows (:obj:`iterable` of (:obj:`str`, :class:`Node`)): The lowercase label and node of each row.
+
+    Returns:
+        :obj:`dict`: A dictionary of each field found to its value.
+    """
+
+    rules = _RULES[page]
+    fields = {}
+    for label, node in rows:
+        for rule in rules:
+            if rule.matches(label):
+                value = rule.extract(node)
+                if value is not None:
+                    fields[rule.field] = value
+    return fields
+
+
+def _collapse_whitespace(text):
+    """Private function to replace each run of whitespace with a single space.
+
+    Args:
+        text (:obj:`str`): The text to collapse.
+
+    Returns:
+        :obj:`str`: The collapsed text, with surrounding whitespace removed.
+    """
+
+    return WHITESPACE_PATTERN.sub(' ', text.strip())
+
+
+def _first_link_text(node):
+    """Private function to get the text of the first link within a node.
+
+    Args:
+        node (:class:`Node`): The node containing the link.
+
+    Returns:
+        :obj:`str`: The link's text, or `None` if the node contains no link.
+    """
+
+    link_node = node.css_first('a')
+    return link_node.text().strip() if link_node else None
+
+
+def _money(node):
+    """Private function to get the trimmed monetary value within a node.
+
+    Args:
+        node (:class:`Node`): The node containing the monetary value.
+
+    Returns:
+        :obj:`str`: The monetary value's digits, or `None` if the node contains no monetary value.
+    """
+
+    text = node.text()
+    return trim_money_string(text) if is_money_string(text) else None
+
+
+def _money_denomination(node):
+    """Private function to get the denomination of the monetary value within a node.
+
+    Args:
+        node (:class:`Node`): The node containing the monetary value.
+
+    Returns:
+        :obj:`str`: The denomination, or `None` if the node contains no monetary value.
+    """
+
+    text = node.text()
+    return get_denomination(text) if is_money_string(text) else None
+
+
+def _release_date(node):
+    """Private function to get the release date within a title's details.
+
+    Args:
+        node (:class:`Node`): The release date's text block.
+
+    Returns:
+        :obj:`str`: The release date, or `None` if none was found.
+    """
+
+    release_date_match = RELEASE_DATE_PATTERN.search(node.text())
+    return release_date_match.group(0) if release_date_match else None
+
+
+def _production_companies(node):
+    """Private function to get the IMDb IDs of the production companies within a title's details.
+
+    Args:
+        node (:class:`Node`): The production companies' text block.
+
+    Returns:
+        :obj:`list` of :obj:`str`: The company IDs.
+    """
+
+    company_ids = (get_company_id(company_node) for company_node in node.css('a'))
+    return [company_id for company_id in company_ids if company_id]
+
+
+def _opening_weekend_date(node):
+    """Private function to get the date of a title's opening weekend.
+
+    Args:
+        node (:class:`Node`): The opening weekend's text block.
+
+    Returns:
+        :obj:`str`: The date, or `None` if none was found.
+    """
+
+    date_node = node.css_first('span')
+    return date_node.text().strip() if date_node else None
+
+
+def _bio_time(node):
+    """Private function to get the date of a birth or death within a person's bio.
+
+    Args:
+        node (:class:`Node`): The row of the birth or death.
+
+    Returns:
+        :obj:`str`: The date, or `None` if none was found.
+    """
+
+    time_node = node.css_first('td > time')
+    if time_node and 'datetime' in time_node.attributes:
+        return time_node.attributes['datetime']
+    return None
+
+
+def _bio_city(node):
+    """Private function to get the city of a birth or death within a person's bio.
+
+    Args:
+        node (:class:`Node`): The row of the birth or death.
+
+    Returns:
+        :obj:`str`: The city, or `None` if none was found.
+    """
+
+    city_node = node.css_first('td > a')
+    return city_node.text().strip() if city_node else None
+
+
+def _bio_value(node):
+    """Private function to get the node holding the value of a row within a person's bio.
+
+    Args:
+        node (:class:`Node`): The row.
+
+    Returns:
+        :class:`Node`: The value's node, or `None` if the row has no value.
+    """
+
+    return node.css_first('td ~ td')
+
+
+def _death_cause(node):
+    """Private function to get the cause of death within a person's bio.
+
+    Args:
+        node (:class:`Node`): The row of the death.
+
+    Returns:
+        :obj:`str`: The cause of death, or `None` if none was found.
+    """
+
+    value_node = _bio_value(node)
+    if value_node:
+        death_cause_match = PARENTHESES_PATTERN.search(value_node.text())
+        if death_cause_match:
+            return death_cause_match.group(0).strip('()')
+    return None
+
+
+def _birth_name(node):
+    """Private function to get the birth name within a person's bio.
+
+    Args:
+        node (:class:`Node`): The row of the birth name.
+
+    Returns:
+        :obj:`str`: The birth name, or `None` if none was found.
+    """
+
+    value_node = _bio_value(node)
+    return value_node.text().strip() if value_node else None
+
+
+def _nicknames(node):
+    """Private function to get the nicknames within a person's bio.
+
+    Args:
+        node (:class:`Node`): The row of the nicknames.
+
+    Returns:
+        :obj:`list` of :obj:`str`: The nicknames, or `None` if none were found.
+    """
+
+    value_node = _bio_value(node)
+    return split_by_br(TD_TAG_PATTERN.sub('', value_node.html).strip()) if value_node else None
+
+
+def _height(node):
+    """Private function to get the height in meters within a person's bio.
+
+    Args:
+        node (:class:`Node`): The row of the height.
+
+    Returns:
+        :obj:`str`: The height, or `None` if none was found.
+    """
+
+    value_node = _bio_value(node)
+    if value_node:
+        height_match = HEIGHT_PATTERN.search(value_node.text().strip())
+        if height_match:
+            return height_match.group(0).strip('(')
+    return None
+
+
+def _runtime(node):
+    """Private function to get the runtime in minutes within a title's technical specifications.
+
+    Args:
+        node (:class:`Node`): The runtime's content.
+
+    Returns:
+        :obj:`str`: The runtime, or `None` if none was found.
+    """
+
+    text = node.text()
+    runtime_pattern = RUNTIME_PARENTHESIZED_PATTERN if '(' in text else RUNTIME_PATTERN
+    runtime_match = runtime_pattern.search(text)
+    return RUNTIME_SEPARATOR_PATTERN.sub('', runtime_match.group(0)) if runtime_match else None
+
+
+def _sound_mix(node):
+    """Private function to get the sound mixes within a title's technical specifications.
+
+    Args:
+        node (:class:`Node`): The sound mixes' content.
+
+    Returns:
+        :obj:`list` of :obj:`str`: The sound mixes.
+    """
+
+    return [sound.strip() for sound in _collapse_whitespace(node.text()).split('|')]
+
+
+def _split_lines(node):
+    """Private function to get each line of a content node split by `<br>` tags.
+
+    Args:
+        node (:class:`Node`): The content.
+
+    Returns:
+        :obj:`list` of :obj:`str`: The lines.
+    """
+
+    return [line.strip() for line in split_by_br(WHITESPACE_PATTERN.sub(' ', remove_tags(node.html, 'td')))]
+
+
+def _camera(node):
+    """Private function to get the cameras within a title's technical specifications.
+
+    Args:
+        node (:class:`Node`): The cameras' content.
+
+    Returns:
+        :obj:`list` of :obj:`str`: The cameras.
+    """
+
+    return [camera.strip() for camera in CAMERA_SEPARATOR_PATTERN.sub('\t', node.text().strip()).split('\t')]
+
+
+register_rules('title_details', (
+    LabelRule('country', 'country', _first_link_text),
+    LabelRule('language', 'language', _first_link_text),
+    LabelRule('release date', 'release_date', _release_date),
+    LabelRule('production co', 'production_companies', _production_companies),
+    LabelRule('budget', 'budget', _money),
+    LabelRule('budget', 'budget_denomination', _money_denomination),
+    LabelRule('opening weekend', 'opening_weekend_gross', _money),
+    LabelRule('opening weekend', 'opening_weekend_date', _opening_weekend_date),
+    LabelRule('gross usa', 'usa_gross', _money),
+    LabelRule('worldwide gross', 'worldwide_gross', _money),
+))
+
+register_rules('name_bio', (
+    LabelRule('born', 'birth_date', _bio_time, exact=True),
+    LabelRule('born', 'birth_city', _bio_city, exact=True),
+    LabelRule('died', 'death_date', _bio_time, exact=True),
+    LabelRule('died', 'death_city', _bio_city, exact=True),
+    LabelRule('died', 'death_cause', _death_cause, exact=True),
+    LabelRule('birth name', 'birth_name', _birth_name, exact=True),
+    LabelRule('nicknames', 'nicknames', _nicknames, exact=True),
+    LabelRule('height', 'height', _height, exact=True),
+))
+
+register_rules('tech_specs', (
+    LabelRule('runtime', 'runtime', _runtime),
+    LabelRule('sound mix', 'sound_mix', _sound_mix),
+    LabelRule('color', 'color', lambda node: _collapse_whitespace(node.text())),
+    LabelRule('aspect', 'aspect_ratio', _split_lines),
+    LabelRule('camera', 'camera', _camera),
+    LabelRule('laboratory', 'laboratory', _split_lines),
+    LabelRule('negative', 'negative_format', lambda node: node.text().strip()),
+    LabelRule('cinematographic', 'cinematographic_process', _split_lines),
+    LabelRule('printed film', 'printed_film_format', lambda node: _collapse_whitespace(node.text())),
+))
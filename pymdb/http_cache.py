@@ -0,0 +1,278 @@
+"""Module containing the ResponseCache class.
+
+The cache stores the pages requested by a :class:`~.scraper.PyMDbScraper`, so repeated
+requests for the same page can be answered without using the network.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+_DEFAULT_TTL = 24 * 60 * 60  # seconds
+_DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+_DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+_DISK_FILENAME = 'responses.sqlite'
+
+
+class CachedResponse:
+    """Class to store a response held by a :class:`ResponseCache`.
+
+    Args:
+        url (:obj:`str`): The requested URL.
+        text (:obj:`str`): The response's body.
+        etag (:obj:`str`): The response's `ETag` header, or `None` if it had none.
+        last_modified (:obj:`str`): The response's `Last-Modified` header, or `None` if it had none.
+        stored_at (:obj:`float`): The UNIX time the response was received or last revalidated.
+    """
+
+    __slots__ = '_url', '_text', '_etag', '_last_modified', '_stored_at'
+
+    def __init__(self, url, text, etag, last_modified, stored_at):
+        self._url = url
+        self._text = text
+        self._etag = etag
+        self._last_modified = last_modified
+        self._stored_at = stored_at
+
+    @property
+    def url(self):
+        return self._url
+
+    @property
+    def text(self):
+        return self._text
+
+    @property
+    def etag(self):
+        return self._etag
+
+    @property
+    def last_modified(self):
+        return self._last_modified
+
+    @property
+    def stored_at(self):
+        return self._stored_at
+
+    @property
+    def size(self):
+        return len(self._text)
+
+    def conditional_headers(self):
+        """Build the headers used to revalidate the response with the server.
+
+        Returns:
+            :obj:`dict`: The `If-None-Match` and `If-Modified-Since` headers, for the validators the response has.
+        """
+
+        headers = {}
+        if self._etag is not None:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified is not None:
+            headers['If-Modified-Since'] = self._last_modified
+        return headers
+
+    def __str__(self):
+        return f'{self.url} ({self.size} characters)'
+
+
+class ResponseCache:
+    """Two tier cache of the responses to GET requests.
+
+    Responses are kept in a memory tier and, if given a directory, in an SQLite database on disk.
+    Both tiers evict their least recently used responses once they hold more than their maximum
+    amount of bytes. A response is fresh for the time to live of the first URL pattern it matches,
+    or the default time to live otherwise. Stale responses with an `ETag` or `Last-Modified` header
+    are revalidated with a conditional request instead of being requested again.
+
+    Args:
+        cache_dir (:obj:`str`, optional): The system path to the directory storing the disk tier,
+            or `None` to only cache responses in memory.
+        ttl (:obj:`float`, optional): The default amount of seconds a response is fresh for.
+        ttls (:obj:`list` of (:obj:`str`, :obj:`float`), optional): A regular expression matched against
+            each URL and the amount of seconds its responses are fresh for (ex: `[(r'/fullcredits', 604800)]`).
+        max_memory_bytes (:obj:`int`, optional): The maximum size of the responses kept in memory,
+            measured by the length of each response's body.
+        max_disk_bytes (:obj:`int`, optional): The maximum size of the compressed responses kept on disk.
+    """
+
+    def __init__(self, cache_dir=None, ttl=_DEFAULT_TTL, ttls=None, max_memory_bytes=_DEFAULT_MAX_MEMORY_BYTES,
+                 max_disk_bytes=_DEFAULT_MAX_DISK_BYTES):
+        self._ttl = ttl
+        self._ttls = [(re.compile(pattern), pattern_ttl) for pattern, pattern_ttl in (ttls or [])]
+        self._max_memory_bytes = max_memory_bytes
+        self._max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._connection = None
+        self._disk_bytes = 0
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._connection = sqlite3.connect(os.path.join(cache_dir, _DISK_FILENAME), check_same_thread=False,
+                                               isolation_level=None)
+            self._connection.execute('PRAGMA journal_mode = WAL')
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, body BLOB, etag TEXT, '
+                'last_modified TEXT, stored_at REAL, accessed_at REAL, size INTEGER)'
+            )
+            self._connection.execute('CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)')
+            self._disk_bytes, = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()
+
+    def get(self, url):
+        """Get the cached response of a URL, whether or not it is fresh.
+
+        Args:
+            url (:obj:`str`): The requested URL.
+
+        Returns:
+            :class:`CachedResponse`: The cached response, or `None` if the URL is not cached.
+        """
+
+        with self._lock:
+            response = self._memory.get(url)
+            if response is not None:
+                self._memory.move_to_end(url)
+                return response
+            if self._connection is None:
+                return None
+            row = self._connection.execute(
+                'SELECT body, etag, last_modified, stored_at FROM responses WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute('UPDATE responses SET accessed_at = ? WHERE url = ?', (time.time(), url))
+            body, etag, last_modified, stored_at = row
+            response = CachedResponse(url, zlib.decompress(body).decode('utf8'), etag, last_modified, stored_at)
+            self._store_memory(response)
+            return response
+
+    def is_fresh(self, response):
+        """Determine if a cached response can be used without revalidating it.
+
+        Args:
+            response (:class:`CachedResponse`): The cached response.
+
+        Returns:
+            :obj:`bool`: If the response is within its time to live.
+        """
+
+        return time.time() - response.stored_at < self._get_ttl(response.url)
+
+    def store(self, url, text, etag=None, last_modified=None):
+        """Store the response of a URL in each tier.
+
+        Args:
+            url (:obj:`str`): The requested URL.
+            text (:obj:`str`): The response's body.
+            etag (:obj:`str`, optional): The response's `ETag` header.
+            last_modified (:obj:`str`, optional): The response's `Last-Modified` header.
+
+        Returns:
+            :class:`CachedResponse`: The cached response.
+        """
+
+        response = CachedResponse(url, text, etag, last_modified, time.time())
+        with self._lock:
+            self._store_memory(response)
+            if self._connection is not None:
+                body = zlib.compress(text.encode('utf8'))
+                previous = self._connection.execute('SELECT size FROM responses WHERE url = ?', (url,)).fetchone()
+                if previous is not None:
+                    self._disk_bytes -= previous[0]
+                self._disk_bytes += len(body)
+                self._connection.execute(
+                    'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (url, body, etag, last_modified, response.stored_at, response.stored_at, len(body))
+                )
+                self._evict_disk()
+        return response
+
+    def refresh(self, response):
+        """Mark a cached response as fresh again after the server confirmed it has not changed.
+
+        Args:
+            response (:class:`CachedResponse`): The revalidated response.
+
+        Returns:
+            :class:`CachedResponse`: The refreshed response.
+        """
+
+        refreshed = CachedResponse(response.url, response.text, response.etag, response.last_modified, time.time())
+        with self._lock:
+            self._store_memory(refreshed)
+            if self._connection is not None:
+                self._connection.execute('UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?',
+                                         (refreshed.stored_at, refreshed.stored_at, refreshed.url))
+        return refreshed
+
+    def clear(self):
+        """Remove every response from each tier."""
+
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._connection is not None:
+                self._connection.execute('DELETE FROM responses')
+                self._disk_bytes = 0
+
+    def close(self):
+        """Close the disk tier's database."""
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __contains__(self, url):
+        return self.get(url) is not None
+
+    def _get_ttl(self, url):
+        """Private function to get the time to live of a URL's responses.
+
+        Args:
+            url (:obj:`str`): The requested URL.
+
+        Returns:
+            :obj:`float`: The amount of seconds a response is fresh for.
+        """
+
+        for pattern, ttl in self._ttls:
+            if pattern.search(url):
+                return ttl
+        return self._ttl
+
+    def _store_memory(self, response):
+        """Private function to store a response in the memory tier, evicting the least recently used ones.
+
+        Args:
+            response (:class:`CachedResponse`): The response to store.
+        """
+
+        previous = self._memory.pop(response.url, None)
+        if previous is not None:
+            self._memory_bytes -= previous.size
+        if response.size > self._max_memory_bytes:
+            return
+        self._memory[response.url] = response
+        self._memory_bytes += response.size
+        while self._memory_bytes > self._max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.size
+
+    def _evict_disk(self):
+        """Private function to remove the least recently used responses from disk once it is over its size."""
+
+        if self._disk_bytes <= self._max_disk_bytes:
+            return
+        removed = []
+        for url, size in self._connection.execute('SELECT url, size FROM responses ORDER BY accessed_at'):
+            if self._disk_bytes <= self._max_disk_bytes:
+                break
+            removed.append((url,))
+            self._disk_bytes -= size
+        self._connection.executemany('DELETE FROM responses WHERE url = ?', removed)
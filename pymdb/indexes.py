@@ -0,0 +1,645 @@
+"""Module containing the PyMDbIndex and PyMDbGroupedIndex classes.
+
+Indexes are built from a dataset file provided by IMDb and persisted next to it, so
+rows can be parsed by their IMDb ID without scanning the whole dataset.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from pymdb.parser import (
+    _DATASETS,
+    _NAME_BASICS,
+    _TITLE_AKAS,
+    _TITLE_BASICS,
+    _TITLE_CREW,
+    _TITLE_EPISODE,
+    _TITLE_PRINCIPALS,
+    _TITLE_RATINGS,
+    _split_line
+)
+
+_MAGIC = b'PYMDBI01'
+_HEADER = struct.Struct('<8sQ')
+_VERSION = 1
+_ALIGNMENT = 8
+_SORT_CHUNK_SIZE = 1 << 20  # keys
+
+_ID_PREFIXES = {
+    _NAME_BASICS.default_filename: 'nm',
+    _TITLE_BASICS.default_filename: 'tt',
+    _TITLE_CREW.default_filename: 'tt',
+    _TITLE_EPISODE.default_filename: 'tt',
+    _TITLE_RATINGS.default_filename: 'tt',
+}
+
+# The columns rows are grouped by, as (column name, ID prefix, stored as contiguous ranges)
+_GROUPED_COLUMNS = {
+    _TITLE_AKAS.default_filename: (('title_id', 'tt', True),),
+    _TITLE_EPISODE.default_filename: (('parent_title_id', 'tt', False),),
+    _TITLE_PRINCIPALS.default_filename: (('title_id', 'tt', True), ('name_id', 'nm', False)),
+}
+
+
+def _id_to_key(imdb_id, prefix):
+    """Private function to convert an IMDb ID into the integer key used within an index.
+
+    Args:
+        imdb_id (:obj:`str`): The IMDb ID, such as `tt0076759`.
+        prefix (:obj:`str`): The expected IMDb ID prefix (`nm` or `tt`).
+
+    Returns:
+        :obj:`int`: The numeric part of the ID, or `None` if the ID is invalid.
+    """
+
+    if imdb_id is None or not imdb_id.startswith(prefix) or not imdb_id[len(prefix):].isdigit():
+        return None
+    return int(imdb_id[len(prefix):])
+
+
+def _line_has_id(line, index, imdb_id):
+    """Private function to check if a column of a dataset line holds an IMDb ID.
+
+    Keys drop the leading zeros of an ID, so IDs that only differ in their zero padding, such as
+    `tt76759` and `tt0076759`, share a key and the ID stored in the line has to be compared as well.
+
+    Args:
+        line (:obj:`bytes`): The line.
+        index (:obj:`int`): The index of the column holding the ID.
+        imdb_id (:obj:`str`): The IMDb ID.
+
+    Returns:
+        :obj:`bool`: If the column holds the exact ID.
+    """
+
+    values = line.rstrip(b'\r\n').split(b'\t', index + 1)
+    return index < len(values) and values[index] == imdb_id.encode('utf8')
+
+
+def _get_dataset(path, dataset):
+    """Private function to find the dataset a file belongs to.
+
+    Args:
+        path (:obj:`str`): The system path to the dataset file.
+        dataset (:obj:`str`): The default filename of the dataset, or `None` to use the file's name.
+
+    Returns:
+        :class:`~.parser._IMDbDataset`: The dataset.
+
+    Raises:
+        ValueError: If the dataset could not be determined.
+    """
+
+    if dataset is None:
+        dataset = os.path.basename(path)
+    if dataset not in _DATASETS:
+        raise ValueError(f'Unknown dataset {dataset}, expected one of: {", ".join(_DATASETS)}')
+    return _DATASETS[dataset]
+
+
+def _source_key(path):
+    """Private function to build the key identifying the version of a dataset file.
+
+    Args:
+        path (:obj:`str`): The system path to the dataset file.
+
+    Returns:
+        :obj:`dict`: The file's size and modification time.
+    """
+
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+
+
+def _write_index_file(path, metadata, arrays):
+    """Private function to write the metadata and arrays of an index to a file.
+
+    The file is written to a temporary path first and then moved into place.
+
+    Args:
+        path (:obj:`str`): The system path of the index file.
+        metadata (:obj:`dict`): The JSON serializable metadata of the index.
+        arrays (:obj:`dict` of :obj:`str`): A dictionary of names to the :obj:`array.array` objects to store.
+    """
+
+    segments = {}
+    offset = 0
+    for name, values in arrays.items():
+        offset += -offset % _ALIGNMENT
+        length = len(values) * values.itemsize
+        segments[name] = [offset, length, values.typecode]
+        offset += length
+    metadata = dict(metadata, version=_VERSION, arrays=segments)
+    header = json.dumps(metadata).encode('utf8')
+    data_start = _HEADER.size + len(header)
+    data_start += -data_start % _ALIGNMENT
+
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, mode='wb') as f:
+        f.write(_HEADER.pack(_MAGIC, len(header)))
+        f.write(header)
+        for name, values in arrays.items():
+            f.write(bytes(data_start + segments[name][0] - f.tell()))
+            values.tofile(f)
+    os.replace(tmp_path, path)
+
+
+def _read_index_file(path):
+    """Private function to read the metadata of an index file and memory-map its arrays.
+
+    Args:
+        path (:obj:`str`): The system path of the index file.
+
+    Returns:
+        (:obj:`dict`, :obj:`dict`): The index's metadata and a dictionary of names to
+            :obj:`memoryview` objects of each stored array.
+
+    Raises:
+        ValueError: If the file is not a valid index file.
+    """
+
+    with open(path, mode='rb') as f:
+        magic, length = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f'Invalid index file: {path}')
+        metadata = json.loads(f.read(length).decode('utf8'))
+        if metadata.get('version') != _VERSION:
+            raise ValueError(f'Unsupported index file version: {path}')
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    data_start = _HEADER.size + length
+    data_start += -data_start % _ALIGNMENT
+    view = memoryview(buffer)
+    arrays = {}
+    for name, (offset, length, typecode) in metadata['arrays'].items():
+        offset += data_start
+        arrays[name] = view[offset:offset + length].cast(typecode)
+    return metadata, arrays
+
+
+def _sort_by_key(keys, *values):
+    """Private function to sort arrays of keys and their values by key.
+
+    The sort is stable, so values with equal keys keep their order within the dataset file.
+    Each key is packed with its position into a single integer, and the packed keys are sorted
+    in chunks that are then merged, so only one chunk is ever held as a list of integers.
+
+    Args:
+        keys (:obj:`array.array`): The keys.
+        *values (:obj:`array.array`): The arrays of values, in the same order as the keys.
+
+    Returns:
+        :obj:`tuple` of :obj:`array.array`: The sorted keys followed by each sorted array of values.
+    """
+
+    position_bits = max(len(keys) - 1, 0).bit_length()
+    if keys and max(keys) >> (64 - position_bits):
+        # The keys are too large to pack alongside their positions
+        order = array('Q', sorted(range(len(keys)), key=keys.__getitem__))
+    else:
+        packed = array('Q', (key << position_bits | i for i, key in enumerate(keys)))
+        chunks = [array('Q', sorted(packed[start:start + _SORT_CHUNK_SIZE]))
+                  for start in range(0, len(packed), _SORT_CHUNK_SIZE)]
+        del packed
+        position_mask = (1 << position_bits) - 1
+        merged = merge(*chunks) if len(chunks) != 1 else chunks[0]
+        order = array('Q', (key & position_mask for key in merged))
+    return tuple(array(column.typecode, (column[i] for i in order)) for column in (keys,) + values)
+
+
+def _scan_offsets(path, contains_headers):
+    """Private generator to find the byte offset of each line in a dataset file.
+
+    Args:
+        path (:obj:`str`): The system path to the uncompressed dataset file.
+        contains_headers (:obj:`bool`): Determine if the first line is column titles or a data row.
+
+    Yields:
+        (:obj:`int`, :obj:`bytes`): The byte offset and contents of each line.
+    """
+
+    with open(path, mode='rb') as f:
+        if contains_headers:
+            f.readline()
+        offset = f.tell()
+        for line in f:
+            yield offset, line
+            offset += len(line)
+
+
+class _DatasetIndex:
+    """Private base class of the indexes built from a dataset file.
+
+    Handles reading rows from the dataset file and loading, building, and persisting
+    the index's arrays. Subclasses implement `_build`.
+
+    Args:
+        path (:obj:`str`): The system path to the uncompressed dataset file.
+        dataset (:class:`~.parser._IMDbDataset`): The dataset the file belongs to.
+        contains_headers (:obj:`bool`): Determine if the first line is column titles or a data row.
+        index_path (:obj:`str`): The system path to the index file.
+        index_type (:obj:`str`): The type of index, stored to tell index files apart.
+    """
+
+    def __init__(self, path, dataset, contains_headers, index_path, index_type):
+        self._path = path
+        self._dataset = dataset
+        self._contains_headers = contains_headers
+        self._index_path = index_path
+        self._index_type = index_type
+        self._lock = threading.Lock()
+        self._file = None
+        self._arrays = self._load()
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def index_path(self):
+        return self._index_path
+
+    def close(self):
+        """Close the dataset file used to read rows."""
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _build_row(self, line):
+        """Private function to build the dataset's PyMDb object from a line of the dataset file.
+
+        Args:
+            line (:obj:`bytes`): The line.
+
+        Returns:
+            The dataset's PyMDb object.
+
+        Raises:
+            InvalidParseFormat: If the line has an incorrect column size.
+        """
+
+        return self._dataset.build(_split_line(line.decode('utf8'), self._dataset))
+
+    def _read(self, offset, size=None):
+        """Private function to read from a byte offset of the dataset file.
+
+        Args:
+            offset (:obj:`int`): The byte offset to start reading from.
+            size (:obj:`int`, optional): The amount of bytes to read, or `None` to read a single line.
+
+        Returns:
+            :obj:`bytes`: The bytes read.
+        """
+
+        with self._lock:
+            if self._file is None:
+                self._file = open(self._path, mode='rb')
+            self._file.seek(offset)
+            return self._file.readline() if size is None else self._file.read(size)
+
+    def _load(self):
+        """Private function to load the persisted index, building it if it is missing or outdated.
+
+        Returns:
+            :obj:`dict`: A dictionary of names to :obj:`memoryview` objects of each of the index's arrays.
+        """
+
+        metadata = {
+            'type': self._index_type,
+            'dataset': self._dataset.default_filename,
+            'contains_headers': self._contains_headers,
+            'source': _source_key(self._path)
+        }
+        if os.path.exists(self._index_path):
+            try:
+                stored_metadata, arrays = _read_index_file(self._index_path)
+                if all(stored_metadata.get(name) == value for name, value in metadata.items()):
+                    return arrays
+            except (OSError, ValueError):
+                pass
+        arrays = self._build()
+        _write_index_file(self._index_path, metadata, arrays)
+        return {name: memoryview(values) for name, values in arrays.items()}
+
+    def _build(self):
+        """Private function to build the index by scanning the dataset file.
+
+        Returns:
+            :obj:`dict`: A dictionary of names to the :obj:`array.array` objects of the index.
+        """
+
+        raise NotImplementedError()
+
+
+class PyMDbIndex(_DatasetIndex):
+    """On-disk primary key index of a dataset provided by IMDb.
+
+    Maps each title ID or name ID within the dataset to the byte offset of its row, stored in
+    sorted order so lookups use a binary search over the memory-mapped index. The index is built the
+    first time it is used and persisted next to the dataset file, then reused until the dataset changes.
+    Supported datasets contain a single row per ID: "`title.basics.tsv`", "`title.crew.tsv`",
+    "`title.episode.tsv`", "`title.ratings.tsv`", and "`name.basics.tsv`".
+
+    Args:
+        path (:obj:`str`): The system path to the uncompressed dataset file.
+        dataset (:obj:`str`, optional): The default filename of the dataset provided by IMDb, or `None` if the
+            file uses its default filename.
+        contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+        index_path (:obj:`str`, optional): The system path to the index file, or `None` to store it next to the
+            dataset file with an "`.idx`" extension.
+
+    Raises:
+        ValueError: If the dataset is not supported or the file is gzipped.
+    """
+
+    def __init__(self, path, dataset=None, contains_headers=True, index_path=None):
+        if path.endswith('.gz'):
+            raise ValueError('Indexes require an uncompressed dataset file')
+        dataset = _get_dataset(path, dataset)
+        if dataset.default_filename not in _ID_PREFIXES:
+            raise ValueError(f'Cannot build a primary key index for {dataset.default_filename}')
+        self._prefix = _ID_PREFIXES[dataset.default_filename]
+        super().__init__(path, dataset, contains_headers, index_path or f'{path}.idx', 'primary')
+        self._keys = self._arrays['keys']
+        self._offsets = self._arrays['offsets']
+
+    def get(self, imdb_id):
+        """Get the row of a single IMDb ID.
+
+        Args:
+            imdb_id (:obj:`str`): The title's or person's ID used by IMDb prefixed with `tt` or `nm`.
+
+        Returns:
+            The dataset's PyMDb object for the ID, such as a :class:`~.models.title.TitleBasics`,
+            or `None` if the ID is not in the dataset.
+
+        Raises:
+            InvalidParseFormat: If the row has an incorrect column size.
+        """
+
+        line = self._find(imdb_id)
+        return self._build_row(line) if line is not None else None
+
+    def get_many(self, imdb_ids):
+        """Get the rows of multiple IMDb IDs.
+
+        Rows are read in the order they are stored within the dataset file.
+
+        Args:
+            imdb_ids (:obj:`iterable` of :obj:`str`): The titles' or persons' IDs used by IMDb.
+
+        Returns:
+            :obj:`dict`: A dictionary of each ID found within the dataset to its PyMDb object.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+        """
+
+        found = sorted((offset, imdb_id) for imdb_id in set(imdb_ids) for offset in self._find_offsets(imdb_id))
+        lines = [(imdb_id, self._read(offset)) for offset, imdb_id in found]
+        return {imdb_id: self._build_row(line) for imdb_id, line in lines if _line_has_id(line, 0, imdb_id)}
+
+    def __contains__(self, imdb_id):
+        return self._find(imdb_id) is not None
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _find(self, imdb_id):
+        """Private function to read the row of an IMDb ID.
+
+        Args:
+            imdb_id (:obj:`str`): The IMDb ID.
+
+        Returns:
+            :obj:`bytes`: The row's line, or `None` if the ID is not in the dataset.
+        """
+
+        for offset in self._find_offsets(imdb_id):
+            line = self._read(offset)
+            if _line_has_id(line, 0, imdb_id):
+                return line
+        return None
+
+    def _find_offsets(self, imdb_id):
+        """Private function to find the byte offsets of the rows sharing an IMDb ID's key.
+
+        Args:
+            imdb_id (:obj:`str`): The IMDb ID.
+
+        Returns:
+            :obj:`list` of :obj:`int`: The byte offset of each row whose ID has the same key, which includes
+                IDs that only differ in their zero padding.
+        """
+
+        key = _id_to_key(imdb_id, self._prefix)
+        if key is None:
+            return []
+        return [self._offsets[i] for i in range(bisect_left(self._keys, key), bisect_right(self._keys, key))]
+
+    def _build(self):
+        keys = array('Q')
+        offsets = array('Q')
+        prefix = self._prefix
+        for offset, line in _scan_offsets(self._path, self._contains_headers):
+            key = _id_to_key(line[:line.find(b'\t')].decode('utf8'), prefix)
+            if key is not None:
+                keys.append(key)
+                offsets.append(offset)
+        # IMDb sorts its datasets by ID, so sorting is only needed for modified files
+        if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+            keys, offsets = _sort_by_key(keys, offsets)
+        return {'keys': keys, 'offsets': offsets}
+
+
+class PyMDbGroupedIndex(_DatasetIndex):
+    """On-disk secondary index of a dataset provided by IMDb with many rows per ID.
+
+    Supports "`title.akas.tsv`" and "`title.principals.tsv`" grouped by `title_id`, "`title.principals.tsv`"
+    grouped by `name_id`, and "`title.episode.tsv`" grouped by `parent_title_id`. Since IMDb sorts its datasets
+    by title ID, `title_id` groups are stored as the byte range of their contiguous rows. Other columns
+    are stored as inverted posting lists of each row's byte offset. The index is built the first time it
+    is used and persisted next to the dataset file, then reused until the dataset changes.
+
+    Args:
+        path (:obj:`str`): The system path to the uncompressed dataset file.
+        dataset (:obj:`str`, optional): The default filename of the dataset provided by IMDb, or `None` if the
+            file uses its default filename.
+        contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+        index_path (:obj:`str`, optional): The system path to the index file, or `None` to store it next to the
+            dataset file with a "`.groups.idx`" extension.
+
+    Raises:
+        ValueError: If the dataset is not supported or the file is gzipped.
+    """
+
+    def __init__(self, path, dataset=None, contains_headers=True, index_path=None):
+        if path.endswith('.gz'):
+            raise ValueError('Indexes require an uncompressed dataset file')
+        dataset = _get_dataset(path, dataset)
+        if dataset.default_filename not in _GROUPED_COLUMNS:
+            raise ValueError(f'Cannot build a grouped index for {dataset.default_filename}')
+        self._grouped_columns = _GROUPED_COLUMNS[dataset.default_filename]
+        super().__init__(path, dataset, contains_headers, index_path or f'{path}.groups.idx', 'grouped')
+
+    @property
+    def columns(self):
+        return [name for name, _, _ in self._grouped_columns]
+
+    def get(self, imdb_id, column=None):
+        """Get every row of a single IMDb ID.
+
+        Args:
+            imdb_id (:obj:`str`): The title's or person's ID used by IMDb prefixed with `tt` or `nm`.
+            column (:obj:`str`, optional): The name of the column to match the ID against, or `None` to use
+                the first grouped column of the dataset (`title_id`, or `parent_title_id` for "`title.episode.tsv`").
+
+        Returns:
+            :obj:`list`: The dataset's PyMDb objects for the ID in the order they are stored within the dataset
+                file, such as :class:`~.models.title.TitleAkas` objects. The list is empty if the ID is not
+                in the dataset.
+
+        Raises:
+            ValueError: If the column is not grouped by this index.
+            InvalidParseFormat: If a row has an incorrect column size.
+        """
+
+        return self.get_many([imdb_id], column=column).get(imdb_id, [])
+
+    def get_many(self, imdb_ids, column=None):
+        """Get every row of multiple IMDb IDs.
+
+        Args:
+            imdb_ids (:obj:`iterable` of :obj:`str`): The titles' or persons' IDs used by IMDb.
+            column (:obj:`str`, optional): The name of the column to match the IDs against, or `None` to use
+                the first grouped column of the dataset.
+
+        Returns:
+            :obj:`dict`: A dictionary of each ID found within the dataset to a :obj:`list` of its PyMDb objects.
+
+        Raises:
+            ValueError: If the column is not grouped by this index.
+            InvalidParseFormat: If a row has an incorrect column size.
+        """
+
+        name, prefix, is_range = self._grouped_column(column)
+        index = [column_name for column_name, _ in self._dataset.columns].index(name)
+        found = {}
+        for imdb_id in set(imdb_ids):
+            key = _id_to_key(imdb_id, prefix)
+            if key is not None:
+                lines = self._read_range_lines(name, key) if is_range else self._read_posting_lines(name, key)
+                lines = [line for line in lines if _line_has_id(line, index, imdb_id)]
+                if lines:
+                    found[imdb_id] = [self._build_row(line) for line in lines]
+        return found
+
+    def _grouped_column(self, column):
+        """Private function to find a grouped column by its name.
+
+        Args:
+            column (:obj:`str`): The column's name, or `None` for the first grouped column.
+
+        Returns:
+            (:obj:`str`, :obj:`str`, :obj:`bool`): The column's name, ID prefix, and if it is stored as ranges.
+
+        Raises:
+            ValueError: If the column is not grouped by this index.
+        """
+
+        if column is None:
+            return self._grouped_columns[0]
+        for grouped_column in self._grouped_columns:
+            if grouped_column[0] == column:
+                return grouped_column
+        raise ValueError(f'Column {column} is not grouped, expected one of: {", ".join(self.columns)}')
+
+    def _read_range_lines(self, name, key):
+        """Private function to read the lines of a key stored as contiguous byte ranges.
+
+        Args:
+            name (:obj:`str`): The name of the grouped column.
+            key (:obj:`int`): The key.
+
+        Returns:
+            :obj:`list` of :obj:`bytes`: The key's lines.
+        """
+
+        keys = self._arrays[f'{name}.keys']
+        starts = self._arrays[f'{name}.starts']
+        ends = self._arrays[f'{name}.ends']
+        lines = []
+        for i in range(bisect_left(keys, key), bisect_right(keys, key)):
+            lines.extend(self._read(starts[i], ends[i] - starts[i]).splitlines())
+        return lines
+
+    def _read_posting_lines(self, name, key):
+        """Private function to read the lines of a key stored as a posting list.
+
+        Args:
+            name (:obj:`str`): The name of the grouped column.
+            key (:obj:`int`): The key.
+
+        Returns:
+            :obj:`list` of :obj:`bytes`: The key's lines.
+        """
+
+        keys = self._arrays[f'{name}.keys']
+        i = bisect_left(keys, key)
+        if i == len(keys) or keys[i] != key:
+            return []
+        pointers = self._arrays[f'{name}.pointers']
+        offsets = self._arrays[f'{name}.offsets']
+        return [self._read(offsets[j]) for j in range(pointers[i], pointers[i + 1])]
+
+    def _build(self):
+        positions = [
+            (i, name, prefix, is_range)
+            for i, (name, _) in enumerate(self._dataset.columns)
+            for grouped_name, prefix, is_range in self._grouped_columns if grouped_name == name
+        ]
+        groups = {name: (array('Q'), array('Q'), array('Q')) for _, name, _, _ in positions}
+        for offset, line in _scan_offsets(self._path, self._contains_headers):
+            values = line.rstrip(b'\r\n').split(b'\t')
+            for i, name, prefix, is_range in positions:
+                key = _id_to_key(values[i].decode('utf8'), prefix) if i < len(values) else None
+                if key is None:
+                    continue
+                keys, starts, ends = groups[name]
+                if is_range and keys and keys[-1] == key and ends[-1] == offset:
+                    ends[-1] = offset + len(line)
+                else:
+                    keys.append(key)
+                    starts.append(offset)
+                    ends.append(offset + len(line))
+
+        arrays = {}
+        for _, name, _, is_range in positions:
+            keys, starts, ends = groups[name]
+            if is_range:
+                if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+                    keys, starts, ends = _sort_by_key(keys, starts, ends)
+                arrays.update({f'{name}.keys': keys, f'{name}.starts': starts, f'{name}.ends': ends})
+            else:
+                keys, offsets = _sort_by_key(keys, starts)
+                unique_keys = array('Q')
+                pointers = array('Q')
+                for i, key in enumerate(keys):
+                    if not unique_keys or unique_keys[-1] != key:
+                        unique_keys.append(key)
+                        pointers.append(i)
+                pointers.append(len(keys))
+                arrays.update({f'{name}.keys': unique_keys, f'{name}.pointers': pointers, f'{name}.offsets': offsets})
+        return arrays
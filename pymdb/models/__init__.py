@@ -1,3 +1,5 @@
+from .batch import *
+from .change import *
 from .company import *
 from .name import *
 from .search import *
@@ -0,0 +1,109 @@
+"""The classes used to represent batches of rows from the datasets provided by IMDb,
+and the results of scraping batches of IMDb web pages.
+
+Batches store a dataset's rows column by column instead of as one object per row.
+Numeric and boolean columns are typed :obj:`array.array` objects, which support the buffer
+protocol, so they can be wrapped without copying by libraries such as NumPy
+(ex: `numpy.frombuffer(batch['start_year'], dtype='int64')`).
+"""
+
+
+class DatasetBatch:
+    """Class to store a batch of rows from an IMDb dataset as columns.
+
+    Column names match the member variable names of the dataset's row class, for example
+    `start_year` for :class:`~.models.title.TitleBasics`. String columns are lists containing
+    `None` for missing values, and list columns (ex: `genres`) are lists of lists or `None`.
+    Numeric and boolean columns are arrays where missing values are stored as `0` and marked
+    in the column's mask.
+
+    Args:
+        columns (:obj:`dict` of :obj:`str`): A dictionary of each column's name to its values.
+        masks (:obj:`dict` of :obj:`str`): A dictionary of each numeric or boolean column's name to
+            an :obj:`array.array` of typecode `B`, where `1` marks a missing value in that row.
+    """
+
+    __slots__ = '_columns', '_masks', '_size'
+
+    def __init__(self, columns, masks):
+        self._columns = columns
+        self._masks = masks
+        self._size = len(next(iter(columns.values()))) if columns else 0
+
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def masks(self):
+        return self._masks
+
+    @property
+    def column_names(self):
+        return list(self._columns.keys())
+
+    def mask(self, column):
+        """Gets the missing value mask of a column.
+
+        Args:
+            column (:obj:`str`): The column's name.
+
+        Returns:
+            :obj:`array.array`: The column's mask, or `None` if the column is not numeric or boolean.
+        """
+
+        return self._masks.get(column)
+
+    def __getitem__(self, column):
+        return self._columns[column]
+
+    def __contains__(self, column):
+        return column in self._columns
+
+    def __len__(self):
+        return self._size
+
+    def __str__(self):
+        return f'{self._size} rows: {", ".join(self._columns.keys())}'
+
+
+class ScrapeResult:
+    """Class to store the outcome of scraping a single IMDb ID within a batch.
+
+    Args:
+        imdb_id (:obj:`str`): The title's, person's, or company's ID used by IMDb.
+        value: The scraped PyMDb object, or `None` if scraping failed.
+        error (:obj:`Exception`): The exception raised while scraping, or `None` if scraping succeeded.
+        url (:obj:`str`, optional): The URL of the scraped page, if scraping a page that was already downloaded.
+    """
+
+    __slots__ = '_imdb_id', '_value', '_error', '_url'
+
+    def __init__(self, imdb_id, value, error, url=None):
+        self._imdb_id = imdb_id
+        self._value = value
+        self._error = error
+        self._url = url
+
+    @property
+    def imdb_id(self):
+        return self._imdb_id
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def error(self):
+        return self._error
+
+    @property
+    def url(self):
+        return self._url
+
+    @property
+    def succeeded(self):
+        return self._error is None
+
+    def __str__(self):
+        return f'{self.imdb_id}: {self.value if self.succeeded else f"failed ({self.error})"}'
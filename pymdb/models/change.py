@@ -0,0 +1,45 @@
+"""The classes used to represent differences between two snapshots of the datasets provided by IMDb."""
+
+
+class DatasetChange:
+    """Class to store a single row that differs between two snapshots of an IMDb dataset.
+
+    Args:
+        change_type (:obj:`str`): The type of change, one of `added`, `removed`, or `changed`.
+        key (:obj:`tuple`): The values of the row's key columns, such as `('tt0076759',)`, or
+            `('tt0076759', 1)` for datasets keyed by a title ID and `ordering`.
+        old: The dataset's PyMDb object for the row in the old snapshot, or `None` if the row was added
+            or the old snapshot is only known by its row hashes.
+        new: The dataset's PyMDb object for the row in the new snapshot, or `None` if the row was removed.
+    """
+
+    ADDED = 'added'
+    REMOVED = 'removed'
+    CHANGED = 'changed'
+
+    __slots__ = '_change_type', '_key', '_old', '_new'
+
+    def __init__(self, change_type, key, old, new):
+        self._change_type = change_type
+        self._key = key
+        self._old = old
+        self._new = new
+
+    @property
+    def change_type(self):
+        return self._change_type
+
+    @property
+    def key(self):
+        return self._key
+
+    @property
+    def old(self):
+        return self._old
+
+    @property
+    def new(self):
+        return self._new
+
+    def __str__(self):
+        return f'{self.change_type}: {", ".join(str(value) for value in self.key)}'
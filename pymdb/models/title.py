@@ -12,6 +12,13 @@ from ..utils import (
     to_datetime
 )
 
+# The fields of a LazyTitleScrape that are scraped when accessed
+_LAZY_TITLE_FIELDS = (
+    'display_title', 'title_parent_id', 'mpaa_rating', 'country', 'language', 'release_date', 'end_year',
+    'season_number', 'episode_number', 'taglines', 'plot', 'storyline', 'production_companies', 'top_cast',
+    'budget', 'budget_denomination', 'opening_weekend_gross', 'opening_weekend_date', 'usa_gross', 'worldwide_gross',
+)
+
 
 class TitleAkas:
     """Class to store the row information from IMDb's "`title.akas.tsv`" dataset.
@@ -433,6 +440,79 @@ class TitleRating:
         return f'{self.title_id}: Rated {self.average_rating} with {self.num_votes} votes'
 
 
+class TitleRecord:
+    """Class to store the rows of multiple IMDb title datasets joined by their title ID.
+
+    Each dataset not included in the join, or without a row for the title, is left as
+    `None` (or an empty list for datasets with many rows per title).
+
+    Args:
+        title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+        basics (:class:`TitleBasics`, optional): The title's row from "`title.basics.tsv`".
+        rating (:class:`TitleRating`, optional): The title's row from "`title.ratings.tsv`".
+        crew (:class:`TitleCrew`, optional): The title's row from "`title.crew.tsv`".
+        episode (:class:`TitleEpisode`, optional): The title's row from "`title.episode.tsv`".
+        akas (:obj:`list` of :class:`TitleAkas`, optional): The title's rows from "`title.akas.tsv`".
+        principals (:obj:`list` of :class:`TitlePrincipalCrew`, optional): The title's rows
+            from "`title.principals.tsv`".
+    """
+
+    __slots__ = '_title_id', '_basics', '_rating', '_crew', '_episode', '_akas', '_principals'
+
+    def __init__(self, title_id, basics=None, rating=None, crew=None, episode=None, akas=None, principals=None):
+        self._title_id = title_id
+        self._basics = basics
+        self._rating = rating
+        self._crew = crew
+        self._episode = episode
+        self._akas = []
+        self._principals = []
+
+        self.akas = akas
+        self.principals = principals
+
+    @property
+    def title_id(self):
+        return self._title_id
+
+    @property
+    def basics(self):
+        return self._basics
+
+    @property
+    def rating(self):
+        return self._rating
+
+    @property
+    def crew(self):
+        return self._crew
+
+    @property
+    def episode(self):
+        return self._episode
+
+    @property
+    def akas(self):
+        return self._akas
+
+    @akas.setter
+    def akas(self, value):
+        if value is not None:
+            self._akas = value
+
+    @property
+    def principals(self):
+        return self._principals
+
+    @principals.setter
+    def principals(self, value):
+        if value is not None:
+            self._principals = value
+
+    def __str__(self):
+        return f'{self.title_id}{f": {self.basics.primary_title}" if self.basics is not None else ""}'
+
+
 class TitleScrape:
     """Object to represent detailed information for a title on its IMDb web page.
 
@@ -643,6 +723,113 @@ class TitleScrape:
                f'{self.opening_weekend_date}. USA total: ${self.usa_gross}, World total: ${self.worldwide_gross}'
 
 
+def _lazy_title_property(field):
+    """Private function to build a property of a :class:`LazyTitleScrape` that scrapes its section on first access.
+
+    Args:
+        field (:obj:`str`): The name of the :class:`TitleScrape` property.
+
+    Returns:
+        :obj:`property`: The property, with a setter if the :class:`TitleScrape` property has one.
+    """
+
+    title_property = getattr(TitleScrape, field)
+
+    def get_field(self):
+        self._load(field)
+        return title_property.fget(self)
+
+    def set_field(self, value):
+        self._loaded.add(field)
+        title_property.fset(self, value)
+
+    return property(get_field, set_field if title_property.fset is not None else None)
+
+
+class LazyTitleScrape(TitleScrape):
+    """Object to represent detailed information for a title on its IMDb web page, scraped as it is accessed.
+
+    Each section of the title's page is only scraped the first time one of its fields is accessed,
+    and every field of that section is then kept. The page's HTML tree is kept until every field
+    has been accessed. Setting a field replaces it without scraping its section.
+
+    Args:
+        title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+        extract_fields (:obj:`callable`): The function called with the name of an accessed field,
+            returning a :obj:`dict` of every field scraped from the same section of the page.
+    """
+
+    __slots__ = '_extract_fields', '_loaded'
+
+    def __init__(self, title_id, extract_fields):
+        self._extract_fields = extract_fields
+        self._loaded = set()
+        super().__init__(
+            title_id=title_id, display_title=None, title_parent_id=None, mpaa_rating=None, country=None,
+            language=None, release_date=None, end_year=None, season_number=None, episode_number=None,
+            taglines=None, plot=None, storyline=None, production_companies=None, top_cast=None, budget=None,
+            budget_denomination=None, opening_weekend_gross=None, opening_weekend_date=None, usa_gross=None,
+            worldwide_gross=None
+        )
+        # The setters called by TitleScrape did not set any field
+        self._loaded.clear()
+
+    display_title = _lazy_title_property('display_title')
+    title_parent_id = _lazy_title_property('title_parent_id')
+    mpaa_rating = _lazy_title_property('mpaa_rating')
+    country = _lazy_title_property('country')
+    language = _lazy_title_property('language')
+    release_date = _lazy_title_property('release_date')
+    end_year = _lazy_title_property('end_year')
+    season_number = _lazy_title_property('season_number')
+    episode_number = _lazy_title_property('episode_number')
+    taglines = _lazy_title_property('taglines')
+    plot = _lazy_title_property('plot')
+    storyline = _lazy_title_property('storyline')
+    production_companies = _lazy_title_property('production_companies')
+    top_cast = _lazy_title_property('top_cast')
+    budget = _lazy_title_property('budget')
+    budget_denomination = _lazy_title_property('budget_denomination')
+    opening_weekend_gross = _lazy_title_property('opening_weekend_gross')
+    opening_weekend_date = _lazy_title_property('opening_weekend_date')
+    usa_gross = _lazy_title_property('usa_gross')
+    worldwide_gross = _lazy_title_property('worldwide_gross')
+
+    def is_loaded(self, field):
+        """Determine if a field has been scraped or set.
+
+        Args:
+            field (:obj:`str`): The name of the field.
+
+        Returns:
+            :obj:`bool`: If the field's value is available without scraping.
+        """
+
+        return field == 'title_id' or field in self._loaded
+
+    def _load(self, field):
+        """Private function to scrape the section of the page containing a field, if it was not scraped yet.
+
+        Args:
+            field (:obj:`str`): The name of the accessed field.
+        """
+
+        if field in self._loaded:
+            return
+        for name, value in self._extract_fields(field).items():
+            if name not in self._loaded:
+                self._loaded.add(name)
+                title_property = getattr(TitleScrape, name)
+                if title_property.fset is not None:
+                    title_property.fset(self, value)
+                else:
+                    setattr(self, f'_{name}', value)
+        self._loaded.add(field)
+        if len(self._loaded) == len(_LAZY_TITLE_FIELDS):
+            # Release the page once every field is scraped
+            self._extract_fields = None
+
+
 class TitleTechSpecsScrape:
     """Object to represent information for a title's technical specifications.
 
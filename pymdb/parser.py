@@ -1,10 +1,27 @@
 """Module containing the PyMDbParser class."""
 
+import gzip
+import hashlib
+import heapq
+import os
 import re
+from array import array
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from pymdb.cache import DatasetCache
 from pymdb.utils import (
     append_filename_to_path,
     gunzip_file,
-    preprocess_list
+    preprocess_list,
+    to_bool
+)
+from pymdb.models.batch import (
+    DatasetBatch
+)
+from pymdb.models.change import (
+    DatasetChange
 )
 from pymdb.models.name import (
     NameBasics
@@ -15,33 +32,763 @@ from pymdb.models.title import (
     TitleCrew,
     TitleEpisode,
     TitlePrincipalCrew,
-    TitleRating
+    TitleRating,
+    TitleRecord
 )
 from pymdb.exceptions import InvalidParseFormat
 
 
+_STR = 'str'
+_INT = 'int'
+_FLOAT = 'float'
+_BOOL = 'bool'
+_LIST = 'list'
+_CHARACTERS = 'characters'
+
+_ARRAY_TYPECODES = {
+    _INT: 'q',
+    _FLOAT: 'd',
+    _BOOL: 'b',
+}
+
+_DEFAULT_BATCH_SIZE = 10000
+_ROW_HASH_SIZE = 16  # bytes
+
+
+def _split_characters(characters):
+    """Private function to split the JSON-like list of characters in "`title.principals.tsv`".
+
+    Args:
+        characters (:obj:`str`): The characters column, such as `["character1","character2"]`.
+
+    Returns:
+        :obj:`list` of :obj:`str`: The characters, or the original value if it is not a list.
+    """
+
+    if characters is not None and len(characters) > 0 and characters[0] == '[' and characters[-1] == ']':
+        return [result.group(0).replace('"', '') for result in re.finditer(r'".+?"', characters)]
+    return characters
+
+
+def _to_number(value, kind):
+    """Private function to convert a raw column value into a number or boolean.
+
+    Args:
+        value (:obj:`str`): The raw column value.
+        kind (:obj:`str`): The column's kind, one of `_INT`, `_FLOAT`, or `_BOOL`.
+
+    Returns:
+        The converted value.
+
+    Raises:
+        ValueError: If the value could not be converted.
+    """
+
+    if kind == _INT:
+        return int(value)
+    elif kind == _FLOAT:
+        return float(value)
+    return to_bool(value)
+
+
+def _build_column(values, kind):
+    """Private function to build a batch column from a column's raw values.
+
+    Args:
+        values (:obj:`tuple` of :obj:`str`): The raw values of the column, with `None` for missing values.
+        kind (:obj:`str`): The column's kind.
+
+    Returns:
+        (:obj:`list` or :obj:`array.array`, :obj:`array.array`): The column and its missing value mask,
+            where the mask is `None` for string and list columns.
+    """
+
+    if kind == _STR:
+        return list(values), None
+    elif kind == _LIST:
+        return [value.split(',') if value is not None else None for value in values], None
+    elif kind == _CHARACTERS:
+        return [_split_characters(value) for value in values], None
+
+    typecode = _ARRAY_TYPECODES[kind]
+    if kind != _BOOL and None not in values:
+        # Fast path for columns without missing values
+        try:
+            return array(typecode, map(int if kind == _INT else float, values)), array('B', bytes(len(values)))
+        except ValueError:
+            pass
+    column = array(typecode)
+    mask = array('B')
+    for value in values:
+        if value is not None:
+            try:
+                column.append(_to_number(value, kind))
+                mask.append(0)
+                continue
+            except ValueError:
+                pass
+        column.append(0)
+        mask.append(1)
+    return column, mask
+
+
+def _build_batch(rows, dataset, indices=None):
+    """Private function to build a `DatasetBatch` from preprocessed rows.
+
+    Args:
+        rows (:obj:`list` of :obj:`list` of :obj:`str`): The preprocessed rows.
+        dataset (:class:`_IMDbDataset`): The dataset the rows belong to.
+        indices (:obj:`tuple` of :obj:`int`, optional): The indices of the columns to build,
+            or `None` to build every column.
+
+    Returns:
+        :class:`~.models.batch.DatasetBatch`: The rows stored as columns.
+    """
+
+    if indices is None:
+        indices = range(dataset.column_count)
+    columns = {}
+    masks = {}
+    for index in indices:
+        name, kind = dataset.columns[index]
+        columns[name], mask = _build_column(tuple(row[index] for row in rows), kind)
+        if mask is not None:
+            masks[name] = mask
+    return DatasetBatch(columns, masks)
+
+
+def _convert_value(value, kind):
+    """Private function to convert a single raw column value the same way its PyMDb object would.
+
+    Args:
+        value (:obj:`str`): The raw column value, or `None` if missing.
+        kind (:obj:`str`): The column's kind.
+
+    Returns:
+        The converted value, or `None` if the value is missing or could not be converted.
+    """
+
+    if kind == _STR:
+        return value
+    elif kind == _BOOL:
+        return to_bool(value)
+    elif value is None:
+        return None
+    elif kind == _LIST:
+        return value.split(',')
+    elif kind == _CHARACTERS:
+        return _split_characters(value)
+    try:
+        return _to_number(value, kind)
+    except ValueError:
+        return None
+
+
+def _to_typed_row(row, numeric_columns):
+    """Private function to convert the numeric and boolean columns of a preprocessed row.
+
+    Args:
+        row (:obj:`list` of :obj:`str`): The preprocessed row.
+        numeric_columns (:obj:`list` of (:obj:`int`, :obj:`str`)): The index and kind of each
+            numeric and boolean column.
+
+    Returns:
+        :obj:`list`: The row, with `None` for any numeric value that is missing or could not be converted.
+    """
+
+    for index, kind in numeric_columns:
+        value = row[index]
+        if value is not None:
+            try:
+                row[index] = _to_number(value, kind)
+            except ValueError:
+                row[index] = None
+    return row
+
+
+def _build_title_akas(row):
+    """Private function to build a `TitleAkas` object from a preprocessed row."""
+
+    title_id, ordering, title, region, language, types, attributes, is_original_title = row
+    if types is not None:
+        types = [typ for typ in types.split(',')]
+    if attributes is not None:
+        attributes = [a for a in attributes.split(',')]
+    return TitleAkas(title_id, ordering, title, region, language, types, attributes, is_original_title)
+
+
+def _build_title_basics(row):
+    """Private function to build a `TitleBasics` object from a preprocessed row."""
+
+    title_id, title_type, primary_title, original_title, is_adult, start_year, end_year, runtime, genres = row
+    if genres is not None:
+        genres = [genre for genre in genres.split(',')]
+    return TitleBasics(title_id, title_type, primary_title, original_title, is_adult, start_year, end_year,
+                       runtime, genres)
+
+
+def _build_title_crew(row):
+    """Private function to build a `TitleCrew` object from a preprocessed row."""
+
+    title_id, director_ids, writer_ids = row
+    if director_ids is not None:
+        director_ids = [director_id for director_id in director_ids.split(',')]
+    if writer_ids is not None:
+        writer_ids = [writer_id for writer_id in writer_ids.split(',')]
+    return TitleCrew(title_id, director_ids, writer_ids)
+
+
+def _build_title_episode(row):
+    """Private function to build a `TitleEpisode` object from a preprocessed row."""
+
+    title_id, parent_title_id, season_number, episode_number = row
+    return TitleEpisode(title_id, parent_title_id, season_number, episode_number)
+
+
+def _build_title_principals(row):
+    """Private function to build a `TitlePrincipalCrew` object from a preprocessed row."""
+
+    title_id, ordering, name_id, category, job, characters = row
+    return TitlePrincipalCrew(title_id, ordering, name_id, category, job, _split_characters(characters))
+
+
+def _build_title_ratings(row):
+    """Private function to build a `TitleRating` object from a preprocessed row."""
+
+    title_id, average_rating, num_votes = row
+    return TitleRating(title_id, average_rating, num_votes)
+
+
+def _build_name_basics(row):
+    """Private function to build a `NameBasics` object from a preprocessed row."""
+
+    name_id, primary_name, birth_year, death_year, primary_professions, known_for_titles = row
+    if primary_professions is not None:
+        primary_professions = [profession.strip() for profession in primary_professions.split(',')]
+    if known_for_titles is not None:
+        known_for_titles = [title.strip() for title in known_for_titles.split(',')]
+    return NameBasics(name_id, primary_name, birth_year, death_year, primary_professions, known_for_titles)
+
+
+def _build_typed_title_akas(row):
+    """Private function to build a `TitleAkas` object from a typed row.
+
+    Typed rows, such as those read from a dataset cache, already have their numeric columns converted,
+    so their values are assigned directly instead of being converted again by the object's setters.
+    """
+
+    aka = object.__new__(TitleAkas)
+    aka._title_id, ordering, aka._localized_title, aka._region, aka._language, types, attributes, \
+        is_original_title = row
+    aka._ordering = ordering
+    aka._types = types.split(',') if types is not None else []
+    aka._attributes = attributes.split(',') if attributes is not None else []
+    aka._is_original_title = bool(is_original_title)
+    return aka
+
+
+def _build_typed_title_basics(row):
+    """Private function to build a `TitleBasics` object from a typed row."""
+
+    title = object.__new__(TitleBasics)
+    title._title_id, title._title_type, title._primary_title, title._original_title, is_adult, \
+        title._start_year, title._end_year, title._runtime, genres = row
+    title._is_adult = bool(is_adult)
+    title._genres = genres.split(',') if genres is not None else []
+    return title
+
+
+def _build_typed_title_crew(row):
+    """Private function to build a `TitleCrew` object from a typed row."""
+
+    crew = object.__new__(TitleCrew)
+    crew._title_id, director_ids, writer_ids = row
+    crew._director_ids = director_ids.split(',') if director_ids is not None else []
+    crew._writer_ids = writer_ids.split(',') if writer_ids is not None else []
+    return crew
+
+
+def _build_typed_title_episode(row):
+    """Private function to build a `TitleEpisode` object from a typed row."""
+
+    episode = object.__new__(TitleEpisode)
+    episode._title_id, episode._parent_title_id, episode._season_number, episode._episode_number = row
+    return episode
+
+
+def _build_typed_title_principals(row):
+    """Private function to build a `TitlePrincipalCrew` object from a typed row."""
+
+    principal = object.__new__(TitlePrincipalCrew)
+    principal._title_id, principal._ordering, principal._name_id, principal._category, principal._job, \
+        characters = row
+    characters = _split_characters(characters)
+    principal._characters = characters if characters is not None else []
+    return principal
+
+
+def _build_typed_title_ratings(row):
+    """Private function to build a `TitleRating` object from a typed row."""
+
+    rating = object.__new__(TitleRating)
+    rating._title_id, rating._average_rating, rating._num_votes = row
+    return rating
+
+
+def _build_typed_name_basics(row):
+    """Private function to build a `NameBasics` object from a typed row."""
+
+    name = object.__new__(NameBasics)
+    name._name_id, name._primary_name, name._birth_year, name._death_year, primary_professions, \
+        known_for_titles = row
+    name._primary_professions = [profession.strip() for profession in primary_professions.split(',')] \
+        if primary_professions is not None else []
+    name._known_for_titles = [title.strip() for title in known_for_titles.split(',')] \
+        if known_for_titles is not None else []
+    return name
+
+
 class _IMDbDataset:
-    """Private class to match dataset files with column counts.
-    
+    """Private class to match dataset files with their columns.
+
     Args:
         default_filename (:obj:`str`): The default filename for the dataset provided by IMDb.
-        column_count (:obj:`int`): The amount of columns in the dataset.
+        columns (:obj:`tuple` of (:obj:`str`, :obj:`str`)): The name and kind of each column in the dataset,
+            where the name matches the member variable of the dataset's PyMDb object.
+        build (:obj:`callable`): Function that builds the dataset's PyMDb object from a preprocessed row.
+        build_typed (:obj:`callable`): Function that builds the dataset's PyMDb object from a typed row.
+        key_size (:obj:`int`, optional): The amount of leading columns that uniquely identify a row.
     """
 
-    __slots__ = 'default_filename', 'column_count'
+    __slots__ = 'default_filename', 'columns', 'column_count', 'build', 'build_typed', 'key_size', \
+        'numeric_columns', 'storage_columns'
 
-    def __init__(self, default_filename, column_count):
+    def __init__(self, default_filename, columns, build, build_typed, key_size=1):
         self.default_filename = default_filename
-        self.column_count = column_count
+        self.columns = columns
+        self.column_count = len(columns)
+        self.build = build
+        self.build_typed = build_typed
+        self.key_size = key_size
+        self.numeric_columns = [(i, kind) for i, (_, kind) in enumerate(columns) if kind in _ARRAY_TYPECODES]
+        self.storage_columns = tuple((name, _ARRAY_TYPECODES.get(kind)) for name, kind in columns)
+
+
+_TITLE_AKAS = _IMDbDataset('title.akas.tsv', (
+    ('title_id', _STR), ('ordering', _INT), ('localized_title', _STR), ('region', _STR), ('language', _STR),
+    ('types', _LIST), ('attributes', _LIST), ('is_original_title', _BOOL)
+), _build_title_akas, _build_typed_title_akas, key_size=2)
+_TITLE_BASICS = _IMDbDataset('title.basics.tsv', (
+    ('title_id', _STR), ('title_type', _STR), ('primary_title', _STR), ('original_title', _STR),
+    ('is_adult', _BOOL), ('start_year', _INT), ('end_year', _INT), ('runtime', _INT), ('genres', _LIST)
+), _build_title_basics, _build_typed_title_basics)
+_TITLE_CREW = _IMDbDataset('title.crew.tsv', (
+    ('title_id', _STR), ('director_ids', _LIST), ('writer_ids', _LIST)
+), _build_title_crew, _build_typed_title_crew)
+_TITLE_EPISODE = _IMDbDataset('title.episode.tsv', (
+    ('title_id', _STR), ('parent_title_id', _STR), ('season_number', _INT), ('episode_number', _INT)
+), _build_title_episode, _build_typed_title_episode)
+_TITLE_PRINCIPALS = _IMDbDataset('title.principals.tsv', (
+    ('title_id', _STR), ('ordering', _INT), ('name_id', _STR), ('category', _STR), ('job', _STR),
+    ('characters', _CHARACTERS)
+), _build_title_principals, _build_typed_title_principals, key_size=2)
+_TITLE_RATINGS = _IMDbDataset('title.ratings.tsv', (
+    ('title_id', _STR), ('average_rating', _FLOAT), ('num_votes', _INT)
+), _build_title_ratings, _build_typed_title_ratings)
+_NAME_BASICS = _IMDbDataset('name.basics.tsv', (
+    ('name_id', _STR), ('primary_name', _STR), ('birth_year', _INT), ('death_year', _INT),
+    ('primary_professions', _LIST), ('known_for_titles', _LIST)
+), _build_name_basics, _build_typed_name_basics)
+
+
+_DATASETS = {
+    dataset.default_filename: dataset for dataset in (
+        _TITLE_AKAS, _TITLE_BASICS, _TITLE_CREW, _TITLE_EPISODE, _TITLE_PRINCIPALS, _TITLE_RATINGS, _NAME_BASICS
+    )
+}
+
+
+# The datasets that can be joined into a `TitleRecord`, as (dataset, has many rows per title)
+_JOINED_DATASETS = {
+    'akas': (_TITLE_AKAS, True),
+    'basics': (_TITLE_BASICS, False),
+    'crew': (_TITLE_CREW, False),
+    'episode': (_TITLE_EPISODE, False),
+    'principals': (_TITLE_PRINCIPALS, True),
+    'rating': (_TITLE_RATINGS, False),
+}
+_DEFAULT_JOINED_DATASETS = ('basics', 'rating', 'crew', 'episode')
+
+
+def _keyed_groups(name, objs, many):
+    """Private generator to key the PyMDb objects of a dataset sorted by title ID.
+
+    Args:
+        name (:obj:`str`): The name of the dataset within a `TitleRecord`.
+        objs (:obj:`iterable`): The dataset's PyMDb objects, sorted by title ID.
+        many (:obj:`bool`): Determine if consecutive objects with the same title ID are grouped into a list.
+
+    Yields:
+        (:obj:`str`, :obj:`str`, object): The title ID, the name of the dataset, and the
+            PyMDb object or :obj:`list` of PyMDb objects for the title.
+
+    Raises:
+        ValueError: If the dataset is not sorted by title ID, or a title ID repeats when not grouping.
+    """
+
+    previous = None
+    for title_id, group in groupby(objs, key=attrgetter('title_id')):
+        if previous is not None and title_id <= previous:
+            raise ValueError(f'Cannot join {name}, the dataset is not sorted by title ID at {title_id}')
+        previous = title_id
+        if many:
+            yield title_id, name, list(group)
+        else:
+            obj = next(group)
+            if next(group, None) is not None:
+                raise ValueError(f'Cannot join {name}, the dataset has more than one row for title ID {title_id}')
+            yield title_id, name, obj
+
+
+def _split_line(line, dataset):
+    """Private function to split and preprocess a single line of a dataset.
+
+    Args:
+        line (:obj:`str`): The line read from the dataset file.
+        dataset (:class:`_IMDbDataset`): The dataset the line belongs to.
+
+    Returns:
+        :obj:`list` of :obj:`str`: The preprocessed columns of the line.
+
+    Raises:
+        InvalidParseFormat: If the line has an incorrect column size.
+    """
+
+    line = line.strip().split('\t')
+    if len(line) != dataset.column_count:
+        raise InvalidParseFormat()
+    return preprocess_list(line)
+
+
+def _row_key(values, key_size):
+    """Private function to get the key of a row, converting `ordering` to an :obj:`int` for datasets that use it.
+
+    Args:
+        values (:obj:`list` of :obj:`str`): The row's values, starting with its key columns.
+        key_size (:obj:`int`): The amount of leading columns that uniquely identify a row.
+
+    Returns:
+        :obj:`tuple`: The key.
+
+    Raises:
+        InvalidParseFormat: If the key's `ordering` is not an integer.
+    """
+
+    if key_size == 1:
+        return values[0],
+    try:
+        return values[0], int(values[1])
+    except (TypeError, ValueError):
+        raise InvalidParseFormat()
+
+
+def _keyed_rows(rows, key_size):
+    """Private generator to key each row of a dataset sorted by its key columns.
+
+    Args:
+        rows (:obj:`iterable` of :obj:`list`): The preprocessed rows.
+        key_size (:obj:`int`): The amount of leading columns that uniquely identify a row.
+
+    Yields:
+        (:obj:`tuple`, :obj:`list`): The key and values of each row.
+
+    Raises:
+        ValueError: If the rows are not sorted by their key.
+    """
+
+    previous = None
+    for row in rows:
+        key = _row_key(row, key_size)
+        if previous is not None and key <= previous:
+            raise ValueError(f'Dataset is not sorted by its key at {key}')
+        previous = key
+        yield key, row
+
 
+def _hash_row(row):
+    """Private function to hash the values of a preprocessed row.
+
+    Args:
+        row (:obj:`list` of :obj:`str`): The preprocessed row.
+
+    Returns:
+        :obj:`str`: The row's hash as a hex string.
+    """
+
+    line = '\t'.join('\\N' if value is None else value for value in row)
+    return hashlib.blake2b(line.encode('utf8'), digest_size=_ROW_HASH_SIZE).hexdigest()
+
+
+def _read_row_hashes(path, key_size):
+    """Private generator to read the row hashes saved from a snapshot of a dataset.
+
+    Args:
+        path (:obj:`str`): The system path to the row hashes file.
+        key_size (:obj:`int`): The amount of leading columns that uniquely identify a row.
+
+    Yields:
+        (:obj:`tuple`, :obj:`str`): The key and hash of each row.
+    """
+
+    with open(path, mode='r', encoding='utf8') as f:
+        for line in f:
+            values = line.rstrip('\n').split('\t')
+            yield _row_key(values, key_size), values[-1]
+
+
+def _write_row_hashes(path, rows):
+    """Private generator to save the hash of each row to a file while passing the rows through.
+
+    The file is only replaced once every row has been read.
+
+    Args:
+        path (:obj:`str`): The system path to the row hashes file.
+        rows (:obj:`iterable`): The key, values, and hash of each row.
+
+    Yields:
+        Each row, unchanged.
+    """
+
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    completed = False
+    try:
+        with open(tmp_path, mode='w', encoding='utf8') as f:
+            for row in rows:
+                key, _, row_hash = row
+                f.write('\t'.join(str(value) for value in key) + f'\t{row_hash}\n')
+                yield row
+        os.replace(tmp_path, path)
+        completed = True
+    finally:
+        if not completed and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class _Selection:
+    """Private class to store the column projection and row filters used while parsing a dataset.
+
+    Rows are filtered on their raw values, converting only the columns used by a filter,
+    before any list splitting or object construction happens for the rest of the row.
+
+    Args:
+        dataset (:class:`_IMDbDataset`): The dataset being parsed.
+        columns (:obj:`list` of :obj:`str`, optional): The names of the columns to keep, or `None` to keep all.
+        where (:obj:`dict`, optional): A dictionary of column names to either a value the column must be
+            equal to, or a function given the column's value that returns if the row should be kept.
+
+    Raises:
+        ValueError: If a column name does not exist within the dataset.
+    """
 
-_TITLE_AKAS = _IMDbDataset('title.akas.tsv', 8)
-_TITLE_BASICS = _IMDbDataset('title.basics.tsv', 9)
-_TITLE_CREW = _IMDbDataset('title.crew.tsv', 3)
-_TITLE_EPISODE = _IMDbDataset('title.episode.tsv', 4)
-_TITLE_PRINCIPALS = _IMDbDataset('title.principals.tsv', 6)
-_TITLE_RATINGS = _IMDbDataset('title.ratings.tsv', 3)
-_NAME_BASICS = _IMDbDataset('name.basics.tsv', 6)
+    __slots__ = 'indices', 'conditions'
+
+    def __init__(self, dataset, columns=None, where=None):
+        names = [name for name, _ in dataset.columns]
+        for column in list(columns or []) + list(where or {}):
+            if column not in names:
+                raise ValueError(f'Unknown column {column} for {dataset.default_filename}')
+        self.indices = tuple(names.index(column) for column in columns) if columns is not None else None
+        self.conditions = tuple(
+            (names.index(column), dataset.columns[names.index(column)][1], condition)
+            for column, condition in (where or {}).items()
+        )
+
+    def select(self, rows, project=True):
+        """Filters the rows and sets the value of every column not being kept to `None`.
+
+        Args:
+            rows (:obj:`iterable` of :obj:`list` of :obj:`str`): The preprocessed rows.
+            project (:obj:`bool`, optional): Determine if the columns not being kept are set to `None`.
+
+        Yields:
+            :obj:`list` of :obj:`str`: Each row that matches every filter.
+        """
+
+        conditions = self.conditions
+        indices = self.indices if project else None
+        for row in rows:
+            keep = True
+            for index, kind, condition in conditions:
+                value = _convert_value(row[index], kind)
+                if not (condition(value) if callable(condition) else value == condition):
+                    keep = False
+                    break
+            if keep:
+                if indices is not None:
+                    projected = [None] * len(row)
+                    for index in indices:
+                        projected[index] = row[index]
+                    row = projected
+                yield row
+
+
+_RANGES_PER_PROCESS = 4
+_MAX_RANGE_SIZE = 64 * 1024 * 1024  # bytes
+
+
+def _split_ranges(path, range_count):
+    """Private function to split a file into byte ranges.
+
+    The ranges are not aligned to line boundaries here, each worker aligns its own
+    range with :func:`_parse_range` so a line belongs to the range its first byte is in.
+
+    Args:
+        path (:obj:`str`): The system path to the file.
+        range_count (:obj:`int`): The minimum amount of ranges to split the file into.
+
+    Returns:
+        :obj:`list` of (:obj:`int`, :obj:`int`): The start and end offset of each range.
+    """
+
+    size = os.path.getsize(path)
+    range_count = max(range_count, -(-size // _MAX_RANGE_SIZE), 1)
+    range_size = max(-(-size // range_count), 1)
+    return [(start, min(start + range_size, size)) for start in range(0, size, range_size)]
+
+
+def _parse_range(path, start, end, dataset, contains_headers, batch_size=None, selection=None):
+    """Private function to parse every row that starts within a byte range of a dataset.
+
+    Used as the worker function of :obj:`~.parser.PyMDbParser`'s parallel parsing, so it
+    must stay at the module level to be picklable.
+
+    Args:
+        path (:obj:`str`): The system path to the uncompressed dataset file.
+        start (:obj:`int`): The offset of the first byte in the range.
+        end (:obj:`int`): The offset after the last byte in the range.
+        dataset (:class:`_IMDbDataset`): The dataset being parsed.
+        contains_headers (:obj:`bool`): Determine if the first line is column titles or a data row.
+        batch_size (:obj:`int`, optional): The amount of rows in each :class:`~.models.batch.DatasetBatch`,
+            or `None` to build a PyMDb object for each row.
+        selection (:class:`_Selection`, optional): The column projection and row filters, if any.
+
+    Returns:
+        :obj:`list`: The PyMDb object built by the dataset for each row in the range, or the
+            :class:`~.models.batch.DatasetBatch` objects for the range if `batch_size` is given.
+
+    Raises:
+        InvalidParseFormat: If a row has an incorrect column size.
+    """
+
+    rows = _read_range_rows(path, start, end, dataset, contains_headers)
+    if batch_size is None:
+        if selection is not None:
+            rows = selection.select(rows)
+        build = dataset.build
+        return [build(row) for row in rows]
+    return list(_batch_rows(rows, dataset, batch_size, selection))
+
+
+def _read_range_rows(path, start, end, dataset, contains_headers):
+    """Private generator to split and preprocess every row that starts within a byte range.
+
+    Args:
+        path (:obj:`str`): The system path to the uncompressed dataset file.
+        start (:obj:`int`): The offset of the first byte in the range.
+        end (:obj:`int`): The offset after the last byte in the range.
+        dataset (:class:`_IMDbDataset`): The dataset being read.
+        contains_headers (:obj:`bool`): Determine if the first line is column titles or a data row.
+
+    Yields:
+        :obj:`list` of :obj:`str`: The preprocessed columns of each row.
+
+    Raises:
+        InvalidParseFormat: If a row has an incorrect column size.
+    """
+
+    with open(path, mode='rb') as f:
+        if start > 0:
+            # Skip the partial line owned by the previous range
+            f.seek(start - 1)
+            if f.read(1) != b'\n':
+                f.readline()
+        elif contains_headers:
+            f.readline()
+        position = f.tell()
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            yield _split_line(line.decode('utf8'), dataset)
+
+
+def _batch_rows(rows, dataset, batch_size, selection=None):
+    """Private generator to group preprocessed rows into `DatasetBatch` objects.
+
+    Args:
+        rows (:obj:`iterable` of :obj:`list` of :obj:`str`): The preprocessed rows.
+        dataset (:class:`_IMDbDataset`): The dataset the rows belong to.
+        batch_size (:obj:`int`): The maximum amount of rows in each batch.
+        selection (:class:`_Selection`, optional): The column projection and row filters, if any.
+
+    Yields:
+        :class:`~.models.batch.DatasetBatch`: A batch of at most `batch_size` rows.
+    """
+
+    indices = None
+    if selection is not None:
+        rows = selection.select(rows, project=False)
+        indices = selection.indices
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield _build_batch(batch, dataset, indices)
+            batch = []
+    if batch:
+        yield _build_batch(batch, dataset, indices)
+
+
+def _cached_batches(cache, dataset, batch_size, selection=None):
+    """Private generator to build `DatasetBatch` objects directly from a dataset's cache.
+
+    Numeric columns and masks are memory-mapped views of the cache, and only the string
+    columns included in the batches are decoded. Batches do not span the cache's blocks,
+    so some batches may hold fewer than `batch_size` rows.
+
+    Args:
+        cache (:class:`~.cache.DatasetCache`): The dataset's valid cache.
+        dataset (:class:`_IMDbDataset`): The dataset being read.
+        batch_size (:obj:`int`): The maximum amount of rows in each batch.
+        selection (:class:`_Selection`, optional): The column projection, if any. Row filters are not supported.
+
+    Yields:
+        :class:`~.models.batch.DatasetBatch`: A batch of at most `batch_size` rows.
+    """
+
+    indices = range(dataset.column_count)
+    if selection is not None and selection.indices is not None:
+        indices = selection.indices
+    columns = [dataset.columns[index] for index in indices]
+    for row_count, values, masks in cache.read_blocks([name for name, _ in columns]):
+        for name, kind in columns:
+            if kind not in _ARRAY_TYPECODES:
+                strings = values[name]()
+                mask = masks[name]
+                values[name] = [
+                    None if missing else value for value, missing in zip(strings, mask)
+                ] if any(mask) else strings
+                if kind == _LIST:
+                    values[name] = [value.split(',') if value is not None else None for value in values[name]]
+                elif kind == _CHARACTERS:
+                    values[name] = [_split_characters(value) for value in values[name]]
+        for start in range(0, row_count, batch_size):
+            end = start + batch_size
+            yield DatasetBatch(
+                {name: values[name][start:end] for name, _ in columns},
+                {name: masks[name][start:end] for name, kind in columns if kind in _ARRAY_TYPECODES}
+            )
 
 
 class PyMDbParser:
@@ -54,272 +801,786 @@ class PyMDbParser:
             the names provided by IMDb.
         gunzip_files (:obj:`bool`, optional): Determine if the files are gzipped or not.
         delete_gzip_files (:obj:`bool`, optional): Determine if gzip files should be deleted after being gunzipped.
+        stream_gzip_files (:obj:`bool`, optional): Determine if gzipped files should be read through a decompressing
+            stream instead of being gunzipped to disk first. Only used when `gunzip_files` is `True`. When
+            `delete_gzip_files` is also `True`, a gzip file is deleted once it has been read in full.
+        cache_dir (:obj:`str`, optional): The system path to a directory to store a binary
+            :class:`~.cache.DatasetCache` of each dataset in, or `None` to not cache datasets. A dataset is
+            cached the first time it is read in full without worker processes, and later parses of the same
+            unchanged file read the memory-mapped cache instead.
     """
 
-    def __init__(self, use_default_filenames=True, gunzip_files=False, delete_gzip_files=False):
+    def __init__(self, use_default_filenames=True, gunzip_files=False, delete_gzip_files=False,
+                 stream_gzip_files=False, cache_dir=None):
         self._use_default_filenames = use_default_filenames
         self._gunzip_files = gunzip_files
         self._delete_gzip_files = delete_gzip_files
+        self._stream_gzip_files = stream_gzip_files
+        self._cache_dir = cache_dir
 
-    def get_title_akas(self, path, contains_headers=True):
+    def get_title_akas(self, path, contains_headers=True, processes=None, ordered=True, columns=None, where=None):
         """Parse the "`title.akas.tsv`" dataset provided by IMDb.
 
         Args:
             path (:obj:`str`): The system path to the dataset file. If not using
                 default filenames, this string will include the dataset file.
             contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if rows parsed in parallel are yielded in the same order as
+                the dataset. Otherwise each batch of rows is yielded as soon as it has been parsed.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the member variables to parse, or `None`
+                to parse all of them. Every other member variable is left empty.
+            where (:obj:`dict`, optional): A dictionary of member variable names to either a value it must be
+                equal to, or a function given its value that returns if the row should be kept. Rows are
+                filtered before the rest of the row is parsed.
 
         Yields:
             A :class:`~.models.title.TitleAkas` object for each row in the dataset.
 
         Raises:
             InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
         """
 
-        path = self._build_path(path, _TITLE_AKAS.default_filename)
-
-        with open(path, mode='r', encoding='utf8') as f:
-            is_first_line = contains_headers
-            for line in f:
-                if is_first_line:
-                    is_first_line = False
-                else:
-                    line = line.strip().split('\t')
-                    if len(line) == _TITLE_AKAS.column_count:
-                        line = preprocess_list(line)
-                        title_id, ordering, title, region, language, types, attributes, is_original_title = line
-                        if types is not None:
-                            types = [typ for typ in types.split(',')]
-                        if attributes is not None:
-                            attributes = [a for a in attributes.split(',')]
-                        yield TitleAkas(title_id, ordering, title, region, language, types, attributes,
-                                        is_original_title)
-                    else:
-                        raise InvalidParseFormat()
+        return self._parse(path, _TITLE_AKAS, contains_headers, processes, ordered, columns, where)
 
-    def get_title_basics(self, path, contains_headers=True):
+    def get_title_basics(self, path, contains_headers=True, processes=None, ordered=True, columns=None, where=None):
         """Parse the "`title.basics.tsv`" dataset provided by IMDb.
 
         Args:
             path (:obj:`str`): The system path to the dataset file. If not using
                 default filenames, this string will include the dataset file.
             contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if rows parsed in parallel are yielded in the same order as
+                the dataset. Otherwise each batch of rows is yielded as soon as it has been parsed.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the member variables to parse, or `None`
+                to parse all of them. Every other member variable is left empty.
+            where (:obj:`dict`, optional): A dictionary of member variable names to either a value it must be
+                equal to, or a function given its value that returns if the row should be kept. Rows are
+                filtered before the rest of the row is parsed.
 
         Yields:
             A :class:`~.models.title.TitleBasics` object for each row in the dataset.
 
         Raises:
             InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
         """
 
-        path = self._build_path(path, _TITLE_BASICS.default_filename)
+        return self._parse(path, _TITLE_BASICS, contains_headers, processes, ordered, columns, where)
 
-        with open(path, mode='r', encoding='utf8') as f:
-            is_first_line = contains_headers
-            for line in f:
-                if is_first_line:
-                    is_first_line = False
-                else:
-                    line = line.strip().split('\t')
-                    if len(line) == _TITLE_BASICS.column_count:
-                        line = preprocess_list(line)
-                        title_id, title_type, primary_title, original_title, \
-                            is_adult, start_year, end_year, runtime, genres = line
-                        if genres is not None:
-                            genres = [genre for genre in genres.split(',')]
-                        yield TitleBasics(title_id, title_type, primary_title, original_title, is_adult, start_year,
-                                          end_year, runtime, genres)
-                    else:
-                        raise InvalidParseFormat()
-
-    def get_title_crew(self, path, contains_headers=True):
+    def get_title_crew(self, path, contains_headers=True, processes=None, ordered=True, columns=None, where=None):
         """Parse the "`title.crew.tsv`" dataset provided by IMDb.
 
         Args:
             path (:obj:`str`): The system path to the dataset file. If not using
                 default filenames, this string will include the dataset file.
             contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if rows parsed in parallel are yielded in the same order as
+                the dataset. Otherwise each batch of rows is yielded as soon as it has been parsed.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the member variables to parse, or `None`
+                to parse all of them. Every other member variable is left empty.
+            where (:obj:`dict`, optional): A dictionary of member variable names to either a value it must be
+                equal to, or a function given its value that returns if the row should be kept. Rows are
+                filtered before the rest of the row is parsed.
 
         Yields:
             A :class:`~.models.title.TitleCrew` object for each row in the dataset.
 
         Raises:
             InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
         """
 
-        path = self._build_path(path, _TITLE_CREW.default_filename)
+        return self._parse(path, _TITLE_CREW, contains_headers, processes, ordered, columns, where)
 
-        with open(path, mode='r', encoding='utf8') as f:
-            is_first_line = contains_headers
-            for line in f:
-                if is_first_line:
-                    is_first_line = False
-                else:
-                    line = line.strip().split('\t')
-                    if len(line) == _TITLE_CREW.column_count:
-                        line = preprocess_list(line)
-                        title_id, director_ids, writer_ids = line
-                        if director_ids is not None:
-                            director_ids = [director_id for director_id in director_ids.split(',')]
-                        if writer_ids is not None:
-                            writer_ids = [writer_id for writer_id in writer_ids.split(',')]
-                        yield TitleCrew(title_id, director_ids, writer_ids)
-                    else:
-                        raise InvalidParseFormat()
-
-    def get_title_episodes(self, path, contains_headers=True):
+    def get_title_episodes(self, path, contains_headers=True, processes=None, ordered=True, columns=None, where=None):
         """Parse the "`title.episodes.tsv`" dataset provided by IMDb.
 
         Args:
             path (:obj:`str`): The system path to the dataset file. If not using
                 default filenames, this string will include the dataset file.
             contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if rows parsed in parallel are yielded in the same order as
+                the dataset. Otherwise each batch of rows is yielded as soon as it has been parsed.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the member variables to parse, or `None`
+                to parse all of them. Every other member variable is left empty.
+            where (:obj:`dict`, optional): A dictionary of member variable names to either a value it must be
+                equal to, or a function given its value that returns if the row should be kept. Rows are
+                filtered before the rest of the row is parsed.
 
         Yields:
             A :class:`~.models.title.TitleEpisode` object for each row in the dataset.
 
         Raises:
             InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
         """
 
-        path = self._build_path(path, _TITLE_EPISODE.default_filename)
-        
-        with open(path, mode='r', encoding='utf8') as f:
-            is_first_line = contains_headers
-            for line in f:
-                if is_first_line:
-                    is_first_line = False
-                else:
-                    line = line.strip().split('\t')
-                    if len(line) == _TITLE_EPISODE.column_count:
-                        line = preprocess_list(line)
-                        title_id, parent_title_id, season_number, episode_number = line
-                        yield TitleEpisode(title_id, parent_title_id, season_number, episode_number)
-                    else:
-                        raise InvalidParseFormat()
+        return self._parse(path, _TITLE_EPISODE, contains_headers, processes, ordered, columns, where)
 
-    def get_title_principals(self, path, contains_headers=True):
+    def get_title_principals(self, path, contains_headers=True, processes=None, ordered=True, columns=None, where=None):
         """Parse the "`title.principals.tsv`" dataset provided by IMDb.
 
         Args:
             path (:obj:`str`): The system path to the dataset file. If not using
                 default filenames, this string will include the dataset file.
             contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if rows parsed in parallel are yielded in the same order as
+                the dataset. Otherwise each batch of rows is yielded as soon as it has been parsed.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the member variables to parse, or `None`
+                to parse all of them. Every other member variable is left empty.
+            where (:obj:`dict`, optional): A dictionary of member variable names to either a value it must be
+                equal to, or a function given its value that returns if the row should be kept. Rows are
+                filtered before the rest of the row is parsed.
 
         Yields:
             A :class:`~.models.title.TitlePrincipalCrew` object for each row in the dataset.
 
         Raises:
             InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
         """
 
-        path = self._build_path(path, _TITLE_PRINCIPALS.default_filename)
-
-        with open(path, mode='r', encoding='utf8') as f:
-            is_first_line = contains_headers
-            for line in f:
-                if is_first_line:
-                    is_first_line = False
-                else:
-                    line = line.strip().split('\t')
-                    if len(line) == _TITLE_PRINCIPALS.column_count:
-                        line = preprocess_list(line)
-                        title_id, ordering, name_id, category, job, characters = line
-                        if characters is not None and len(characters) > 0 and characters[0] == '[' \
-                                and characters[-1] == ']':
-                            characters = [result.group(0).replace('"', '') for result in
-                                          re.finditer(r'".+?"', characters)]
-                        yield TitlePrincipalCrew(title_id, ordering, name_id, category, job, characters)
-                    else:
-                        raise InvalidParseFormat()
+        return self._parse(path, _TITLE_PRINCIPALS, contains_headers, processes, ordered, columns, where)
 
-    def get_title_ratings(self, path, contains_headers=True):
+    def get_title_ratings(self, path, contains_headers=True, processes=None, ordered=True, columns=None, where=None):
         """Parse the "`title.ratings.tsv`" dataset provided by IMDb.
 
         Args:
             path (:obj:`str`): The system path to the dataset file. If not using
                 default filenames, this string will include the dataset file.
             contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if rows parsed in parallel are yielded in the same order as
+                the dataset. Otherwise each batch of rows is yielded as soon as it has been parsed.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the member variables to parse, or `None`
+                to parse all of them. Every other member variable is left empty.
+            where (:obj:`dict`, optional): A dictionary of member variable names to either a value it must be
+                equal to, or a function given its value that returns if the row should be kept. Rows are
+                filtered before the rest of the row is parsed.
 
         Yields:
             A :class:`~.models.title.TitleRating` object for each row in the dataset.
 
         Raises:
             InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
         """
 
-        path = self._build_path(path, _TITLE_RATINGS.default_filename)
-
-        with open(path, mode='r', encoding='utf8') as f:
-            is_first_line = contains_headers
-            for line in f:
-                if is_first_line:
-                    is_first_line = False
-                else:
-                    line = line.strip().split('\t')
-                    if len(line) == _TITLE_RATINGS.column_count:
-                        line = preprocess_list(line)
-                        title_id, average_rating, num_votes = line
-                        yield TitleRating(title_id, average_rating, num_votes)
-                    else:
-                        raise InvalidParseFormat()
+        return self._parse(path, _TITLE_RATINGS, contains_headers, processes, ordered, columns, where)
 
-    def get_name_basics(self, path, contains_headers=True):
+    def get_name_basics(self, path, contains_headers=True, processes=None, ordered=True, columns=None, where=None):
         """Parse the "`name.basics.tsv`" dataset provided by IMDb.
 
         Args:
             path (:obj:`str`): The system path to the dataset file. If not using
                 default filenames, this string will include the dataset file.
             contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if rows parsed in parallel are yielded in the same order as
+                the dataset. Otherwise each batch of rows is yielded as soon as it has been parsed.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the member variables to parse, or `None`
+                to parse all of them. Every other member variable is left empty.
+            where (:obj:`dict`, optional): A dictionary of member variable names to either a value it must be
+                equal to, or a function given its value that returns if the row should be kept. Rows are
+                filtered before the rest of the row is parsed.
 
         Yields:
             A :class:`~.models.name.NameBasics` object for each row in the dataset.
 
         Raises:
             InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
         """
 
-        path = self._build_path(path, _NAME_BASICS.default_filename)
-        
-        with open(path, 'r', encoding='utf8') as f:
-            is_first_line = contains_headers
-            for line in f:
-                if is_first_line:
-                    is_first_line = False
-                else:
-                    line = line.split('\t')
-                    if len(line) == _NAME_BASICS.column_count:
-                        line = preprocess_list(line)
-                        # Build the NameBasics
-                        name_id, primary_name, birth_year, death_year, primary_professions, known_for_titles = line
-                        if primary_professions is not None:
-                            primary_professions = [profession.strip() for profession in primary_professions.split(',')]
-                        if known_for_titles is not None:
-                            known_for_titles = [title.strip() for title in known_for_titles.split(',')]
-                        yield NameBasics(
-                            name_id, primary_name, birth_year, death_year, primary_professions, known_for_titles)
+        return self._parse(path, _NAME_BASICS, contains_headers, processes, ordered, columns, where)
+
+    def get_title_akas_batches(self, path, batch_size=_DEFAULT_BATCH_SIZE, contains_headers=True,
+                               processes=None, ordered=True, columns=None, where=None):
+        """Parse the "`title.akas.tsv`" dataset provided by IMDb into batches of columns.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file. If not using
+                default filenames, this string will include the dataset file.
+            batch_size (:obj:`int`, optional): The maximum amount of rows in each batch.
+            contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if batches parsed in parallel are yielded in the same order
+                as the dataset.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the columns to include in each batch, or
+                `None` to include all of them.
+            where (:obj:`dict`, optional): A dictionary of column names to either a value the column must be
+                equal to, or a function given the column's value that returns if the row should be kept.
+
+        Yields:
+            A :class:`~.models.batch.DatasetBatch` object for every `batch_size` rows in the dataset.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
+        """
+
+        return self._parse_batches(path, _TITLE_AKAS, batch_size, contains_headers, processes, ordered, columns,
+                                   where)
+
+    def get_title_basics_batches(self, path, batch_size=_DEFAULT_BATCH_SIZE, contains_headers=True,
+                                 processes=None, ordered=True, columns=None, where=None):
+        """Parse the "`title.basics.tsv`" dataset provided by IMDb into batches of columns.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file. If not using
+                default filenames, this string will include the dataset file.
+            batch_size (:obj:`int`, optional): The maximum amount of rows in each batch.
+            contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if batches parsed in parallel are yielded in the same order
+                as the dataset.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the columns to include in each batch, or
+                `None` to include all of them.
+            where (:obj:`dict`, optional): A dictionary of column names to either a value the column must be
+                equal to, or a function given the column's value that returns if the row should be kept.
+
+        Yields:
+            A :class:`~.models.batch.DatasetBatch` object for every `batch_size` rows in the dataset.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
+        """
+
+        return self._parse_batches(path, _TITLE_BASICS, batch_size, contains_headers, processes, ordered, columns,
+                                   where)
+
+    def get_title_crew_batches(self, path, batch_size=_DEFAULT_BATCH_SIZE, contains_headers=True,
+                               processes=None, ordered=True, columns=None, where=None):
+        """Parse the "`title.crew.tsv`" dataset provided by IMDb into batches of columns.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file. If not using
+                default filenames, this string will include the dataset file.
+            batch_size (:obj:`int`, optional): The maximum amount of rows in each batch.
+            contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if batches parsed in parallel are yielded in the same order
+                as the dataset.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the columns to include in each batch, or
+                `None` to include all of them.
+            where (:obj:`dict`, optional): A dictionary of column names to either a value the column must be
+                equal to, or a function given the column's value that returns if the row should be kept.
+
+        Yields:
+            A :class:`~.models.batch.DatasetBatch` object for every `batch_size` rows in the dataset.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
+        """
+
+        return self._parse_batches(path, _TITLE_CREW, batch_size, contains_headers, processes, ordered, columns,
+                                   where)
+
+    def get_title_episodes_batches(self, path, batch_size=_DEFAULT_BATCH_SIZE, contains_headers=True,
+                                   processes=None, ordered=True, columns=None, where=None):
+        """Parse the "`title.episodes.tsv`" dataset provided by IMDb into batches of columns.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file. If not using
+                default filenames, this string will include the dataset file.
+            batch_size (:obj:`int`, optional): The maximum amount of rows in each batch.
+            contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if batches parsed in parallel are yielded in the same order
+                as the dataset.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the columns to include in each batch, or
+                `None` to include all of them.
+            where (:obj:`dict`, optional): A dictionary of column names to either a value the column must be
+                equal to, or a function given the column's value that returns if the row should be kept.
+
+        Yields:
+            A :class:`~.models.batch.DatasetBatch` object for every `batch_size` rows in the dataset.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
+        """
+
+        return self._parse_batches(path, _TITLE_EPISODE, batch_size, contains_headers, processes, ordered, columns,
+                                   where)
+
+    def get_title_principals_batches(self, path, batch_size=_DEFAULT_BATCH_SIZE, contains_headers=True,
+                                     processes=None, ordered=True, columns=None, where=None):
+        """Parse the "`title.principals.tsv`" dataset provided by IMDb into batches of columns.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file. If not using
+                default filenames, this string will include the dataset file.
+            batch_size (:obj:`int`, optional): The maximum amount of rows in each batch.
+            contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if batches parsed in parallel are yielded in the same order
+                as the dataset.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the columns to include in each batch, or
+                `None` to include all of them.
+            where (:obj:`dict`, optional): A dictionary of column names to either a value the column must be
+                equal to, or a function given the column's value that returns if the row should be kept.
+
+        Yields:
+            A :class:`~.models.batch.DatasetBatch` object for every `batch_size` rows in the dataset.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
+        """
+
+        return self._parse_batches(path, _TITLE_PRINCIPALS, batch_size, contains_headers, processes, ordered, columns,
+                                   where)
+
+    def get_title_ratings_batches(self, path, batch_size=_DEFAULT_BATCH_SIZE, contains_headers=True,
+                                  processes=None, ordered=True, columns=None, where=None):
+        """Parse the "`title.ratings.tsv`" dataset provided by IMDb into batches of columns.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file. If not using
+                default filenames, this string will include the dataset file.
+            batch_size (:obj:`int`, optional): The maximum amount of rows in each batch.
+            contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if batches parsed in parallel are yielded in the same order
+                as the dataset.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the columns to include in each batch, or
+                `None` to include all of them.
+            where (:obj:`dict`, optional): A dictionary of column names to either a value the column must be
+                equal to, or a function given the column's value that returns if the row should be kept.
+
+        Yields:
+            A :class:`~.models.batch.DatasetBatch` object for every `batch_size` rows in the dataset.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
+        """
+
+        return self._parse_batches(path, _TITLE_RATINGS, batch_size, contains_headers, processes, ordered, columns,
+                                   where)
+
+    def get_name_basics_batches(self, path, batch_size=_DEFAULT_BATCH_SIZE, contains_headers=True,
+                                processes=None, ordered=True, columns=None, where=None):
+        """Parse the "`name.basics.tsv`" dataset provided by IMDb into batches of columns.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file. If not using
+                default filenames, this string will include the dataset file.
+            batch_size (:obj:`int`, optional): The maximum amount of rows in each batch.
+            contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes used to parse the dataset in parallel,
+                or `None` to parse it in the current process.
+            ordered (:obj:`bool`, optional): Determine if batches parsed in parallel are yielded in the same order
+                as the dataset.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the columns to include in each batch, or
+                `None` to include all of them.
+            where (:obj:`dict`, optional): A dictionary of column names to either a value the column must be
+                equal to, or a function given the column's value that returns if the row should be kept.
+
+        Yields:
+            A :class:`~.models.batch.DatasetBatch` object for every `batch_size` rows in the dataset.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
+        """
+
+        return self._parse_batches(path, _NAME_BASICS, batch_size, contains_headers, processes, ordered, columns,
+                                   where)
+
+    def join_titles(self, path, datasets=_DEFAULT_JOINED_DATASETS, contains_headers=True):
+        """Join the title datasets provided by IMDb into a single record per title.
+
+        IMDb sorts each title dataset by title ID, so the datasets are read side by side
+        in a single streaming merge, keeping only the rows of the current title in memory.
+
+        Args:
+            path (:obj:`str` or :obj:`dict`): The system path to the directory containing the dataset files.
+                If not using default filenames, this is a dictionary of each dataset's name to its file path.
+            datasets (:obj:`list` of :obj:`str`, optional): The names of the datasets to join, matching the member
+                variables of :class:`~.models.title.TitleRecord`: `akas`, `basics`, `crew`, `episode`, `principals`,
+                and `rating`. The `akas` and `principals` rows of each title are grouped into lists.
+            contains_headers (:obj:`bool`, optional): Determine if the first line of each file is column titles
+                or a data row.
+
+        Yields:
+            A :class:`~.models.title.TitleRecord` object for each title ID found within any of the datasets.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If no datasets, an unknown dataset, or the same dataset twice is given, or a dataset is
+                not sorted by title ID or has more than one row for a title ID that is not grouped into a list.
+        """
+
+        if not datasets:
+            raise ValueError('No datasets to join')
+        unknown = [name for name in datasets if name not in _JOINED_DATASETS]
+        if unknown:
+            raise ValueError(f'Unknown datasets {unknown}, expected some of: {", ".join(_JOINED_DATASETS)}')
+        if len(set(datasets)) != len(datasets):
+            raise ValueError(f'Cannot join the same dataset more than once: {datasets}')
+
+        streams = []
+        for name in datasets:
+            dataset, many = _JOINED_DATASETS[name]
+            dataset_path = path[name] if isinstance(path, dict) else path
+            streams.append(_keyed_groups(name, self._parse(dataset_path, dataset, contains_headers), many))
+        for title_id, group in groupby(heapq.merge(*streams, key=itemgetter(0)), key=itemgetter(0)):
+            yield TitleRecord(title_id, **{name: value for _, name, value in group})
+
+    def get_changes(self, old_path, new_path, dataset, contains_headers=True, old_hashes_path=None,
+                    hashes_path=None):
+        """Find the rows that differ between two snapshots of a dataset provided by IMDb.
+
+        Both snapshots are read side by side in a single sorted merge on the dataset's key columns,
+        which are the title ID and `ordering` for "`title.akas.tsv`" and "`title.principals.tsv`", and
+        the title or name ID for every other dataset. Instead of the old snapshot, the row hashes saved
+        from it with `hashes_path` can be compared against, without keeping the old file around.
+
+        Args:
+            old_path (:obj:`str`): The system path to the old snapshot's dataset file, or `None` if comparing
+                against `old_hashes_path`. If using default filenames, the directory containing it.
+            new_path (:obj:`str`): The system path to the new snapshot's dataset file. If using default
+                filenames, the directory containing it.
+            dataset (:obj:`str`): The default filename of the dataset provided by IMDb, such as
+                "`title.basics.tsv`".
+            contains_headers (:obj:`bool`, optional): Determine if the first line is column titles or a data row.
+            old_hashes_path (:obj:`str`, optional): The system path to the row hashes saved from the old snapshot.
+                The old PyMDb objects of removed and changed rows are `None` when it is used.
+            hashes_path (:obj:`str`, optional): The system path to save the new snapshot's row hashes to, for
+                the next comparison. The file is only written once every change has been read.
+
+        Yields:
+            :class:`~.models.change.DatasetChange`: A change for each row that was added, removed, or changed.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If the dataset is unknown, both or neither old snapshots are given,
+                or a dataset file is not sorted by its key columns.
+        """
+
+        if dataset not in _DATASETS:
+            raise ValueError(f'Unknown dataset {dataset}, expected one of: {", ".join(_DATASETS)}')
+        if (old_path is None) == (old_hashes_path is None):
+            raise ValueError('Expected exactly one of old_path or old_hashes_path')
+        dataset = _DATASETS[dataset]
+        key_size = dataset.key_size
+        build = dataset.build
+
+        if old_path is not None:
+            old_rows = ((key, row, None) for key, row in
+                        _keyed_rows(self._read_rows(old_path, dataset, contains_headers), key_size))
+        else:
+            old_rows = ((key, None, row_hash) for key, row_hash in _read_row_hashes(old_hashes_path, key_size))
+        new_rows = _keyed_rows(self._read_rows(new_path, dataset, contains_headers), key_size)
+        if old_hashes_path is not None or hashes_path is not None:
+            new_rows = ((key, row, _hash_row(row)) for key, row in new_rows)
+        else:
+            new_rows = ((key, row, None) for key, row in new_rows)
+        if hashes_path is not None:
+            new_rows = _write_row_hashes(hashes_path, new_rows)
+
+        old = next(old_rows, None)
+        new = next(new_rows, None)
+        while old is not None or new is not None:
+            if new is None or (old is not None and old[0] < new[0]):
+                key, row, _ = old
+                yield DatasetChange(DatasetChange.REMOVED, key, None if row is None else build(row), None)
+                old = next(old_rows, None)
+            elif old is None or new[0] < old[0]:
+                key, row, _ = new
+                yield DatasetChange(DatasetChange.ADDED, key, None, build(row))
+                new = next(new_rows, None)
+            else:
+                key, old_row, old_hash = old
+                _, new_row, new_hash = new
+                if (old_row != new_row) if old_row is not None else (old_hash != new_hash):
+                    yield DatasetChange(DatasetChange.CHANGED, key, None if old_row is None else build(old_row),
+                                        build(new_row))
+                old = next(old_rows, None)
+                new = next(new_rows, None)
+
+    def _parse(self, path, dataset, contains_headers, processes=None, ordered=True, columns=None, where=None):
+        """Private generator to build a PyMDb object for each row in a dataset.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file, or the directory containing it
+                if using default filenames.
+            dataset (:class:`_IMDbDataset`): The dataset being parsed.
+            contains_headers (:obj:`bool`): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes, or `None` to parse serially.
+            ordered (:obj:`bool`, optional): Determine if rows parsed in parallel keep the dataset's order.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the columns to parse.
+            where (:obj:`dict`, optional): The row filters for each column name.
+
+        Yields:
+            The PyMDb object built by the dataset for each row.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If parsing in parallel while streaming gzip files, or a column does not exist.
+        """
+
+        selection = _Selection(dataset, columns, where) if columns is not None or where else None
+        cache = self._get_cache(path, dataset)
+        cache_valid = cache is not None and cache.is_valid()
+        if processes is None or cache_valid:
+            rows = self._get_rows(path, dataset, contains_headers, cache, cache_valid)
+            if selection is not None:
+                rows = selection.select(rows)
+            # Rows read from or written to a cache already have their numeric columns converted
+            build = dataset.build if cache is None else dataset.build_typed
+            for row in rows:
+                yield build(row)
+        else:
+            for batch in self._parse_parallel(path, dataset, contains_headers, processes, ordered,
+                                              selection=selection):
+                yield from batch
+
+    def _parse_batches(self, path, dataset, batch_size, contains_headers, processes=None, ordered=True, columns=None,
+                       where=None):
+        """Private generator to build a `DatasetBatch` for every `batch_size` rows in a dataset.
+
+        When parsing in parallel, batches do not span the byte ranges given to each worker,
+        so some batches may hold fewer than `batch_size` rows.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file, or the directory containing it
+                if using default filenames.
+            dataset (:class:`_IMDbDataset`): The dataset being parsed.
+            batch_size (:obj:`int`): The maximum amount of rows in each batch.
+            contains_headers (:obj:`bool`): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`, optional): The amount of worker processes, or `None` to parse serially.
+            ordered (:obj:`bool`, optional): Determine if batches parsed in parallel keep the dataset's order.
+            columns (:obj:`list` of :obj:`str`, optional): The names of the columns to include in each batch.
+            where (:obj:`dict`, optional): The row filters for each column name.
+
+        Yields:
+            :class:`~.models.batch.DatasetBatch`: A batch of at most `batch_size` rows.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If `batch_size` is less than 1, parsing in parallel while streaming gzip files,
+                or a column does not exist.
+        """
+
+        if batch_size < 1:
+            raise ValueError(f'Invalid batch size: {batch_size}')
+        selection = _Selection(dataset, columns, where) if columns is not None or where else None
+        cache = self._get_cache(path, dataset)
+        cache_valid = cache is not None and cache.is_valid()
+        if cache_valid and (selection is None or not selection.conditions):
+            yield from _cached_batches(cache, dataset, batch_size, selection)
+        elif processes is None or cache_valid:
+            rows = self._get_rows(path, dataset, contains_headers, cache, cache_valid)
+            yield from _batch_rows(rows, dataset, batch_size, selection)
+        else:
+            for batches in self._parse_parallel(path, dataset, contains_headers, processes, ordered, batch_size,
+                                                selection):
+                yield from batches
+
+    def _parse_parallel(self, path, dataset, contains_headers, processes, ordered, batch_size=None, selection=None):
+        """Private generator to parse a dataset across a pool of worker processes.
+
+        Splits the uncompressed dataset into byte ranges aligned to line boundaries and parses
+        each range in a worker. At most two ranges per process are in flight at once so parsed
+        batches do not pile up faster than they are consumed.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file, or the directory containing it
+                if using default filenames.
+            dataset (:class:`_IMDbDataset`): The dataset being parsed.
+            contains_headers (:obj:`bool`): Determine if the first line is column titles or a data row.
+            processes (:obj:`int`): The amount of worker processes.
+            ordered (:obj:`bool`): Determine if batches are yielded in the same order as the dataset.
+            batch_size (:obj:`int`, optional): The amount of rows in each :class:`~.models.batch.DatasetBatch`,
+                or `None` to build a PyMDb object for each row.
+            selection (:class:`_Selection`, optional): The column projection and row filters, if any. Any
+                functions used as filters must be picklable to be sent to the worker processes.
+
+        Yields:
+            :obj:`list`: The PyMDb objects, or :class:`~.models.batch.DatasetBatch` objects, for each byte range.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+            ValueError: If streaming gzip files or `processes` is less than 1.
+        """
+
+        if self._is_streaming():
+            raise ValueError('Parallel parsing requires uncompressed datasets, cannot stream gzip files')
+        if processes < 1:
+            raise ValueError(f'Invalid process count: {processes}')
+
+        path = self._build_path(path, dataset.default_filename)
+        ranges = deque(_split_ranges(path, processes * _RANGES_PER_PROCESS))
+        max_pending = processes * 2
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            try:
+                while ranges or pending:
+                    while ranges and len(pending) < max_pending:
+                        start, end = ranges.popleft()
+                        pending.append(executor.submit(
+                            _parse_range, path, start, end, dataset, contains_headers, batch_size, selection
+                        ))
+                    if ordered:
+                        yield pending.popleft().result()
                     else:
-                        raise InvalidParseFormat()
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            pending.remove(future)
+                            yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _get_rows(self, path, dataset, contains_headers, cache=None, cache_valid=False):
+        """Private generator to get each row in a dataset, reading from its cache when possible.
+
+        Reads the rows from the dataset's cache if it is valid. Otherwise the dataset file is read,
+        and the rows are written to the cache as they are read if caching is enabled. Rows read from
+        or written to a cache have their numeric columns already converted.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file, or the directory containing it
+                if using default filenames.
+            dataset (:class:`_IMDbDataset`): The dataset being read.
+            contains_headers (:obj:`bool`): Determine if the first line is column titles or a data row.
+            cache (:class:`~.cache.DatasetCache`, optional): The dataset's cache, or `None` if not caching.
+            cache_valid (:obj:`bool`, optional): Determine if the dataset's cache is valid and can be read.
+
+        Yields:
+            :obj:`list`: The values of each row.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+        """
+
+        if cache is None:
+            yield from self._read_rows(path, dataset, contains_headers)
+        elif cache_valid:
+            yield from cache.read_rows()
+        else:
+            numeric_columns = dataset.numeric_columns
+            rows = (_to_typed_row(row, numeric_columns) for row in self._read_rows(path, dataset, contains_headers))
+            yield from cache.write(rows)
+
+    def _get_cache(self, path, dataset):
+        """Private function to get the cache of a dataset.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file, or the directory containing it
+                if using default filenames.
+            dataset (:class:`_IMDbDataset`): The dataset being read.
+
+        Returns:
+            :class:`~.cache.DatasetCache`: The dataset's cache, or `None` if not caching datasets.
+        """
+
+        if self._cache_dir is None:
+            return None
+        return DatasetCache(self._cache_dir, self._source_path(path, dataset.default_filename),
+                            dataset.storage_columns)
+
+    def _read_rows(self, path, dataset, contains_headers):
+        """Private generator to split and preprocess each row in a dataset.
+
+        Opens the dataset through a decompressing stream when streaming gzip files,
+        otherwise the uncompressed file is read directly.
+
+        Args:
+            path (:obj:`str`): The system path to the dataset file, or the directory containing it
+                if using default filenames.
+            dataset (:class:`_IMDbDataset`): The dataset being read.
+            contains_headers (:obj:`bool`): Determine if the first line is column titles or a data row.
+
+        Yields:
+            :obj:`list` of :obj:`str`: The preprocessed columns of each row.
+
+        Raises:
+            InvalidParseFormat: If a row has an incorrect column size.
+        """
+
+        path = self._build_path(path, dataset.default_filename)
+        streaming = self._is_streaming()
+
+        if streaming:
+            f = gzip.open(path, mode='rt', encoding='utf8')
+        else:
+            f = open(path, mode='r', encoding='utf8')
+        with f:
+            if contains_headers:
+                next(f, None)
+            for line in f:
+                yield _split_line(line, dataset)
+        if streaming and self._delete_gzip_files:
+            os.remove(path)
+
+    def _is_streaming(self):
+        """Private function to determine if gzipped datasets are read through a decompressing stream.
+
+        Returns:
+            :obj:`bool`: If datasets are streamed instead of gunzipped to disk.
+        """
+
+        return self._gunzip_files and self._stream_gzip_files
 
     def _build_path(self, path, default_filename):
         """Private function to combine a system path with a default filename.
 
         This method will append the default filename of a dataset to the given path
         it is located in. If the files are to be gunzipped, it will also append the correct
-        gzip extension used by IMDb.
+        gzip extension used by IMDb. When streaming gzip files, the gzipped file is not
+        gunzipped to disk and its path is returned instead.
 
         Args:
             path (:obj:`str`): The system path to the directory where the dataset is located.
             default_filename (:obj:`str`): The default filename of the dataset.
-        
+
         Returns:
             :obj:`str`: The path and default filename combined correctly.
         """
 
+        path = self._source_path(path, default_filename)
+        if self._gunzip_files and not self._stream_gzip_files:
+            path = gunzip_file(path, delete_infile=self._delete_gzip_files)
+        return path
+
+    def _source_path(self, path, default_filename):
+        """Private function to get the path of a dataset file as provided, before it is gunzipped.
+
+        Args:
+            path (:obj:`str`): The system path to the directory where the dataset is located.
+            default_filename (:obj:`str`): The default filename of the dataset.
+
+        Returns:
+            :obj:`str`: The path to the dataset file, including the gzip extension used by IMDb if gzipped.
+        """
+
         if self._use_default_filenames:
             path = append_filename_to_path(path, default_filename)
-        if self._gunzip_files:
-            if self._use_default_filenames:
+            if self._gunzip_files:
                 path = f'{path}.gz'
-            path = gunzip_file(path, delete_infile=self._delete_gzip_files)
         return path
@@ -0,0 +1,131 @@
+"""Module containing the RateLimiter class.
+
+Rate limiters are token buckets that can be shared by threads, coroutines, and every
+:class:`~.scraper.PyMDbScraper` in a process that uses the same rate.
+"""
+
+import asyncio
+import threading
+import time
+
+_shared_limiters = {}
+_shared_limiters_lock = threading.Lock()
+
+
+class RateLimiter:
+    """Token bucket limiting how often requests are sent.
+
+    The bucket holds up to `burst` tokens and gains one token every `interval` milliseconds.
+    Each request takes a token, waiting until one is available. The wait is counted from when
+    the previous token was taken, so time spent on the request itself counts towards the
+    interval. Waiting requests are served in the order they called :meth:`acquire`.
+
+    Args:
+        interval (:obj:`float`): The amount of milliseconds between requests once the burst is used up.
+        burst (:obj:`int`, optional): The maximum amount of requests that can be sent without waiting.
+
+    Raises:
+        ValueError: If `interval` is negative or `burst` is less than 1.
+    """
+
+    __slots__ = '_interval', '_burst', '_tokens', '_updated', '_lock'
+
+    def __init__(self, interval, burst=1):
+        if interval < 0:
+            raise ValueError(f'Invalid interval: {interval}')
+        if burst < 1:
+            raise ValueError(f'Invalid burst: {burst}')
+        self._interval = interval / 1000
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def interval(self):
+        return self._interval * 1000
+
+    @property
+    def burst(self):
+        return self._burst
+
+    def acquire(self):
+        """Take a token, blocking the current thread until one is available."""
+
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """Take a token, suspending the current coroutine until one is available."""
+
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds):
+        """Stop tokens from being taken until an amount of time has passed.
+
+        The bucket does not refill during the pause and holds at most one token when it ends, so
+        requests that wait for the pause to end are sent one interval apart instead of all at once.
+        Pausing while already paused keeps whichever pause ends later.
+
+        Args:
+            seconds (:obj:`float`): The amount of seconds to pause for.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            paused_until = now + seconds
+            if paused_until > self._updated:
+                self._tokens = min(self._tokens, 1)
+                self._updated = paused_until
+
+    def _reserve(self):
+        """Private function to take a token, going into debt if none are available.
+
+        Returns:
+            :obj:`float`: The amount of seconds to wait before the token can be used.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = -self._tokens * self._interval if self._tokens < 0 else 0
+            # The bucket is only updated past the current time while paused
+            return self._updated - now + delay
+
+    def _refill(self, now):
+        """Private function to add the tokens gained since the bucket was last updated.
+
+        Args:
+            now (:obj:`float`): The current time of :func:`time.monotonic`.
+        """
+
+        if now <= self._updated:
+            return
+        if self._interval > 0:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) / self._interval)
+        else:
+            self._tokens = self._burst
+        self._updated = now
+
+
+def get_shared_rate_limiter(interval, burst=1):
+    """Get the rate limiter shared by everything in the process using the same rate.
+
+    Args:
+        interval (:obj:`float`): The amount of milliseconds between requests once the burst is used up.
+        burst (:obj:`int`, optional): The maximum amount of requests that can be sent without waiting.
+
+    Returns:
+        :class:`RateLimiter`: The shared rate limiter.
+    """
+
+    with _shared_limiters_lock:
+        key = (interval, burst)
+        if key not in _shared_limiters:
+            _shared_limiters[key] = RateLimiter(interval, burst)
+        return _shared_limiters[key]
@@ -0,0 +1,227 @@
+"""Module containing the RetryPolicy and CircuitBreaker classes.
+
+A :class:`~.scraper.PyMDbScraper` sends each request through its retry policy, so rate limited
+or failing requests are retried after a delay instead of ending a long running scrape.
+"""
+
+import random
+import requests
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+_DEFAULT_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+_DEFAULT_TIMEOUT = 30  # seconds
+
+
+class CircuitBreaker:
+    """Pauses a rate limiter once too many requests fail within a window of time.
+
+    Every failed attempt is recorded, and a successful attempt clears them. Once `threshold` attempts
+    have failed in a row within the last `window` seconds, the circuit opens: the rate limiter is paused
+    for `cooldown` seconds, so every scraper sharing it stops sending requests, and the recorded failures
+    are cleared.
+
+    Args:
+        threshold (:obj:`int`, optional): The amount of failed attempts that opens the circuit.
+        window (:obj:`float`, optional): The amount of seconds failed attempts are counted for.
+        cooldown (:obj:`float`, optional): The amount of seconds the rate limiter is paused for.
+
+    Raises:
+        ValueError: If `threshold` is less than 1.
+    """
+
+    __slots__ = '_threshold', '_window', '_cooldown', '_failures', '_lock'
+
+    def __init__(self, threshold=5, window=60, cooldown=30):
+        if threshold < 1:
+            raise ValueError(f'Invalid threshold: {threshold}')
+        self._threshold = threshold
+        self._window = window
+        self._cooldown = cooldown
+        self._failures = []
+        self._lock = threading.Lock()
+
+    @property
+    def threshold(self):
+        return self._threshold
+
+    @property
+    def window(self):
+        return self._window
+
+    @property
+    def cooldown(self):
+        return self._cooldown
+
+    def record_failure(self, rate_limiter):
+        """Record a failed attempt, opening the circuit if too many attempts have failed.
+
+        Args:
+            rate_limiter (:class:`~.ratelimit.RateLimiter`): The rate limiter paused when the circuit opens.
+
+        Returns:
+            :obj:`bool`: If the circuit was opened.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._failures = [failed_at for failed_at in self._failures if now - failed_at < self._window]
+            self._failures.append(now)
+            if len(self._failures) < self._threshold:
+                return False
+            self._failures.clear()
+        rate_limiter.pause(self._cooldown)
+        return True
+
+    def record_success(self):
+        """Record a successful attempt, clearing the failed attempts."""
+
+        with self._lock:
+            self._failures.clear()
+
+
+class RetryPolicy:
+    """Determines how requests are retried.
+
+    Requests that time out, fail to connect, or return one of `retry_statuses` are retried up to
+    `max_retries` times. The delay before each retry grows exponentially from `backoff`, up to
+    `max_backoff`, and is randomized between half and all of its value when using `jitter` so
+    concurrent requests do not retry at the same moment. A response's `Retry-After` header is used
+    as the delay instead, and also pauses the rate limiter since the server asked to slow down.
+
+    Args:
+        max_retries (:obj:`int`, optional): The maximum amount of times a request is retried.
+        backoff (:obj:`float`, optional): The amount of seconds to wait before the first retry.
+        max_backoff (:obj:`float`, optional): The maximum amount of seconds to wait before a retry,
+            including delays given by `Retry-After`.
+        jitter (:obj:`bool`, optional): Determine if delays are randomized.
+        timeout (:obj:`float`, optional): The amount of seconds to wait for the server to connect
+            or send data, or `None` to wait forever.
+        retry_statuses (:obj:`set` of :obj:`int`, optional): The HTTP status codes that are retried.
+        circuit_breaker (:class:`CircuitBreaker`, optional): The circuit breaker recording failed
+            attempts, or `None` to use one with the default settings.
+
+    Raises:
+        ValueError: If `max_retries` is negative.
+    """
+
+    __slots__ = ('_max_retries', '_backoff', '_max_backoff', '_jitter', '_timeout', '_retry_statuses',
+                 '_circuit_breaker')
+
+    def __init__(self, max_retries=3, backoff=1, max_backoff=60, jitter=True, timeout=_DEFAULT_TIMEOUT,
+                 retry_statuses=_DEFAULT_RETRY_STATUSES, circuit_breaker=None):
+        if max_retries < 0:
+            raise ValueError(f'Invalid max retries: {max_retries}')
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._jitter = jitter
+        self._timeout = timeout
+        self._retry_statuses = frozenset(retry_statuses)
+        self._circuit_breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+
+    @property
+    def max_retries(self):
+        return self._max_retries
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @property
+    def retry_statuses(self):
+        return self._retry_statuses
+
+    @property
+    def circuit_breaker(self):
+        return self._circuit_breaker
+
+    def send(self, send_request, rate_limiter):
+        """Send a request, retrying it while it fails.
+
+        Each attempt waits for the rate limiter before being sent.
+
+        Args:
+            send_request (:obj:`callable`): The function sending the request, called with a `timeout` keyword
+                in seconds and returning a :class:`requests.Response`.
+            rate_limiter (:class:`~.ratelimit.RateLimiter`): The rate limiter to wait for.
+
+        Returns:
+            :class:`requests.Response`: The last response received, which can still have a
+                non successful status if it was not retried or retries ran out.
+
+        Raises:
+            ConnectionError: If the last attempt failed to connect.
+            Timeout: If the last attempt timed out.
+        """
+
+        attempt = 0
+        while True:
+            rate_limiter.acquire()
+            try:
+                response = send_request(timeout=self._timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self._circuit_breaker.record_failure(rate_limiter)
+                if attempt >= self._max_retries:
+                    raise
+                delay = self.get_delay(attempt)
+            else:
+                if response.status_code not in self._retry_statuses:
+                    self._circuit_breaker.record_success()
+                    return response
+                self._circuit_breaker.record_failure(rate_limiter)
+                if attempt >= self._max_retries:
+                    return response
+                retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                # Release the connection of a streamed response before it is discarded
+                response.close()
+                if retry_after is not None:
+                    delay = min(retry_after, self._max_backoff)
+                    rate_limiter.pause(delay)
+                else:
+                    delay = self.get_delay(attempt)
+            time.sleep(delay)
+            attempt += 1
+
+    def get_delay(self, attempt):
+        """Get the amount of seconds to wait before retrying a request.
+
+        Args:
+            attempt (:obj:`int`): The amount of times the request has been retried.
+
+        Returns:
+            :obj:`float`: The amount of seconds to wait.
+        """
+
+        delay = min(self._backoff * 2 ** attempt, self._max_backoff)
+        if self._jitter:
+            delay = random.uniform(delay / 2, delay)
+        return delay
+
+
+def _parse_retry_after(value):
+    """Private function to parse a `Retry-After` header into an amount of seconds.
+
+    Args:
+        value (:obj:`str`): The header's value, either an amount of seconds or an HTTP date.
+
+    Returns:
+        :obj:`float`: The amount of seconds to wait, or `None` if the header is missing or invalid.
+    """
+
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
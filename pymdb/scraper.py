@@ -1,18 +1,52 @@
 """Module containing the PyMDbScraper class."""
 
 import json
+import os
 import re
 import requests
-import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
 from selectolax.parser import HTMLParser
 from pymdb.exceptions import InvalidCompanyId
+from pymdb.extraction import (
+    CAST_LIST_END_PATTERN,
+    CAST_LIST_START_PATTERN,
+    CAST_ROW_PATTERN,
+    CREDITS_HEADING_PATTERN,
+    DIGITS_PATTERN,
+    EPISODE_DETAILS_PATTERN,
+    EPISODE_NUMBER_PATTERN,
+    FILMOGRAPHY_ROW_PATTERN,
+    LINK_TAG_PATTERN,
+    NOTES_PATTERN,
+    PARENTHESES_WRAPPED_PATTERN,
+    PARENTHESIZED_PATTERN,
+    PARENTHESIZED_YEAR_PATTERN,
+    RATING_SEPARATOR_PATTERN,
+    SEASON_NUMBER_PATTERN,
+    SERIES_DATES_PATTERN,
+    SERIES_PATTERN,
+    TAG_PATTERN,
+    TITLE_COUNT_PATTERN,
+    WHITESPACE_PATTERN,
+    YEAR_RANGE_PATTERN,
+    YEAR_RANGE_SEPARATOR_PATTERN,
+    YEAR_SEPARATOR_PATTERN,
+    extract_labeled_fields,
+)
+from pymdb.ratelimit import get_shared_rate_limiter
+from pymdb.retry import RetryPolicy
+from pymdb.transport import SessionTransport
 from pymdb.models import (
     CompanyScrape,
     CompanyCreditScrape,
     CreditScrape,
+    LazyTitleScrape,
     NameCreditScrape,
     NameScrape,
+    ScrapeResult,
     SearchResultName,
     SearchResultTitle,
     TitleScrape,
@@ -25,27 +59,229 @@ from pymdb.models.name import (
 from pymdb.utils import (
     get_category,
     get_company_id,
-    get_denomination,
     get_episode_info,
     get_name_id,
     get_ref_marker,
     get_title_id,
-    is_money_string,
-    remove_tags,
     remove_tags_and_content,
     split_by_br,
     trim_name,
     trim_year,
-    trim_money_string,
 )
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as _FastHTMLParser
+except ImportError:  # The Lexbor backend was added in selectolax 0.3
+    _FastHTMLParser = HTMLParser
+
+_COMPANY_PAGE_SIZE = 50  # titles
+_STREAM_CHUNK_SIZE = 16 * 1024  # bytes
+# Each section of a title's page, in the order its fields are scraped, with the selector matching its nodes
+_TITLE_SECTIONS = (
+    ('title_wrapper', 'div.title_wrapper'),
+    ('title_parent', 'div.titleParent > a'),
+    ('summary_text', 'div.summary_text'),
+    ('storyline', 'div#titleStoryLine'),
+    ('txt-block', 'div#titleDetails > div.txt-block'),
+    ('cast_list', 'table.cast_list'),
+    ('bp_heading', 'div.bp_heading'),
+)
+_TITLE_SECTIONS_SELECTOR = ', '.join(selector for _, selector in _TITLE_SECTIONS)
+# The section of a title's page each field of a TitleScrape is scraped from
+_TITLE_FIELD_SECTIONS = {
+    'display_title': 'title_wrapper',
+    'end_year': 'title_wrapper',
+    'mpaa_rating': 'title_wrapper',
+    'title_parent_id': 'title_parent',
+    'plot': 'summary_text',
+    'storyline': 'storyline',
+    'country': 'txt-block',
+    'language': 'txt-block',
+    'release_date': 'txt-block',
+    'production_companies': 'txt-block',
+    'budget': 'txt-block',
+    'budget_denomination': 'txt-block',
+    'opening_weekend_gross': 'txt-block',
+    'opening_weekend_date': 'txt-block',
+    'usa_gross': 'txt-block',
+    'worldwide_gross': 'txt-block',
+    'top_cast': 'cast_list',
+    'season_number': 'bp_heading',
+    'episode_number': 'bp_heading',
+}
+# Each page scrape_page supports, matched against its URL, with the group capturing the page's IMDb ID
+_PAGE_URL_PATTERNS = (
+    ('full_credits', re.compile(r'/title/(tt\d+)/fullcredits')),
+    ('company_credits', re.compile(r'/title/(tt\d+)/companycredits')),
+    ('tech_specs', re.compile(r'/title/(tt\d+)/technical')),
+    ('title', re.compile(r'/title/(tt\d+)/?(?:[?#]|$)')),
+    ('name', re.compile(r'/name/(nm\d+)/bio')),
+    ('name_credits', re.compile(r'/name/(nm\d+)/?(?:[?#]|$)')),
+    ('company', re.compile(r'/search/title/?\?(?:.*&)?companies=(co\d+)')),
+)
+
+_worker_scraper = None
+
+
+def _get_title_section(node):
+    """Private function to determine which section of a title's page a node is.
+
+    Args:
+        node (:class:`Node`): A node matched by the title page's section selector.
+
+    Returns:
+        :obj:`str`: The name of the section, or `None` if the node is not a known section.
+    """
+
+    if node.tag == 'a':
+        return 'title_parent'
+    if node.tag == 'table':
+        return 'cast_list'
+    if node.id == 'titleStoryLine':
+        return 'storyline'
+    classes = (node.attributes.get('class') or '').split()
+    for section in ('title_wrapper', 'summary_text', 'txt-block', 'bp_heading'):
+        if section in classes:
+            return section
+    return None
+
+
+def _get_page_kind(url):
+    """Private function to determine which kind of IMDb web page a URL is.
+
+    Args:
+        url (:obj:`str`): The page's URL.
+
+    Returns:
+        :obj:`tuple` of (:obj:`str`, :obj:`str`): The kind of page and its IMDb ID, or `None` if
+            the page is not supported.
+    """
+
+    for page_kind, pattern in _PAGE_URL_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return page_kind, match.group(1)
+    return None
+
+
+def _iter_fragments(chunks, fragment_pattern, section_pattern=None, end_pattern=None):
+    """Private generator to split HTML received in chunks into fragments, as soon as each fragment is complete.
+
+    A fragment starts at a match of `fragment_pattern` and ends where the next fragment starts, or
+    where `end_pattern` matches, which also ends the generator. Only the HTML after a match of
+    `section_pattern` is split, and HTML before the first fragment is discarded.
+
+    Args:
+        chunks (:obj:`iterable` of :obj:`str`): The chunks of HTML, in order.
+        fragment_pattern (:obj:`Pattern`): The pattern matching the start of each fragment.
+        section_pattern (:obj:`Pattern`, optional): The pattern matching the start of the split section.
+        end_pattern (:obj:`Pattern`, optional): The pattern matching the end of the split section.
+
+    Yields:
+        :obj:`str`: The HTML of each fragment.
+    """
+
+    buffer = ''
+    in_section = section_pattern is None
+    in_fragment = False
+    for chunk in chunks:
+        # Matches start with a tag, so only search again from the last tag before the new chunk
+        search_start = max(buffer.rfind('<'), 1 if in_fragment else 0)
+        buffer += chunk
+        if not in_section:
+            section_match = section_pattern.search(buffer, search_start)
+            if section_match is None:
+                buffer = buffer[max(buffer.rfind('<'), 0):]
+                continue
+            in_section = True
+            buffer = buffer[section_match.end():]
+            search_start = 0
+        if not in_fragment:
+            fragment_match = fragment_pattern.search(buffer, search_start)
+            end_match = end_pattern.search(buffer, search_start) if end_pattern is not None else None
+            if end_match is not None and (fragment_match is None or end_match.start() < fragment_match.start()):
+                return
+            if fragment_match is None:
+                buffer = buffer[max(buffer.rfind('<'), 0):]
+                continue
+            in_fragment = True
+            buffer = buffer[fragment_match.start():]
+            search_start = 1
+        while True:
+            fragment_match = fragment_pattern.search(buffer, search_start)
+            end_match = end_pattern.search(buffer, search_start) if end_pattern is not None else None
+            if end_match is not None and (fragment_match is None or end_match.start() < fragment_match.start()):
+                yield buffer[:end_match.start()]
+                return
+            if fragment_match is None:
+                break
+            yield buffer[:fragment_match.start()]
+            buffer = buffer[fragment_match.start():]
+            search_start = 1
+    if in_fragment:
+        yield buffer
+
+
+def _scrape_page_batch(pages):
+    """Private function to scrape a batch of saved pages on a worker process.
+
+    Each worker process creates its own scraper the first time it is used, which never sends a request.
+
+    Args:
+        pages (:obj:`list` of :obj:`tuple`): The URL and HTML of each page.
+
+    Returns:
+        :obj:`list` of :class:`~.models.batch.ScrapeResult`: The result of each page.
+    """
+
+    global _worker_scraper
+    if _worker_scraper is None:
+        _worker_scraper = PyMDbScraper()
+    results = []
+    for url, html in pages:
+        _, imdb_id = _get_page_kind(url)
+        try:
+            results.append(ScrapeResult(imdb_id, _worker_scraper.scrape_page(url, html), None, url=url))
+        except Exception as e:
+            results.append(ScrapeResult(imdb_id, None, e, url=url))
+    return results
+
 
 class PyMDbScraper:
     """Scrapes various information from IMDb web pages.
 
     Contains functions for various IMDb pages and scrapes information into Python classes.
 
-    Rate limit is defaulted to 1000ms.
+    Rate limit is defaulted to 1000ms. Requests are limited by a token bucket shared with every other
+    scraper in the process using the same rate limit and burst, so the rate holds across threads and
+    scrapers. The wait before each request is counted from the start of the previous request.
+
+    Every request is sent through a single pooled HTTP session, so connections to IMDb are kept
+    alive and reused between pages. The scraper can be used as a context manager to close the
+    session's connections once finished. Requests that time out or return a rate limiting or
+    server error status are retried with exponential backoff, following the scraper's retry policy.
+
+    Args:
+        rate_limit (:obj:`int`, optional): The amount of milliseconds between the start of each request.
+        burst (:obj:`int`, optional): The amount of requests that can be sent back to back before
+            the rate limit applies.
+        rate_limiter (:class:`~.ratelimit.RateLimiter`, optional): The rate limiter to use instead of
+            the one shared by `rate_limit` and `burst`.
+        cache (:class:`~.http_cache.ResponseCache`, optional): The cache storing the body of each page requested,
+            so fresh pages are returned without a request and stale ones are revalidated, or `None` to request
+            every page.
+        pool_connections (:obj:`int`, optional): The amount of hosts to keep a connection pool for.
+        pool_maxsize (:obj:`int`, optional): The maximum amount of connections kept alive for each host.
+        pool_block (:obj:`bool`, optional): Determine if requests wait for a free connection once a host
+            has `pool_maxsize` connections in use, instead of opening a connection that is discarded afterwards.
+        retry_policy (:class:`~.retry.RetryPolicy`, optional): The policy used to time out and retry failed
+            requests, or `None` to use one with the default settings.
+        prefetch_workers (:obj:`int`, optional): The amount of requests sent at once when a page needs many
+            extra requests, such as the episodes of each actor in a TV series. Each request still waits
+            for the rate limiter.
+        transport (:class:`~.transport.Transport`, optional): The transport requests are sent through,
+            or `None` to use a :class:`~.transport.SessionTransport` with the pool settings. Replaying
+            recorded responses with a :class:`~.transport.ReplayTransport` scrapes without a network.
     """
 
     _rate_limit = 1000 # ms
@@ -56,13 +292,36 @@ class PyMDbScraper:
         'accept': 'text/html,application/xhtml+xml,application/xml'
     }
 
-    def __init__(self, rate_limit=1000):
+    def __init__(self, rate_limit=1000, pool_connections=10, pool_maxsize=10, pool_block=False, burst=1,
+                 rate_limiter=None, cache=None, prefetch_workers=4, retry_policy=None, transport=None):
         if rate_limit > 0:
             self._rate_limit = rate_limit
         else:
             print(f'Invalid rate limit {rate_limit}, defaulting to {self._rate_limit}ms')
+        if rate_limiter is None:
+            rate_limiter = get_shared_rate_limiter(self._rate_limit, burst)
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._prefetch_workers = max(prefetch_workers, 1)
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+
+        if transport is None:
+            transport = SessionTransport(headers=self._headers, pool_connections=pool_connections,
+                                         pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self._transport = transport
+
+    def close(self):
+        """Close the scraper's transport, such as the connections of its HTTP session."""
+
+        self._transport.close()
+
+    def __enter__(self):
+        return self
 
-    def get_title(self, title_id, include_taglines=False):
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_title(self, title_id, include_taglines=False, lazy=False):
         """Scrapes information from the IMDb web page for the specified title.
 
         Uses the given title ID to request the IMDb page for the title and scrapes
@@ -70,10 +329,16 @@ class PyMDbScraper:
         `include_taglines` allows an additional request to be made to gather all
         taglines IMDb has for the title.
 
+        An optional argument `lazy` returns a :class:`~.models.title.LazyTitleScrape` instead,
+        which keeps the page's HTML tree and only scrapes a section of the page the first time
+        one of its fields is accessed. The extra request for taglines is also only made the first
+        time they are accessed.
+
         Args:
             title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
             include_taglines (:obj:`bool`, optional): Specify if an extra request should be
                 made to get all the taglines for the title
+            lazy (:obj:`bool`, optional): Specify if sections of the page should only be scraped when accessed.
 
         Returns:
             :class:`~.models.title.TitleScrape`: An object containing the page's information.
@@ -83,204 +348,234 @@ class PyMDbScraper:
         """
 
         request = f'https://www.imdb.com/title/{title_id}/'
-        tree = self._get_tree(request)
+        tree = self._get_tree(request, parser=_FastHTMLParser)
+
+        if lazy:
+            return LazyTitleScrape(title_id, partial(self._extract_title_fields, tree, title_id, include_taglines))
+
+        taglines = self._get_taglines(title_id) if include_taglines else []
+        return self._extract_title(tree, title_id, taglines)
+
+    def _get_taglines(self, title_id):
+        """Scrapes all the taglines for a title from its taglines web page.
+
+        Args:
+            title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+
+        Returns:
+            :obj:`list` of :obj:`str`: The title's taglines.
+
+        Raises:
+            HTTPError: If the request failed.
+        """
 
-        display_title = None
-        title_parent_id = None
-        rating = None
-        country = None
-        language = None
-        release_date = None
-        end_year = None
-        season_number = None
-        episode_number = None
         taglines = []
-        plot = None
-        storyline = None
-        production_companies = []
-        top_cast = []
-        budget = None
-        budget_denomination = None
-        opening_weekend_gross = None
-        opening_weekend_date = None
-        usa_gross = None
-        worldwide_gross = None
+        tagline_request = f'https://www.imdb.com/title/{title_id}/taglines'
+        tagline_tree = self._get_tree(tagline_request)
+        if not tagline_tree.css_first('div#no_content'):
+            for tagline_node in tagline_tree.css('div.soda'):
+                # TODO: should a Tagline object be created that stores the note for each tagline separately?
+                taglines.append(tagline_node.text().strip())
+        return taglines
+
+    def _extract_title(self, tree, title_id, taglines=None):
+        """Scrapes the information from a title's IMDb web page.
+
+        The page is searched once for every section containing information, and each section
+        is then scraped from its own node instead of searching the whole page again.
+
+        Args:
+            tree (:class:`HTMLTree`): The HTML tree of the title's page.
+            title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+            taglines (:obj:`list` of :obj:`str`, optional): The title's taglines, scraped from another page.
+
+        Returns:
+            :class:`~.models.title.TitleScrape`: An object containing the page's information.
+        """
+
+        # Find every section of the page in a single pass
+        sections = defaultdict(list)
+        for section_node in tree.css(_TITLE_SECTIONS_SELECTOR):
+            section = _get_title_section(section_node)
+            if section is not None:
+                sections[section].append(section_node)
+
+        fields = {}
+        for section, _ in _TITLE_SECTIONS:
+            fields.update(self._extract_title_section(section, sections[section], title_id))
+        return TitleScrape(title_id=title_id, taglines=taglines if taglines is not None else [], **fields)
+
+    def _extract_title_fields(self, tree, title_id, include_taglines, field):
+        """Scrapes the section of a title's IMDb web page containing a field, for a lazy title.
+
+        Only the section's own nodes are searched for, instead of every section of the page.
+
+        Args:
+            tree (:class:`HTMLTree`): The HTML tree of the title's page.
+            title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+            include_taglines (:obj:`bool`): Specify if the taglines should be requested.
+            field (:obj:`str`): The name of the accessed field.
+
+        Returns:
+            :obj:`dict`: The value of every field scraped from the section, by their name.
+
+        Raises:
+            HTTPError: If the taglines were requested and the request failed.
+        """
+
+        if field == 'taglines':
+            return {'taglines': self._get_taglines(title_id) if include_taglines else []}
+        section = _TITLE_FIELD_SECTIONS[field]
+        return self._extract_title_section(section, tree.css(dict(_TITLE_SECTIONS)[section]), title_id)
+
+    def _extract_title_section(self, section, section_nodes, title_id):
+        """Scrapes the fields of a section of a title's IMDb web page.
+
+        Args:
+            section (:obj:`str`): The name of the section (ex: `title_wrapper`).
+            section_nodes (:obj:`list` of :class:`Node`): The nodes of the section, in the order of the page.
+            title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+
+        Returns:
+            :obj:`dict`: The value of every field scraped from the section, by their name.
+        """
+
+        section_node = next(iter(section_nodes), None)
 
         # Get title text
-        title_node = tree.css_first('div.title_wrapper')
-        if title_node:
-            display_title_node = title_node.css_first('h1')
-            if display_title_node:
-                # Remove title year
-                title_year_node = display_title_node.css_first('span#titleYear')
-                if title_year_node:
-                    title_year_node.decompose()
-                display_title = display_title_node.text().strip()
-            title_info_node = title_node.css_first('div.subtext')
-            if title_info_node:
-                # If this is a TV series, get the year the show ended
-                for link_node in title_info_node.css('a'):
-                    if 'href' in link_node.attributes and 'releaseinfo' in link_node.attributes['href']:
-                        series_dates_match = re.search(r'[\d]{4}[-–][\d]{4}', link_node.text())
-                        if series_dates_match:
-                            end_year_split = re.sub(r'[-–]', '\t', series_dates_match.group(0)).split('\t')
-                            if len(end_year_split) > 1:
-                                end_year = end_year_split[1]
-                                break
-
-                # Get MPAA Rating
-                title_info_node.strip_tags(['span', 'a', 'time'])
-                rating = re.sub(r'(\s|,)*', '', title_info_node.text()).strip()
+        if section == 'title_wrapper':
+            display_title = None
+            end_year = None
+            rating = None
+            if section_node:
+                display_title_node = section_node.css_first('h1')
+                if display_title_node:
+                    # Remove title year
+                    title_year_node = display_title_node.css_first('span#titleYear')
+                    if title_year_node:
+                        title_year_node.decompose()
+                    display_title = display_title_node.text().strip()
+                title_info_node = section_node.css_first('div.subtext')
+                if title_info_node:
+                    # If this is a TV series, get the year the show ended
+                    for link_node in title_info_node.css('a'):
+                        if 'href' in link_node.attributes and 'releaseinfo' in link_node.attributes['href']:
+                            series_dates_match = SERIES_DATES_PATTERN.search(link_node.text())
+                            if series_dates_match:
+                                end_year_split = YEAR_SEPARATOR_PATTERN.split(series_dates_match.group(0))
+                                if len(end_year_split) > 1:
+                                    end_year = end_year_split[1]
+                                    break
+
+                    # Get MPAA Rating
+                    title_info_node.strip_tags(['span', 'a', 'time'])
+                    rating = RATING_SEPARATOR_PATTERN.sub('', title_info_node.text()).strip()
+            return {'display_title': display_title, 'end_year': end_year, 'mpaa_rating': rating}
 
         # Get title parent (if TV episode)
-        title_parent_node = tree.css_first('div.titleParent > a')
-        if title_parent_node:
-            title_parent_id = get_title_id(title_parent_node)
+        if section == 'title_parent':
+            return {'title_parent_id': get_title_id(section_node) if section_node else None}
 
         # Get plot
-        plot_node = tree.css_first('div.summary_text')
-        if plot_node:
-            plot = plot_node.text().strip()
+        if section == 'summary_text':
+            return {'plot': section_node.text().strip() if section_node else None}
 
         # Get storyline
-        storyline_node = tree.css_first('div#titleStoryLine')
-        if storyline_node:
-            storyline_node = storyline_node.css_first('div > p > span')
-            if storyline_node:
-                storyline = storyline_node.text().strip()
-
-        # Get taglines
-        if include_taglines:
-            tagline_request = f'https://www.imdb.com/title/{title_id}/taglines'
-            tagline_tree = self._get_tree(tagline_request)
-            if not tagline_tree.css_first('div#no_content'):
-                for tagline_node in tagline_tree.css('div.soda'):
-                    # TODO: should a Tagline object be created that stores the note for each tagline separately?
-                    taglines.append(tagline_node.text().strip())
+        if section == 'storyline':
+            storyline = None
+            if section_node:
+                storyline_node = section_node.css_first('div > p > span')
+                if storyline_node:
+                    storyline = storyline_node.text().strip()
+            return {'storyline': storyline}
 
         # Parse through text blocks
-        text_block_nodes = tree.css('div#titleDetails > div.txt-block')
-        for text_block_node in text_block_nodes:
-            text_block_id = text_block_node.css_first('h4.inline')
-            if text_block_id:
-                text_block_id = text_block_id.text().lower().strip()
-                text_block_text = text_block_node.text()
-                if 'country' in text_block_id:
-                    country_node = text_block_node.css_first('a')
-                    if country_node:
-                        country = country_node.text().strip()
-                elif 'language' in text_block_id:
-                    language_node = text_block_node.css_first('a')
-                    if language_node:
-                        language = language_node.text().strip()
-                elif 'release date' in text_block_id:
-                    release_date_match = re.search(r'\d+?\s*\w+?\s*[\d]{4}', text_block_text)
-                    if release_date_match:
-                        release_date = release_date_match.group(0)
-                elif 'production co' in text_block_id:
-                    companies = text_block_node.css('a')
-                    for company in companies:
-                        company_id = get_company_id(company)
-                        if company_id:
-                            production_companies.append(company_id)
+        if section == 'txt-block':
+            details = extract_labeled_fields('title_details', self._get_labeled_rows(section_nodes, 'h4.inline'))
+            return {
+                'country': details.get('country'),
+                'language': details.get('language'),
+                'release_date': details.get('release_date'),
+                'production_companies': details.get('production_companies', []),
                 # Box office info
-                elif 'budget' in text_block_id:
-                    if is_money_string(text_block_text):
-                        budget = trim_money_string(text_block_text)
-                        budget_denomination = get_denomination(text_block_text)
-                elif 'opening weekend' in text_block_id:
-                    if is_money_string(text_block_text):
-                        opening_weekend_gross = trim_money_string(text_block_text)
-                    opening_weekend_date_node = text_block_node.css_first('span')
-                    if opening_weekend_date_node:
-                        opening_weekend_date = opening_weekend_date_node.text().strip()
-                elif 'gross usa' in text_block_id:
-                    if is_money_string(text_block_text):
-                        usa_gross = trim_money_string(text_block_text)
-                elif 'worldwide gross' in text_block_id:
-                    if is_money_string(text_block_text):
-                        worldwide_gross = trim_money_string(text_block_text)
+                'budget': details.get('budget'),
+                'budget_denomination': details.get('budget_denomination'),
+                'opening_weekend_gross': details.get('opening_weekend_gross'),
+                'opening_weekend_date': details.get('opening_weekend_date'),
+                'usa_gross': details.get('usa_gross'),
+                'worldwide_gross': details.get('worldwide_gross'),
+            }
 
         # Get top cast members
-        cast_node = tree.css_first('table.cast_list')
-        if cast_node:
-            for cast_member in cast_node.css('tr.odd, tr.even'):
-                cast_member_node = cast_member.css_first('td:nth-of-type(2) > a')
-                if cast_member_node:
-                    character_credit = None
-                    episode_count = None
-                    episode_year_start = None
-                    episode_year_end = None
-                    character_node = cast_member.css_first('td.character')
-                    if character_node:
-                        # Check if there is episode information, save it, then remove it
-                        episode_info_node = character_node.css_first('a.toggle-episodes')
-                        if episode_info_node:
-                            episode_count, episode_year_start, episode_year_end = get_episode_info(episode_info_node)
-                            episode_info_node.decompose()
-                        character_credit = re.sub(r'\s+', ' ', character_node.text().strip())
-                    top_cast.append(
-                        CreditScrape(
-                            name_id=get_name_id(cast_member_node),
-                            title_id=title_id,
-                            job_title=ACTOR,
-                            credit=character_credit,
-                            episode_count=episode_count,
-                            episode_year_start=episode_year_start,
-                            episode_year_end=episode_year_end
-                    ))
+        if section == 'cast_list':
+            top_cast = []
+            if section_node:
+                # Filter rows by class instead of selecting 'tr.odd, tr.even', which some parsers group by selector
+                for cast_member in section_node.css('tr'):
+                    if not {'odd', 'even'} & set((cast_member.attributes.get('class') or '').split()):
+                        continue
+                    cast_member_node = cast_member.css_first('td:nth-of-type(2) > a')
+                    if cast_member_node:
+                        character_credit = None
+                        episode_count = None
+                        episode_year_start = None
+                        episode_year_end = None
+                        character_node = cast_member.css_first('td.character')
+                        if character_node:
+                            # Check if there is episode information, save it, then remove it
+                            episode_info_node = character_node.css_first('a.toggle-episodes')
+                            if episode_info_node:
+                                episode_count, episode_year_start, episode_year_end = \
+                                    get_episode_info(episode_info_node)
+                                episode_info_node.decompose()
+                            character_credit = WHITESPACE_PATTERN.sub(' ', character_node.text().strip())
+                        top_cast.append(
+                            CreditScrape(
+                                name_id=get_name_id(cast_member_node),
+                                title_id=title_id,
+                                job_title=ACTOR,
+                                credit=character_credit,
+                                episode_count=episode_count,
+                                episode_year_start=episode_year_start,
+                                episode_year_end=episode_year_end
+                        ))
+            return {'top_cast': top_cast}
 
         # Get season and episode numbers if TV episode
-        heading_nodes = tree.css('div.bp_heading')
-        for heading_node in heading_nodes:
-            if 'Season' in heading_node.text():
-                heading_node_text = heading_node.text().lower()
-                season_number_match = re.search(r'season\s*\d+', heading_node_text)
+        season_number = None
+        episode_number = None
+        for heading_node in section_nodes:
+            heading_node_text = heading_node.text()
+            if 'Season' in heading_node_text:
+                heading_node_text = heading_node_text.lower()
+                season_number_match = SEASON_NUMBER_PATTERN.search(heading_node_text)
                 if season_number_match:
-                    season_number_match = re.search(r'\d+', season_number_match.group(0))
+                    season_number_match = DIGITS_PATTERN.search(season_number_match.group(0))
                     if season_number_match:
                         season_number = season_number_match.group(0)
-                episode_number_match = re.search(r'episode\s*\d+', heading_node_text)
+                episode_number_match = EPISODE_NUMBER_PATTERN.search(heading_node_text)
                 if episode_number_match:
-                    episode_number_match = re.search(r'\d+', episode_number_match.group(0))
+                    episode_number_match = DIGITS_PATTERN.search(episode_number_match.group(0))
                     if episode_number_match:
                         episode_number = episode_number_match.group(0)
+        return {'season_number': season_number, 'episode_number': episode_number}
 
-        return TitleScrape(
-            title_id=title_id,
-            display_title=display_title,
-            title_parent_id=title_parent_id,
-            mpaa_rating=rating,
-            country=country,
-            language=language,
-            release_date=release_date,
-            end_year=end_year,
-            season_number=season_number,
-            episode_number=episode_number,
-            taglines=taglines,
-            plot=plot,
-            storyline=storyline,
-            production_companies=production_companies,
-            top_cast=top_cast,
-            budget=budget,
-            budget_denomination=budget_denomination,
-            opening_weekend_gross=opening_weekend_gross,
-            opening_weekend_date=opening_weekend_date,
-            usa_gross=usa_gross,
-            worldwide_gross=worldwide_gross
-        )
-
-    def get_full_cast(self, title_id, include_episodes=False):
+    def get_full_cast(self, title_id, include_episodes=False, stream=False):
         """Scrapes the full cast of actors for a specified title.
 
         Will scrape the full cast of actors for a title, each into their own `CreditScrape` object.
         An optional argument `include_episodes` will also scrape each episode an actor is in
         if the title is a TV series.
 
+        An optional argument `stream` scrapes each actor as soon as their row of the page is
+        received, instead of once the whole page is, and stops receiving the page after the cast
+        list or once iteration stops. See :meth:`_iter_row_batches` for how episodes are requested.
+
         Args:
             title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
             include_episodes (:obj:`bool`, optional): Specify if individual episodes of a 
                 TV series should also be scraped.
+            stream (:obj:`bool`, optional): Specify if the page should be scraped as it is received.
 
         Yields:
             :class:`~.models.title.CreditScrape`: An object for each cast member in the title.
@@ -290,9 +585,73 @@ class PyMDbScraper:
         """
 
         request = f'https://www.imdb.com/title/{title_id}/fullcredits'
+        if stream:
+            chunks = self._iter_text(request)
+            try:
+                cast_nodes = (
+                    HTMLParser(f'<table>{fragment}</table>').css_first('tr') for fragment in _iter_fragments(
+                        chunks, CAST_ROW_PATTERN, CAST_LIST_START_PATTERN, CAST_LIST_END_PATTERN
+                    )
+                )
+                yield from self._iter_row_batches(
+                    cast_nodes, partial(self._extract_cast_rows, title_id=title_id, include_episodes=include_episodes),
+                    include_episodes
+                )
+            finally:
+                chunks.close()
+            return None
+
         tree = self._get_tree(request)
+        yield from self._extract_full_cast(tree, title_id, include_episodes)
+
+    def _extract_full_cast(self, tree, title_id, include_episodes=False):
+        """Scrapes the full cast of actors from a title's full credits page.
+
+        Args:
+            tree (:class:`HTMLTree`): The HTML tree of the title's full credits page.
+            title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+            include_episodes (:obj:`bool`, optional): Specify if individual episodes of a
+                TV series should also be scraped, which requires an extra request per actor.
+
+        Yields:
+            :class:`~.models.title.CreditScrape`: An object for each cast member in the title.
+
+        Raises:
+            HTTPError: If a request failed.
+        """
 
         cast_node = tree.css_first('table.cast_list').css('tr')
+        yield from self._extract_cast_rows(cast_node, title_id, include_episodes)
+
+    def _extract_cast_rows(self, cast_node, title_id, include_episodes=False):
+        """Scrapes the actors in rows of the cast list on a title's full credits page.
+
+        Args:
+            cast_node (:obj:`list` of :class:`Node`): The rows of the cast list.
+            title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+            include_episodes (:obj:`bool`, optional): Specify if individual episodes of a
+                TV series should also be scraped, which requires an extra request per actor.
+
+        Yields:
+            :class:`~.models.title.CreditScrape`: An object for each cast member in the rows.
+
+        Raises:
+            HTTPError: If a request failed.
+        """
+
+        # Request the episodes of every actor at once, before any credits are yielded
+        episode_trees = {}
+        if include_episodes:
+            episode_requests = []
+            for cast_member in cast_node:
+                actor_node = cast_member.css_first('td.primary_photo + td > a')
+                toggle_episodes_node = cast_member.css_first('a.toggle-episodes')
+                if actor_node and toggle_episodes_node:
+                    episode_requests.append(
+                        self._get_cast_episodes_request(title_id, get_name_id(actor_node), toggle_episodes_node)
+                    )
+            episode_trees = self._get_trees(episode_requests)
+
         for cast_member in cast_node:
             actor_node = cast_member.css_first('td.primary_photo + td > a')
             if actor_node:
@@ -309,10 +668,10 @@ class PyMDbScraper:
                 
                     # Include all individual episodes an actor is in
                     if include_episodes:
-                        ref_marker = get_ref_marker(toggle_episodes_node)
-                        request = f'https://www.imdb.com/name/{name_id}/episodes/_ajax?title={title_id}' + \
-                                  f'&category=actor&ref_marker={ref_marker}&start_index=0'
-                        episodes_tree = self._get_tree(request)
+                        request = self._get_cast_episodes_request(title_id, name_id, toggle_episodes_node)
+                        episodes_tree = episode_trees[request]
+                        if isinstance(episodes_tree, Exception):
+                            raise episodes_tree
 
                         episode_nodes = episodes_tree.css('div.filmo-episodes')
                         for episode_node in episode_nodes:
@@ -327,7 +686,7 @@ class PyMDbScraper:
                             else:
                                 episode_year_info, = episode_info
 
-                            episode_year_match = re.search(r'\([\d]{4}\)', episode_year_info)
+                            episode_year_match = PARENTHESIZED_YEAR_PATTERN.search(episode_year_info)
                             if episode_year_match:
                                 episode_year = episode_year_match.group(0).strip('()')
 
@@ -348,7 +707,7 @@ class PyMDbScraper:
                 # Get the actor's credits
                 character_node = cast_member.css_first('td.character')
                 if character_node:
-                    credit = re.sub(r'(\s|\r|\n)+', ' ', character_node.text().strip())
+                    credit = WHITESPACE_PATTERN.sub(' ', character_node.text().strip())
 
                 yield CreditScrape(
                     name_id=name_id,
@@ -360,14 +719,36 @@ class PyMDbScraper:
                     episode_year_end=episode_year_end
                 )
 
-    def get_full_crew(self, title_id):
+    @staticmethod
+    def _get_cast_episodes_request(title_id, name_id, toggle_episodes_node):
+        """Builds the request for every episode of a TV series an actor is in.
+
+        Args:
+            title_id (:obj:`str`): The TV series' ID used by IMDb prefixed with `tt`.
+            name_id (:obj:`str`): The actor's ID used by IMDb prefixed with `nm`.
+            toggle_episodes_node (:class:`Node`): The actor's link toggling their episodes.
+
+        Returns:
+            :obj:`str`: The HTTP GET request.
+        """
+
+        ref_marker = get_ref_marker(toggle_episodes_node)
+        return f'https://www.imdb.com/name/{name_id}/episodes/_ajax?title={title_id}' + \
+               f'&category=actor&ref_marker={ref_marker}&start_index=0'
+
+    def get_full_crew(self, title_id, stream=False):
         """Scrapes the full list of credited crew people for a title, not including actors.
 
         Will scrape all the credited crew members of a title, without the actors. For example, this will
         include all directors, writers, producers, cinematographers, etc.
 
+        An optional argument `stream` scrapes each job's crew members as soon as their section of
+        the page is received, instead of once the whole page is, and stops receiving the page
+        once iteration stops.
+
         Args:
             title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+            stream (:obj:`bool`, optional): Specify if the page should be scraped as it is received.
 
         Yields:
             :class:`~.models.title.CreditScrape`: An object for each credited crew member in the title.
@@ -377,7 +758,29 @@ class PyMDbScraper:
         """
 
         request = f'https://www.imdb.com/title/{title_id}/fullcredits'
+        if stream:
+            chunks = self._iter_text(request)
+            try:
+                for fragment in _iter_fragments(chunks, CREDITS_HEADING_PATTERN):
+                    section_tree = HTMLParser(f'<div id="fullcredits_content">{fragment}</div>')
+                    yield from self._extract_full_crew(section_tree, title_id)
+            finally:
+                chunks.close()
+            return None
+
         tree = self._get_tree(request)
+        yield from self._extract_full_crew(tree, title_id)
+
+    def _extract_full_crew(self, tree, title_id):
+        """Scrapes the full list of credited crew people from a title's full credits page.
+
+        Args:
+            tree (:class:`HTMLTree`): The HTML tree of the title's full credits page.
+            title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+
+        Yields:
+            :class:`~.models.title.CreditScrape`: An object for each credited crew member in the title.
+        """
 
         credits_node = tree.css_first('div#fullcredits_content')
         if credits_node:
@@ -394,7 +797,7 @@ class PyMDbScraper:
                         if len(title) > 0:
                             found_title = True
                             curr_title = title.lower()
-                            curr_title = re.sub(r'series', '', curr_title).strip()
+                            curr_title = SERIES_PATTERN.sub('', curr_title).strip()
                             if curr_title in _CREDIT_MAPPINGS:
                                 curr_title = _CREDIT_MAPPINGS[curr_title]
                             else:
@@ -415,24 +818,22 @@ class PyMDbScraper:
                                 if credit_node:
                                     credit = credit_node.text().strip()
                                     # Grab episode count and years if TV series
-                                    episode_details_regex = r'\(\d+\s*episodes?,\s*\d{4}(-\d{4})?\)'
-                                    episode_details_match = re.search(episode_details_regex, credit)
+                                    episode_details_match = EPISODE_DETAILS_PATTERN.search(credit)
                                     if episode_details_match:
                                         episode_count_details, episode_year_details = episode_details_match.group(0).strip('()').split(',')
-                                        episode_count_match = re.search(r'\d+', episode_count_details)
+                                        episode_count_match = DIGITS_PATTERN.search(episode_count_details)
                                         if episode_count_match:
                                             episode_count = episode_count_match.group(0)
                                         episode_year_split = episode_year_details.strip().split('-')
                                         episode_year_start = episode_year_split[0]
                                         if len(episode_year_split) > 1:
                                             episode_year_end = episode_year_split[1]
-                                        credit = re.sub(episode_details_regex, '', credit).strip()
+                                        credit = EPISODE_DETAILS_PATTERN.sub('', credit).strip()
                                     # Strip ending 'and' for a credit
                                     if credit[-3:] == 'and':
                                         credit = credit[:-3].strip()
                                     # Remove surrounding parentheses
-                                    parentheses_match = re.search(r'^\(.*\)$', credit)
-                                    if parentheses_match:
+                                    if PARENTHESES_WRAPPED_PATTERN.search(credit):
                                         credit = credit.strip('()')
                                     # Final catch for empty credit
                                     if len(credit.strip()) == 0:
@@ -454,6 +855,7 @@ class PyMDbScraper:
 
         Will scrape all the cast and crew for a title by returning both
         :obj:`~.scraper.PyMDbScraper.get_full_cast` and :obj:`~.scraper.PyMDbScraper.get_full_crew` as a single generator.
+        The full credits page is only requested and parsed once for both.
         An optional argument `include_episodes` will also scrape each episode an actor is in
         if the title is a TV series.
 
@@ -469,9 +871,11 @@ class PyMDbScraper:
             HTTPError: If the request failed.
         """
 
-        for cast_member in self.get_full_cast(title_id, include_episodes=include_episodes):
+        request = f'https://www.imdb.com/title/{title_id}/fullcredits'
+        tree = self._get_tree(request)
+        for cast_member in self._extract_full_cast(tree, title_id, include_episodes=include_episodes):
             yield cast_member
-        for crew_member in self.get_full_crew(title_id):
+        for crew_member in self._extract_full_crew(tree, title_id):
             yield crew_member
 
     def get_full_credits_as_dict(self, title_id, include_episodes=False):
@@ -523,6 +927,26 @@ class PyMDbScraper:
         request = f'https://www.imdb.com/name/{name_id}/bio'
         tree = self._get_tree(request)
 
+        known_for_titles_tree = None
+        if include_known_for_titles:
+            known_for_titles_request = f'https://www.imdb.com/name/{name_id}/'
+            known_for_titles_tree = self._get_tree(known_for_titles_request)
+
+        return self._extract_name(tree, name_id, known_for_titles_tree)
+
+    def _extract_name(self, tree, name_id, known_for_titles_tree=None):
+        """Scrapes the information from a person's IMDb `bio` web page.
+
+        Args:
+            tree (:class:`HTMLTree`): The HTML tree of the person's `bio` page.
+            name_id (:obj:`str`): The person's ID used by IMDb prefixed with `nm`.
+            known_for_titles_tree (:class:`HTMLTree`, optional): The HTML tree of the person's default page,
+                to scrape the titles they are known for from.
+
+        Returns:
+            :class:`~.models.name.NameScrape`: An object with the person's information.
+        """
+
         display_name = None
         known_for_titles = []
         birth_date = None
@@ -542,46 +966,16 @@ class PyMDbScraper:
         if bio_node:
             overview_node = bio_node.css_first('table#overviewTable')
             if overview_node:
-                for row_node in overview_node.css('tr'):
-                    label_node = row_node.css_first('td.label')
-                    if label_node:
-                        label = label_node.text().lower().strip()
-                        if label == 'born':
-                            birth_date_node = row_node.css_first('td > time')
-                            if birth_date_node and 'datetime' in birth_date_node.attributes:
-                                birth_date = birth_date_node.attributes['datetime']
-                            birth_city_node = row_node.css_first('td > a')
-                            if birth_city_node:
-                                birth_city = birth_city_node.text().strip()
-                        elif label == 'died':
-                            death_date_node = row_node.css_first('td > time')
-                            if death_date_node and 'datetime' in death_date_node.attributes:
-                                death_date = death_date_node.attributes['datetime']
-                            death_city_node = row_node.css_first('td > a')
-                            if death_city_node:
-                                death_city = death_city_node.text().strip()
-                            death_cause_node = row_node.css_first('td ~ td')
-                            if death_cause_node:
-                                death_cause_match = re.search(r'\(.*\)', death_cause_node.text())
-                                if death_cause_match:
-                                    death_cause = death_cause_match.group(0).strip('()')
-                        elif label == 'birth name':
-                            birth_name_node = row_node.css_first('td ~ td')
-                            if birth_name_node:
-                                birth_name = birth_name_node.text().strip()
-                        elif label == 'nicknames':
-                            nicknames_node = row_node.css_first('td ~ td')
-                            if nicknames_node:
-                                nicknames = split_by_br(re.sub(r'</*td>', '', nicknames_node.html).strip())
-                        elif label == 'height':
-                            height_node = row_node.css_first('td ~ td')
-                            if height_node:
-                                height_match = re.search(r'\(\d+\.*\d*', height_node.text().strip())
-                                if height_match:
-                                    height = height_match.group(0).strip('(')
-        if include_known_for_titles:
-            known_for_titles_request = f'https://www.imdb.com/name/{name_id}/'
-            known_for_titles_tree = self._get_tree(known_for_titles_request)
+                bio = extract_labeled_fields('name_bio', self._get_labeled_rows(overview_node.css('tr'), 'td.label'))
+                birth_date = bio.get('birth_date')
+                birth_city = bio.get('birth_city')
+                death_date = bio.get('death_date')
+                death_city = bio.get('death_city')
+                death_cause = bio.get('death_cause')
+                birth_name = bio.get('birth_name')
+                nicknames = bio.get('nicknames', [])
+                height = bio.get('height')
+        if known_for_titles_tree is not None:
             known_for_titles_node = known_for_titles_tree.css_first('#knownfor, #knownfor-stacked')
             if known_for_titles_node:
                 for known_for_title_node in known_for_titles_node.css('.knownfor-title'):
@@ -603,7 +997,7 @@ class PyMDbScraper:
             height=height
         )
 
-    def get_name_credits(self, name_id, include_episodes=False):
+    def get_name_credits(self, name_id, include_episodes=False, stream=False):
         """Scrapes all title credits a person is included in.
 
         Scrapes the `full filmography` from a person's IMDb page to get each
@@ -612,10 +1006,15 @@ class PyMDbScraper:
         an actor is in if the title is a TV series. Each credit is created
         with a new `NameCreditScrape` object.
 
+        An optional argument `stream` scrapes each credit as soon as its row of the page is
+        received, instead of once the whole page is, and stops receiving the page once iteration
+        stops. See :meth:`_iter_row_batches` for how episodes are requested.
+
         Args:
             name_id (:obj:`str`): The person's ID used by IMDb prefixed with `nm`.
             include_episodes (:obj:`bool`, optional): Specify if individual episodes of a TV series
                 should also be scraped.
+            stream (:obj:`bool`, optional): Specify if the page should be scraped as it is received.
 
         Yields: 
             :class:`~.models.name.NameCreditScrape`: An object for each credit in the person's filmography.
@@ -625,13 +1024,73 @@ class PyMDbScraper:
         """
 
         request = f'https://www.imdb.com/name/{name_id}/'
+        if stream:
+            chunks = self._iter_text(request)
+            try:
+                row_nodes = (
+                    HTMLParser(fragment).css_first('div.filmo-row')
+                    for fragment in _iter_fragments(chunks, FILMOGRAPHY_ROW_PATTERN)
+                )
+                yield from self._iter_row_batches(
+                    row_nodes, partial(self._extract_name_credit_rows, name_id=name_id,
+                                       include_episodes=include_episodes),
+                    include_episodes
+                )
+            finally:
+                chunks.close()
+            return None
+
         tree = self._get_tree(request)
-        
+        yield from self._extract_name_credits(tree, name_id, include_episodes=include_episodes)
+
+    def _extract_name_credits(self, tree, name_id, include_episodes=False):
+        """Scrapes each credit in the filmography of a person's default IMDb web page.
+
+        Args:
+            tree (:class:`HTMLTree`): The HTML tree of the person's default page.
+            name_id (:obj:`str`): The person's ID used by IMDb prefixed with `nm`.
+            include_episodes (:obj:`bool`, optional): Specify if individual episodes of a TV series
+                should also be scraped, which requires an extra request per TV series with hidden episodes.
+
+        Yields:
+            :class:`~.models.name.NameCreditScrape`: An object for each credit in the person's filmography.
+
+        Raises:
+            HTTPError: If a request failed.
+        """
+
         filmography_node = tree.css_first('div#filmography')
         if not filmography_node:
             return None
+        yield from self._extract_name_credit_rows(filmography_node.css('div.filmo-row'), name_id, include_episodes)
+
+    def _extract_name_credit_rows(self, row_nodes, name_id, include_episodes=False):
+        """Scrapes the credits in rows of the filmography on a person's default IMDb web page.
+
+        Args:
+            row_nodes (:obj:`list` of :class:`Node`): The rows of the filmography.
+            name_id (:obj:`str`): The person's ID used by IMDb prefixed with `nm`.
+            include_episodes (:obj:`bool`, optional): Specify if individual episodes of a TV series
+                should also be scraped, which requires an extra request per TV series with hidden episodes.
+
+        Yields:
+            :class:`~.models.name.NameCreditScrape`: An object for each credit in the rows.
+
+        Raises:
+            HTTPError: If a request failed.
+        """
 
-        for row_node in filmography_node.css('div.filmo-row'):
+        # Request the episodes of every TV series at once, before any credits are yielded
+        episode_trees = {}
+        if include_episodes:
+            episode_requests = []
+            for row_node in row_nodes:
+                more_episodes_node = self._get_more_episodes_node(row_node)
+                if more_episodes_node and len(split_by_br(row_node.html)) > 1:
+                    episode_requests.append(self._get_name_episodes_request(name_id, row_node, more_episodes_node))
+            episode_trees = self._get_trees(episode_requests)
+
+        for row_node in row_nodes:
             category, title_id = row_node.id.split('-')
             category = '_'.join(category.split()).lower()
             start_year = None
@@ -649,27 +1108,22 @@ class PyMDbScraper:
             info = split_by_br(row_node.html)
             if len(info) > 1:
                 title_info, role = info
-                role = re.sub(r'<.*?>', '', remove_tags_and_content(role, 'div')).strip()
+                role = TAG_PATTERN.sub('', remove_tags_and_content(role, 'div')).strip()
                 if include_episodes and row_node.css_first('div.filmo-episodes'):
-                    # Send AJAX request if a "show all" link exists
-                    more_episodes_node = row_node.css_first(
-                        f'div#more-episodes-{title_id}-{category} ~ div.filmo-episodes'
-                    )
+                    # Use the AJAX request if a "show all" link exists
+                    more_episodes_node = self._get_more_episodes_node(row_node)
                     episode_nodes = row_node
                     if more_episodes_node:
-                        onclick_node = more_episodes_node.css_first('div > a')
-                        ref_marker = get_ref_marker(onclick_node)
-                        category_req = get_category(onclick_node)
-                        request = f'https://www.imdb.com/name/{name_id}/episodes/_ajax?title={title_id}' + \
-                                  f'&category={category_req}&ref_marker={ref_marker}&start_index=0'
-                        try:
-                            episode_nodes = self._get_tree(request)
-                        except requests.exceptions.HTTPError as e:
+                        request = self._get_name_episodes_request(name_id, row_node, more_episodes_node)
+                        episodes_tree = episode_trees[request]
+                        if isinstance(episodes_tree, requests.exceptions.HTTPError) and \
+                                episodes_tree.response is not None and episodes_tree.response.status_code == 404:
                             # Some AJAX calls seem to 404, so ignore them and remove the "show all" link
-                            if e.response.status_code == 404:
-                                more_episodes_node.decompose()
-                            else:
-                                raise e
+                            more_episodes_node.decompose()
+                        elif isinstance(episodes_tree, Exception):
+                            raise episodes_tree
+                        else:
+                            episode_nodes = episodes_tree
 
                     episode_nodes = episode_nodes.css('div.filmo-episodes')
                     for episode_node in episode_nodes:
@@ -687,7 +1141,7 @@ class PyMDbScraper:
                                 episode_role = None
                         else:
                             year_info, = episode_info
-                        year_info_match = re.search(r'\([\d]{4}\)', year_info)
+                        year_info_match = PARENTHESIZED_YEAR_PATTERN.search(year_info)
                         if year_info_match:
                             episode_year = year_info_match.group(0).strip('()')
 
@@ -702,8 +1156,8 @@ class PyMDbScraper:
                         )
             else:
                 title_info, = info
-            title_info = re.sub(r'(<\s*a.*?>|<.*?a\s*>)', '', title_info)
-            title_notes = [note.strip('()') for note in re.findall(r'\(.*?\)', title_info)]
+            title_info = LINK_TAG_PATTERN.sub('', title_info)
+            title_notes = [note.strip('()') for note in PARENTHESIZED_PATTERN.findall(title_info)]
             if role is not None and len(role) == 0:
                 role = None
 
@@ -717,6 +1171,43 @@ class PyMDbScraper:
                 title_notes=title_notes
             )
 
+    @staticmethod
+    def _get_more_episodes_node(row_node):
+        """Finds the "show all" episodes link of a TV series in a person's filmography.
+
+        Args:
+            row_node (:class:`Node`): The TV series' row in the filmography.
+
+        Returns:
+            :class:`Node`: The node containing the link, or `None` if every episode is already listed.
+        """
+
+        if not row_node.css_first('div.filmo-episodes'):
+            return None
+        category, title_id = row_node.id.split('-')
+        category = '_'.join(category.split()).lower()
+        return row_node.css_first(f'div#more-episodes-{title_id}-{category} ~ div.filmo-episodes')
+
+    @staticmethod
+    def _get_name_episodes_request(name_id, row_node, more_episodes_node):
+        """Builds the request for every episode of a TV series in a person's filmography.
+
+        Args:
+            name_id (:obj:`str`): The person's ID used by IMDb prefixed with `nm`.
+            row_node (:class:`Node`): The TV series' row in the filmography.
+            more_episodes_node (:class:`Node`): The node containing the "show all" episodes link.
+
+        Returns:
+            :obj:`str`: The HTTP GET request.
+        """
+
+        _, title_id = row_node.id.split('-')
+        onclick_node = more_episodes_node.css_first('div > a')
+        ref_marker = get_ref_marker(onclick_node)
+        category = get_category(onclick_node)
+        return f'https://www.imdb.com/name/{name_id}/episodes/_ajax?title={title_id}' + \
+               f'&category={category}&ref_marker={ref_marker}&start_index=0'
+
     def get_company(self, company_id):
         """Scrapes all titles a company is credited for on IMDb.
 
@@ -724,6 +1215,10 @@ class PyMDbScraper:
         in IMDb's `company search`. This only gives the year(s) the company was involved with
         each title and `notes` for each listed on IMDb.
 
+        The total amount of titles is read from the first page, so the following pages are
+        requested concurrently a few pages ahead of the titles being yielded. Titles are still
+        yielded in order, and no more pages are requested once iteration stops.
+
         Args:
             company_id (:obj:`str`): The company's ID used by IMDb prefixed with `co`.
 
@@ -735,72 +1230,134 @@ class PyMDbScraper:
             InvalidCompanyId: If an invalid company ID was given.
         """
 
-        index = 1
-        finding_titles = True
-        while finding_titles:
-            request = f'https://www.imdb.com/search/title/?companies={company_id}&view=simple&start={index}'
-            try:
-                tree = self._get_tree(request)
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 404:
-                    finding_titles = False
-                else:
-                    raise e
-            # Check if this was a valid company ID
-            company_title_node = tree.css_first('div.article > h1.header')
-            if company_title_node:
-                company_title = company_title_node.text().replace('(Sorted by Popularity Ascending)', '').strip()
-                if len(company_title) == 0:
-                    raise InvalidCompanyId(f'Invalid company ID: {company_id}')
-
-            title_list_node = tree.css_first('div.lister-list')
-            if not title_list_node:
-                finding_titles = False
+        tree = self._get_company_page(company_id, 1)
+        if tree is None:
+            return None
+
+        # Check if this was a valid company ID
+        company_title_node = tree.css_first('div.article > h1.header')
+        if company_title_node:
+            company_title = company_title_node.text().replace('(Sorted by Popularity Ascending)', '').strip()
+            if len(company_title) == 0:
+                raise InvalidCompanyId(f'Invalid company ID: {company_id}')
+
+        yield from self._extract_company_titles(tree, company_id)
+
+        title_count = self._get_company_title_count(tree)
+        if title_count is None:
+            # Fall back to requesting one page at a time until a page has no titles
+            index = 1
+            while tree is not None and tree.css_first('div.lister-list'):
+                index += _COMPANY_PAGE_SIZE
+                tree = self._get_company_page(company_id, index)
+                if tree is not None:
+                    yield from self._extract_company_titles(tree, company_id)
+        else:
+            indexes = range(1 + _COMPANY_PAGE_SIZE, title_count + 1, _COMPANY_PAGE_SIZE)
+            for tree in self._prefetch(partial(self._get_company_page, company_id), indexes):
+                if tree is None:
+                    break
+                yield from self._extract_company_titles(tree, company_id)
+
+    def _get_company_page(self, company_id, index):
+        """Requests a page of the titles a company is credited for.
+
+        Args:
+            company_id (:obj:`str`): The company's ID used by IMDb prefixed with `co`.
+            index (:obj:`int`): The position of the page's first title, starting from 1.
+
+        Returns:
+            :class:`HTMLTree`: The page's HTML tree, or `None` if the page was not found.
+
+        Raises:
+            HTTPError: If a request failed.
+        """
+
+        request = f'https://www.imdb.com/search/title/?companies={company_id}&view=simple&start={index}'
+        try:
+            return self._get_tree(request)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise e
+
+    @staticmethod
+    def _get_company_title_count(tree):
+        """Reads the total amount of titles a company is credited for from a page of its titles.
+
+        Args:
+            tree (:class:`HTMLTree`): The HTML tree of a page of the company's titles.
+
+        Returns:
+            :obj:`int`: The amount of titles, or `None` if the page does not list it.
+        """
+
+        # Listed as "1-50 of 20,123 titles." or "12 titles." for a single page
+        count_node = tree.css_first('div.desc > span')
+        if count_node:
+            count_match = TITLE_COUNT_PATTERN.search(count_node.text())
+            if count_match:
+                return int(count_match.group(1).replace(',', ''))
+        return None
+
+    def _extract_company_titles(self, tree, company_id):
+        """Scrapes the titles listed on a page of the titles a company is credited for.
+
+        Args:
+            tree (:class:`HTMLTree`): The HTML tree of a page of the company's titles.
+            company_id (:obj:`str`): The company's ID used by IMDb prefixed with `co`.
+
+        Yields:
+            :class:`~.models.company.CompanyScrape`: An object for each title listed on the page.
+        """
+
+        title_list_node = tree.css_first('div.lister-list')
+        if not title_list_node:
+            return None
+
+        for title_info_node in title_list_node.css('span.lister-item-header'):
+            title_id = None
+            start_year = None
+            end_year = None
+            notes = None
+
+            year_info_node = None
+            # Check if this is a TV episode
+            episode_node = title_info_node.css_first('small')
+            if episode_node and 'Episode' in episode_node.text():
+                episode_link_node = title_info_node.css_first('small ~ a')
+                title_id = get_title_id(episode_link_node)
+                year_info_node = title_info_node.css_first('small ~ a ~ span.lister-item-year')
             else:
-                for title_info_node in title_list_node.css('span.lister-item-header'):
-                    title_id = None
-                    start_year = None
-                    end_year = None
-                    notes = None
-
-                    year_info_node = None
-                    # Check if this is a TV episode
-                    episode_node = title_info_node.css_first('small')
-                    if episode_node and 'Episode' in episode_node.text():
-                        episode_link_node = title_info_node.css_first('small ~ a')
-                        title_id = get_title_id(episode_link_node)
-                        year_info_node = title_info_node.css_first('small ~ a ~ span.lister-item-year')
+                title_info_node = title_info_node.css_first('span.lister-item-index ~ span')
+                if title_info_node:
+                    title_link_node = title_info_node.css_first('a')
+                    title_id = get_title_id(title_link_node)
+                    year_info_node = title_info_node.css_first('span.lister-item-year')
+
+            if year_info_node:
+                year_info_text = year_info_node.text().strip('()')
+                years_match = YEAR_RANGE_PATTERN.search(year_info_text)
+                notes_match = NOTES_PATTERN.search(year_info_text)
+                if years_match:
+                    year_info = YEAR_RANGE_SEPARATOR_PATTERN.split(years_match.group(0))
+                    if len(year_info) > 1:
+                        start_year, end_year = year_info
+                        # Handle shows that are still on-air (ex: '2005- ')
+                        if len(end_year.strip()) == 0:
+                            end_year = None
                     else:
-                        title_info_node = title_info_node.css_first('span.lister-item-index ~ span')
-                        if title_info_node:
-                            title_link_node = title_info_node.css_first('a')
-                            title_id = get_title_id(title_link_node)
-                            year_info_node = title_info_node.css_first('span.lister-item-year')
-
-                    if year_info_node:
-                        year_info_text = year_info_node.text().strip('()')
-                        years_match = re.search(r'(\d|–|-)+', year_info_text)
-                        notes_match = re.search(r'([A-Za-z]+\s*)+', year_info_text)
-                        if years_match:
-                            year_info = re.sub(r'[–\-]+', '\t', years_match.group(0)).split('\t')
-                            if len(year_info) > 1:
-                                start_year, end_year = year_info
-                                # Handle shows that are still on-air (ex: '2005- ')
-                                if len(end_year.strip()) == 0:
-                                    end_year = None
-                            else:
-                                start_year, = year_info
-                        if notes_match:
-                            notes = notes_match.group(0)
+                        start_year, = year_info
+                if notes_match:
+                    notes = notes_match.group(0)
 
-                    yield CompanyScrape(
-                        company_id=company_id,
-                        title_id=title_id,
-                        start_year=start_year,
-                        end_year=end_year,
-                        notes=notes
-                    )
-            index += 50
+            yield CompanyScrape(
+                company_id=company_id,
+                title_id=title_id,
+                start_year=start_year,
+                end_year=end_year,
+                notes=notes
+            )
 
     def get_company_credits(self, title_id):
         """Gets all companies credited for a title.
@@ -820,6 +1377,18 @@ class PyMDbScraper:
 
         request = f'https://www.imdb.com/title/{title_id}/companycredits'
         tree = self._get_tree(request)
+        yield from self._extract_company_credits(tree, title_id)
+
+    def _extract_company_credits(self, tree, title_id):
+        """Scrapes each company credited on a title's company credits web page.
+
+        Args:
+            tree (:class:`HTMLTree`): The HTML tree of the title's company credits page.
+            title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+
+        Yields:
+            :class:`~.models.company.CompanyCreditScrape`: An object for each company.
+        """
 
         credits_content_node = tree.css_first('div#company_credits_content')
         if credits_content_node:
@@ -830,7 +1399,7 @@ class PyMDbScraper:
                 for company_node in company_nodes:
                     company_id = None
                     company_name = None
-                    notes = [note.strip('()') for note in re.findall(r'\(.*?\)', company_node.text())]
+                    notes = [note.strip('()') for note in PARENTHESIZED_PATTERN.findall(company_node.text())]
 
                     # Get company id and name
                     link_node = company_node.css_first('a')
@@ -865,6 +1434,18 @@ class PyMDbScraper:
 
         request = f'https://www.imdb.com/title/{title_id}/technical/'
         tree = self._get_tree(request)
+        return self._extract_tech_specs(tree, title_id)
+
+    def _extract_tech_specs(self, tree, title_id):
+        """Scrapes the technical specifications from a title's `technical` web page.
+
+        Args:
+            tree (:class:`HTMLTree`): The HTML tree of the title's `technical` page.
+            title_id (:obj:`str`): The title's ID used by IMDb prefixed with `tt`.
+
+        Returns:
+            :class:`~.models.title.TitleTechSpecScrape`: An object containing the information.
+        """
 
         runtime = None
         sound_mix = []
@@ -878,48 +1459,20 @@ class PyMDbScraper:
 
         tech_content_node = tree.css_first('div#technical_content')
         if tech_content_node:
-            for tech_spec_node in tech_content_node.css('tr.even, tr.odd'):
-                label_node = tech_spec_node.css_first('td.label')
-                content_node = tech_spec_node.css_first('td.label ~ td')
-                if label_node and content_node:
-                    label = label_node.text().lower().strip()
-                    if 'runtime' in label:
-                        runtime_regex = r'\d+.*min'
-                        content_node_text = content_node.text()
-                        if '(' in content_node_text:
-                            runtime_regex = rf'\({runtime_regex}\)'
-                        runtime_match = re.search(runtime_regex, content_node_text)
-                        if runtime_match:
-                            runtime = re.sub(r'[()\smin]+', '', runtime_match.group(0))
-                    elif 'sound mix' in label:
-                        sound_mix = [
-                            sound.strip() for sound in re.sub(r'\s+', ' ', content_node.text().strip()).split('|')
-                        ]
-                    elif 'color' in label:
-                        color = re.sub(r'\s+', ' ', content_node.text().strip())
-                    elif 'aspect' in label:
-                        aspect_ratio = [
-                            asp.strip() for asp in split_by_br(
-                                re.sub(r'\s+', ' ', remove_tags(content_node.html, 'td')))
-                        ]
-                    elif 'camera' in label:
-                        camera = [
-                            cam.strip() for cam in re.sub(r'(and|,)', '\t', content_node.text().strip()).split('\t')
-                        ]
-                    elif 'laboratory' in label:
-                        laboratory = [
-                            lab.strip() for lab in split_by_br(
-                                re.sub(r'\s+', ' ', remove_tags(content_node.html, 'td')))
-                        ]
-                    elif 'negative' in label:
-                        negative_format = content_node.text().strip()
-                    elif 'cinematographic' in label:
-                        cinematographic_process = [
-                            cin.strip() for cin in split_by_br(
-                                re.sub(r'\s+', ' ', remove_tags(content_node.html, 'td')))
-                        ]
-                    elif 'printed film' in label:
-                        printed_film_format = re.sub(r'\s+', ' ', content_node.text().strip())
+            tech_specs = extract_labeled_fields('tech_specs', (
+                (label, content_node) for label, row_node in self._get_labeled_rows(
+                    tech_content_node.css('tr.even, tr.odd'), 'td.label'
+                ) for content_node in (row_node.css_first('td.label ~ td'),) if content_node
+            ))
+            runtime = tech_specs.get('runtime')
+            sound_mix = tech_specs.get('sound_mix', [])
+            color = tech_specs.get('color')
+            aspect_ratio = tech_specs.get('aspect_ratio', [])
+            camera = tech_specs.get('camera', [])
+            laboratory = tech_specs.get('laboratory', [])
+            negative_format = tech_specs.get('negative_format')
+            cinematographic_process = tech_specs.get('cinematographic_process', [])
+            printed_film_format = tech_specs.get('printed_film_format')
 
         return TitleTechSpecsScrape(
             title_id=title_id,
@@ -934,6 +1487,23 @@ class PyMDbScraper:
             printed_film_format=printed_film_format
         )
 
+    @staticmethod
+    def _get_labeled_rows(row_nodes, label_selector):
+        """Pairs each row of a labeled section with its lowercase label, skipping rows without one.
+
+        Args:
+            row_nodes (:obj:`list` of :class:`Node`): The section's rows.
+            label_selector (:obj:`str`): The CSS selector of the label within each row.
+
+        Yields:
+            (:obj:`str`, :class:`Node`): The label and node of each row.
+        """
+
+        for row_node in row_nodes:
+            label_node = row_node.css_first(label_selector)
+            if label_node:
+                yield label_node.text().lower().strip(), row_node
+
     def get_search_results(self, keyword):
         """Gets search results for a given keyword.
 
@@ -960,10 +1530,7 @@ class PyMDbScraper:
             if len(keyword) > 20:
                 keyword = keyword[:20]
             request = f'https://v2.sg.media-imdb.com/suggestion/{keyword[0]}/{keyword}.json'
-            time.sleep(self._rate_limit / 1000)
-            response = requests.get(request, headers=self._headers)
-            response.raise_for_status()
-            response_data = json.loads(response.text)
+            response_data = json.loads(self._get(request))
             if 'd' in response_data:
                 for result in response_data['d']:
                     imdb_id = result['id']
@@ -1002,11 +1569,353 @@ class PyMDbScraper:
             return search_results
         return []
 
-    def _get_tree(self, request):
+    def get_titles(self, title_ids, include_taglines=False, max_workers=4, checkpoint_path=None):
+        """Scrapes the IMDb web pages of many titles concurrently.
+
+        See :meth:`get_title` for the information scraped and :meth:`_scrape_many` for how
+        the pages are scraped.
+
+        Args:
+            title_ids (:obj:`iterable` of :obj:`str`): The titles' IDs used by IMDb prefixed with `tt`.
+            include_taglines (:obj:`bool`, optional): Specify if an extra request should be
+                made to get all the taglines for each title.
+            max_workers (:obj:`int`, optional): The amount of titles scraped at once.
+            checkpoint_path (:obj:`str`, optional): The system path to a file recording each title scraped
+                successfully, so an interrupted batch can be resumed.
+
+        Yields:
+            :class:`~.models.batch.ScrapeResult`: The :class:`~.models.title.TitleScrape` or error of each
+                title, in the order they finish.
+        """
+
+        yield from self._scrape_many(lambda title_id: self.get_title(title_id, include_taglines), title_ids,
+                                     max_workers, checkpoint_path)
+
+    def get_names(self, name_ids, include_known_for_titles=False, max_workers=4, checkpoint_path=None):
+        """Scrapes the IMDb web pages of many people concurrently.
+
+        See :meth:`get_name` for the information scraped and :meth:`_scrape_many` for how
+        the pages are scraped.
+
+        Args:
+            name_ids (:obj:`iterable` of :obj:`str`): The persons' IDs used by IMDb prefixed with `nm`.
+            include_known_for_titles (:obj:`bool`, optional): Specify if an extra request should be
+                made to get the titles each person is known for.
+            max_workers (:obj:`int`, optional): The amount of people scraped at once.
+            checkpoint_path (:obj:`str`, optional): The system path to a file recording each person scraped
+                successfully, so an interrupted batch can be resumed.
+
+        Yields:
+            :class:`~.models.batch.ScrapeResult`: The :class:`~.models.name.NameScrape` or error of each
+                person, in the order they finish.
+        """
+
+        yield from self._scrape_many(lambda name_id: self.get_name(name_id, include_known_for_titles), name_ids,
+                                     max_workers, checkpoint_path)
+
+    def get_tech_specs_many(self, title_ids, max_workers=4, checkpoint_path=None):
+        """Scrapes the technical specifications of many titles concurrently.
+
+        See :meth:`get_tech_specs` for the information scraped and :meth:`_scrape_many` for how
+        the pages are scraped.
+
+        Args:
+            title_ids (:obj:`iterable` of :obj:`str`): The titles' IDs used by IMDb prefixed with `tt`.
+            max_workers (:obj:`int`, optional): The amount of titles scraped at once.
+            checkpoint_path (:obj:`str`, optional): The system path to a file recording each title scraped
+                successfully, so an interrupted batch can be resumed.
+
+        Yields:
+            :class:`~.models.batch.ScrapeResult`: The :class:`~.models.title.TitleTechSpecsScrape` or error
+                of each title, in the order they finish.
+        """
+
+        yield from self._scrape_many(self.get_tech_specs, title_ids, max_workers, checkpoint_path)
+
+    def scrape_page(self, url, html):
+        """Scrapes the information from an IMDb web page that was already downloaded.
+
+        The kind of page is determined from its URL, and the page is scraped the same way as by the
+        method requesting it, without sending any request. Supported pages are a title's main page
+        (:meth:`get_title`), full credits (:meth:`get_full_credits`), company credits
+        (:meth:`get_company_credits`) and technical (:meth:`get_tech_specs`) pages, a person's
+        `bio` (:meth:`get_name`) and default (:meth:`get_name_credits`) pages, and a page of the
+        titles a company is credited for (:meth:`get_company`). Taglines, known for titles and
+        individual episodes are not scraped since they are listed on other pages.
+
+        Args:
+            url (:obj:`str`): The page's URL.
+            html (:obj:`str`): The page's HTML.
+
+        Returns:
+            The page's :class:`~.models.title.TitleScrape`, :class:`~.models.title.TitleTechSpecsScrape` or
+                :class:`~.models.name.NameScrape`, or a :obj:`list` of the scraped objects for pages listing
+                many credits or titles.
+
+        Raises:
+            ValueError: If the URL is not a supported page.
+        """
+
+        page = _get_page_kind(url)
+        if page is None:
+            raise ValueError(f'Unsupported page: {url}')
+        page_kind, imdb_id = page
+
+        if page_kind == 'title':
+            return self._extract_title(_FastHTMLParser(html), imdb_id)
+        tree = HTMLParser(html)
+        if page_kind == 'full_credits':
+            return list(self._extract_full_cast(tree, imdb_id)) + list(self._extract_full_crew(tree, imdb_id))
+        if page_kind == 'company_credits':
+            return list(self._extract_company_credits(tree, imdb_id))
+        if page_kind == 'tech_specs':
+            return self._extract_tech_specs(tree, imdb_id)
+        if page_kind == 'name':
+            return self._extract_name(tree, imdb_id)
+        if page_kind == 'name_credits':
+            return list(self._extract_name_credits(tree, imdb_id))
+        return list(self._extract_company_titles(tree, imdb_id))
+
+    def scrape_pages(self, pages, max_workers=None, chunksize=16):
+        """Scrapes many IMDb web pages that were already downloaded on a pool of worker processes.
+
+        See :meth:`scrape_page` for the pages supported, and :mod:`~pymdb.corpus` to read pages saved
+        in a directory or WARC archive. Pages are read from `pages` as workers need them and sent to
+        the workers in batches of `chunksize`, with at most two batches per worker queued at once, so
+        large corpora are scraped without being held in memory. Pages with an unsupported URL are
+        skipped, and any exception raised while scraping a page is captured in its result.
+
+        Args:
+            pages (:obj:`iterable` of :obj:`tuple`): The URL and HTML of each page.
+            max_workers (:obj:`int`, optional): The amount of worker processes, or `None` to use one per CPU.
+            chunksize (:obj:`int`, optional): The amount of pages sent to a worker at once.
+
+        Yields:
+            :class:`~.models.batch.ScrapeResult`: The result of each page, in the order they finish.
+
+        Raises:
+            ValueError: If `max_workers` or `chunksize` is less than 1.
+        """
+
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f'Invalid max workers: {max_workers}')
+        if chunksize < 1:
+            raise ValueError(f'Invalid chunksize: {chunksize}')
+        max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+
+        pages = ((url, html) for url, html in pages if _get_page_kind(url) is not None)
+        pending = set()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                exhausted = False
+                while not exhausted or pending:
+                    while not exhausted and len(pending) < max_workers * 2:
+                        batch = list(islice(pages, chunksize))
+                        if batch:
+                            pending.add(executor.submit(_scrape_page_batch, batch))
+                        else:
+                            exhausted = True
+                    if pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield from future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _scrape_many(self, scrape, imdb_ids, max_workers, checkpoint_path=None):
+        """Private generator to scrape many IMDb IDs on a pool of worker threads.
+
+        Each worker requests and scrapes its own pages, sharing the scraper's session and rate limit, so
+        the pages of the whole batch are requested no faster than the rate limit allows. At most two IDs
+        per worker are queued at once. Any exception raised while scraping an ID is captured in its
+        result instead of stopping the batch. When using a checkpoint file, each ID scraped successfully
+        is appended to it, and IDs already in it are skipped.
+
+        Args:
+            scrape (:obj:`callable`): The function scraping a single IMDb ID.
+            imdb_ids (:obj:`iterable` of :obj:`str`): The IMDb IDs to scrape.
+            max_workers (:obj:`int`): The amount of worker threads.
+            checkpoint_path (:obj:`str`, optional): The system path to the checkpoint file.
+
+        Yields:
+            :class:`~.models.batch.ScrapeResult`: The result of each IMDb ID, in the order they finish.
+
+        Raises:
+            ValueError: If `max_workers` is less than 1.
+        """
+
+        if max_workers < 1:
+            raise ValueError(f'Invalid max workers: {max_workers}')
+
+        completed = set()
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            with open(checkpoint_path, mode='r', encoding='utf8') as f:
+                completed = {line.strip() for line in f if line.strip()}
+        imdb_ids = iter(imdb_id for imdb_id in imdb_ids if imdb_id not in completed)
+        checkpoint = open(checkpoint_path, mode='a', encoding='utf8') if checkpoint_path is not None else None
+
+        def scrape_result(imdb_id):
+            try:
+                return ScrapeResult(imdb_id, scrape(imdb_id), None)
+            except Exception as e:
+                return ScrapeResult(imdb_id, None, e)
+
+        pending = set()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                try:
+                    exhausted = False
+                    while not exhausted or pending:
+                        while not exhausted and len(pending) < max_workers * 2:
+                            imdb_id = next(imdb_ids, None)
+                            if imdb_id is None:
+                                exhausted = True
+                            else:
+                                pending.add(executor.submit(scrape_result, imdb_id))
+                        if pending:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                result = future.result()
+                                if checkpoint is not None and result.succeeded:
+                                    checkpoint.write(f'{result.imdb_id}\n')
+                                    checkpoint.flush()
+                                yield result
+                finally:
+                    for future in pending:
+                        future.cancel()
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+
+    def _get_trees(self, request_urls):
+        """Private function to get the selectolax HTML trees of many requests, sending them concurrently.
+
+        Up to `prefetch_workers` requests are sent at once, each waiting for the rate limiter.
+
+        Args:
+            request_urls (:obj:`list` of :obj:`str`): The HTTP GET requests.
+
+        Returns:
+            :obj:`dict`: A dictionary of each request to its :class:`HTMLTree`, or to the :class:`HTTPError`
+                raised if it was not successful so the caller decides how to handle it.
+        """
+
+        def get_tree(request):
+            try:
+                return self._get_tree(request)
+            except requests.exceptions.HTTPError as e:
+                return e
+
+        request_urls = list(dict.fromkeys(request_urls))
+        if len(request_urls) <= 1 or self._prefetch_workers == 1:
+            return {request: get_tree(request) for request in request_urls}
+        with ThreadPoolExecutor(max_workers=min(self._prefetch_workers, len(request_urls))) as executor:
+            return dict(zip(request_urls, executor.map(get_tree, request_urls)))
+
+    def _prefetch(self, fetch, keys):
+        """Private function to call a fetching function on many keys concurrently, yielding the results in order.
+
+        At most twice `prefetch_workers` results are fetched ahead of the one being yielded, so pages are
+        only requested shortly before they are needed. Once the generator is closed, fetches that have not
+        started are cancelled.
+
+        Args:
+            fetch (:obj:`callable`): The function called with each key, which sends its own requests.
+            keys (:obj:`iterable`): The keys to fetch.
+
+        Yields:
+            The result of `fetch` for each key, in the order of `keys`.
+        """
+
+        keys = iter(keys)
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=self._prefetch_workers)
+        try:
+            for key in islice(keys, 2 * self._prefetch_workers):
+                pending.append(executor.submit(fetch, key))
+            while pending:
+                result = pending.popleft().result()
+                for key in islice(keys, 1):
+                    pending.append(executor.submit(fetch, key))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _iter_row_batches(self, row_nodes, extract_rows, include_episodes):
+        """Private generator to scrape rows of a page in batches, as they are received.
+
+        Each row is scraped on its own, unless episodes are included: rows are then scraped in batches
+        of twice `prefetch_workers`, so the episodes of each batch are requested concurrently.
+
+        Args:
+            row_nodes (:obj:`iterable` of :class:`Node`): The rows, parsed as they are received.
+            extract_rows (:obj:`callable`): The function scraping a list of rows.
+            include_episodes (:obj:`bool`): Specify if individual episodes are scraped.
+
+        Yields:
+            The objects scraped from each row, in order.
+        """
+
+        batch_size = 2 * self._prefetch_workers if include_episodes else 1
+        row_nodes = (row_node for row_node in row_nodes if row_node is not None)
+        batch = list(islice(row_nodes, batch_size))
+        while batch:
+            yield from extract_rows(batch)
+            batch = list(islice(row_nodes, batch_size))
+
+    def _iter_text(self, request):
+        """Private generator to get the body of a GET request in chunks, as it is received.
+
+        Behaves like :meth:`_get`, except the response is streamed through the scraper's transport.
+        A response is only stored in the cache once its whole body has been received, and closing
+        the generator early closes the response without receiving the rest of its body.
+
+        Args:
+            request (:obj:`str`): The HTTP GET request.
+
+        Yields:
+            :obj:`str`: Each chunk of the body of the successful response.
+
+        Raises:
+            ConnectionError: If the server could not be reached.
+            HTTPError: If a non successful response was returned.
+            Timeout: If the server did not respond in time.
+        """
+
+        cached = self._cache.get(request) if self._cache is not None else None
+        if cached is not None and self._cache.is_fresh(cached):
+            yield cached.text
+            return None
+
+        headers = cached.conditional_headers() if cached is not None else None
+        response = self._retry_policy.send(
+            partial(self._transport.stream, request, headers=headers), self._rate_limiter
+        )
+        try:
+            if cached is not None and response.status_code == 304:
+                yield self._cache.refresh(cached).text
+                return None
+            response.raise_for_status()
+            chunks = [] if self._cache is not None else None
+            for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE, decode_unicode=True):
+                if chunks is not None:
+                    chunks.append(chunk)
+                yield chunk
+            if chunks is not None:
+                self._cache.store(request, ''.join(chunks), response.headers.get('ETag'),
+                                  response.headers.get('Last-Modified'))
+        finally:
+            response.close()
+
+    def _get_tree(self, request, parser=HTMLParser):
         """Get the selectolax HTML tree given a request.
 
         Args:
             request (:obj:`str`): The HTTP GET request.
+            parser (:obj:`type`, optional): The selectolax parser class used to build the tree.
 
         Returns:
             :class:`HTMLTree`: The HTML tree from the GET request.
@@ -1014,7 +1923,38 @@ class PyMDbScraper:
         Raises:
             HTTPError: If a non successful response was returned.
         """
-        time.sleep(self._rate_limit / 1000)
-        response = requests.get(request, headers=self._headers)
+        return parser(self._get(request))
+
+    def _get(self, request):
+        """Get the body of a GET request, sent through the scraper's transport after waiting for the rate limit.
+
+        If using a response cache, a fresh cached response is returned without sending a request.
+        A stale cached response is revalidated with a conditional request and reused if unchanged.
+        Failed requests are retried according to the scraper's retry policy.
+
+        Args:
+            request (:obj:`str`): The HTTP GET request.
+
+        Returns:
+            :obj:`str`: The body of the successful response.
+
+        Raises:
+            ConnectionError: If the server could not be reached.
+            HTTPError: If a non successful response was returned.
+            Timeout: If the server did not respond in time.
+        """
+        cached = self._cache.get(request) if self._cache is not None else None
+        if cached is not None and self._cache.is_fresh(cached):
+            return cached.text
+
+        headers = cached.conditional_headers() if cached is not None else None
+        response = self._retry_policy.send(
+            partial(self._transport.get, request, headers=headers), self._rate_limiter
+        )
+        if cached is not None and response.status_code == 304:
+            return self._cache.refresh(cached).text
         response.raise_for_status()
-        return HTMLParser(response.text)
+        if self._cache is not None:
+            self._cache.store(request, response.text, response.headers.get('ETag'),
+                              response.headers.get('Last-Modified'))
+        return response.text
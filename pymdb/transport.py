@@ -0,0 +1,365 @@
+"""Module containing the transports a PyMDbScraper sends its requests through.
+
+Besides the default :class:`SessionTransport`, responses can be recorded into a compressed
+archive with a :class:`RecordingTransport` and replayed later without a network, either
+directly with a :class:`ReplayTransport` or over HTTP by a local :class:`FixtureServer`.
+"""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import unquote, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+_REPLAYED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Retry-After')
+
+
+class Transport:
+    """Base class of the transports a :class:`~.scraper.PyMDbScraper` sends its GET requests through.
+
+    Subclasses implement :meth:`get`, and :meth:`close` if they hold any resources.
+    Transports can be used as context managers to close them once finished.
+    """
+
+    def get(self, url, headers=None, timeout=None):
+        """Send a GET request.
+
+        Args:
+            url (:obj:`str`): The requested URL.
+            headers (:obj:`dict`, optional): Extra headers to send with the request.
+            timeout (:obj:`float`, optional): The amount of seconds to wait for the server.
+
+        Returns:
+            :class:`requests.Response` or :class:`TransportResponse`: The response, whatever its status.
+        """
+
+        raise NotImplementedError
+
+    def stream(self, url, headers=None, timeout=None):
+        """Send a GET request, receiving the response's body as it is read.
+
+        Transports that cannot stream return the full response from :meth:`get`.
+
+        Args:
+            url (:obj:`str`): The requested URL.
+            headers (:obj:`dict`, optional): Extra headers to send with the request.
+            timeout (:obj:`float`, optional): The amount of seconds to wait for the server.
+
+        Returns:
+            :class:`requests.Response` or :class:`TransportResponse`: The response, whatever its status,
+                whose body is read with `iter_content` and which must be closed once finished.
+        """
+
+        return self.get(url, headers=headers, timeout=timeout)
+
+    def close(self):
+        """Release the transport's resources."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class TransportResponse:
+    """Class to store a response that was not received from a :class:`requests.Session`.
+
+    Args:
+        url (:obj:`str`): The requested URL.
+        status_code (:obj:`int`): The response's HTTP status code.
+        text (:obj:`str`): The response's body.
+        headers (:obj:`dict`, optional): The response's headers.
+    """
+
+    __slots__ = '_url', '_status_code', '_text', '_headers'
+
+    def __init__(self, url, status_code, text, headers=None):
+        self._url = url
+        self._status_code = status_code
+        self._text = text
+        self._headers = CaseInsensitiveDict(headers or {})
+
+    @property
+    def url(self):
+        return self._url
+
+    @property
+    def status_code(self):
+        return self._status_code
+
+    @property
+    def text(self):
+        return self._text
+
+    @property
+    def headers(self):
+        return self._headers
+
+    def raise_for_status(self):
+        """Raise an error if the response was not successful, matching :class:`requests.Response`.
+
+        Raises:
+            HTTPError: If the status code is a client or server error.
+        """
+
+        if 400 <= self._status_code < 600:
+            raise requests.exceptions.HTTPError(f'{self._status_code} Error for url: {self._url}', response=self)
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        """Iterate over the response's body in chunks, matching :class:`requests.Response`.
+
+        Args:
+            chunk_size (:obj:`int`, optional): The amount of characters, or bytes if not decoded, in each chunk.
+            decode_unicode (:obj:`bool`, optional): Determine if chunks are strings instead of UTF-8 bytes.
+
+        Yields:
+            :obj:`str` or :obj:`bytes`: Each chunk of the body.
+        """
+
+        body = self._text if decode_unicode else self._text.encode('utf8')
+        for start in range(0, len(body), chunk_size):
+            yield body[start:start + chunk_size]
+
+    def close(self):
+        """Release the response, matching :class:`requests.Response`."""
+
+    def __str__(self):
+        return f'{self.url} ({self.status_code})'
+
+
+class SessionTransport(Transport):
+    """Sends requests through a pooled :class:`requests.Session`.
+
+    Args:
+        headers (:obj:`dict`, optional): The headers sent with every request.
+        pool_connections (:obj:`int`, optional): The amount of hosts to keep a connection pool for.
+        pool_maxsize (:obj:`int`, optional): The maximum amount of connections kept alive for each host.
+        pool_block (:obj:`bool`, optional): Determine if requests wait for a free connection once a host
+            has `pool_maxsize` connections in use.
+        base_url (:obj:`str`, optional): The scheme and host every request is sent to instead of the
+            requested URL's (ex: the URL of a :class:`FixtureServer`).
+    """
+
+    def __init__(self, headers=None, pool_connections=10, pool_maxsize=10, pool_block=False, base_url=None):
+        self._base_url = base_url.rstrip('/') if base_url is not None else None
+        self._session = requests.Session()
+        self._session.headers.update(headers or {})
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    @property
+    def session(self):
+        return self._session
+
+    def get(self, url, headers=None, timeout=None):
+        if self._base_url is not None:
+            url = self._base_url + _get_path(url)
+        return self._session.get(url, headers=headers, timeout=timeout)
+
+    def stream(self, url, headers=None, timeout=None):
+        if self._base_url is not None:
+            url = self._base_url + _get_path(url)
+        response = self._session.get(url, headers=headers, timeout=timeout, stream=True)
+        if response.encoding is None:
+            response.encoding = 'utf8'
+        return response
+
+    def close(self):
+        self._session.close()
+
+
+class RecordingTransport(Transport):
+    """Records every response received through another transport into a compressed archive.
+
+    Each response is appended to the archive as its own gzip member, so an archive stays readable
+    if recording is interrupted, and recording to an existing archive adds to it.
+
+    Args:
+        archive_path (:obj:`str`): The system path to the archive file.
+        transport (:class:`Transport`, optional): The transport sending the requests, or `None` to use
+            a :class:`SessionTransport` with the default settings.
+    """
+
+    def __init__(self, archive_path, transport=None):
+        self._archive_path = archive_path
+        self._transport = transport if transport is not None else SessionTransport()
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None, timeout=None):
+        response = self._transport.get(url, headers=headers, timeout=timeout)
+        entry = {
+            'url': url,
+            'status_code': response.status_code,
+            'headers': {name: response.headers[name] for name in _REPLAYED_HEADERS if name in response.headers},
+            'text': response.text,
+        }
+        with self._lock:
+            with gzip.open(self._archive_path, 'at', encoding='utf8') as archive:
+                archive.write(json.dumps(entry) + '\n')
+        return response
+
+    def close(self):
+        self._transport.close()
+
+
+class ReplayTransport(Transport):
+    """Answers requests with the responses recorded in an archive, without using the network.
+
+    If a URL was recorded more than once, its last response is used.
+
+    Args:
+        archive_path (:obj:`str`): The system path to an archive written by a :class:`RecordingTransport`.
+        missing_status (:obj:`int`, optional): The status code returned for URLs that were not recorded.
+    """
+
+    def __init__(self, archive_path, missing_status=404):
+        self._responses = _read_archive(archive_path)
+        self._missing_status = missing_status
+
+    @property
+    def urls(self):
+        return list(self._responses.keys())
+
+    def get(self, url, headers=None, timeout=None):
+        response = self._responses.get(url)
+        if response is None:
+            return TransportResponse(url, self._missing_status, '')
+        return response
+
+    def __contains__(self, url):
+        return url in self._responses
+
+    def __len__(self):
+        return len(self._responses)
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """Private class to serve each HTTP request on its own thread."""
+
+    daemon_threads = True
+
+
+class FixtureServer:
+    """Local HTTP server answering requests with the responses recorded in an archive.
+
+    Responses are matched by the unquoted path and query of their recorded URL, ignoring the host.
+    Point a :class:`SessionTransport` at the server with its `base_url` to send a scraper's
+    requests over a real local connection.
+
+    Args:
+        archive_path (:obj:`str`): The system path to an archive written by a :class:`RecordingTransport`.
+        host (:obj:`str`, optional): The address the server listens on.
+        port (:obj:`int`, optional): The port the server listens on, or 0 to use any free port.
+    """
+
+    def __init__(self, archive_path, host='127.0.0.1', port=0):
+        self._responses = {
+            unquote(_get_path(url)): response for url, response in _read_archive(archive_path).items()
+        }
+        self._server = _ThreadingHTTPServer((host, port), self._build_handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        """Start serving requests on a background thread.
+
+        Returns:
+            :class:`FixtureServer`: The started server.
+        """
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Stop serving requests and release the server's socket."""
+
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _build_handler(self):
+        """Private function to build the request handler class serving the recorded responses.
+
+        Returns:
+            :obj:`type`: The :class:`BaseHTTPRequestHandler` subclass.
+        """
+
+        responses = self._responses
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                response = responses.get(unquote(self.path))
+                status_code = response.status_code if response is not None else 404
+                body = response.text.encode('utf8') if response is not None else b''
+                self.send_response(status_code)
+                if response is not None:
+                    for name, value in response.headers.items():
+                        # Bodies are stored decoded, so they are always sent as UTF-8
+                        if name.lower() == 'content-type':
+                            value = value.split(';')[0] + '; charset=utf-8'
+                        self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _get_path(url):
+    """Private function to get the path and query of a URL.
+
+    Args:
+        url (:obj:`str`): The URL.
+
+    Returns:
+        :obj:`str`: The path, followed by the query if the URL has one.
+    """
+
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    return f'{path}?{parts.query}' if parts.query else path
+
+
+def _read_archive(archive_path):
+    """Private function to read the responses recorded in an archive.
+
+    Args:
+        archive_path (:obj:`str`): The system path to the archive file.
+
+    Returns:
+        :obj:`dict`: A dictionary of each recorded URL to its last :class:`TransportResponse`.
+    """
+
+    responses = {}
+    with gzip.open(archive_path, 'rt', encoding='utf8') as archive:
+        for line in archive:
+            if line.strip():
+                entry = json.loads(line)
+                responses[entry['url']] = TransportResponse(entry['url'], entry['status_code'], entry['text'],
+                                                            entry['headers'])
+    return responses
@@ -8,11 +8,22 @@ import os
 import re
 import shutil
 from datetime import datetime
+from functools import lru_cache
 
 _CATEGORY_INDEX = 3
 _REF_MARKER_INDEX = 4
 _SUPPORTED_DENOMINATIONS = '|'.join((r'\$', 'GBP'))
 
+_BR_TAG_PATTERN = re.compile(r'<\s*b\s*r\s*/?\s*>')
+_DENOMINATION_PATTERN = re.compile(rf'({_SUPPORTED_DENOMINATIONS})')
+_DIGITS_PATTERN = re.compile(r'\d+')
+_ID_PATTERNS = {prefix: re.compile(rf'{prefix}\d+') for prefix in ('co', 'nm', 'tt')}
+_MONEY_PATTERN = re.compile(rf'({_SUPPORTED_DENOMINATIONS})[\d,]+')
+_MONEY_SEPARATOR_PATTERN = re.compile(rf'({_SUPPORTED_DENOMINATIONS}|,)+')
+_NAME_NUMERAL_PATTERN = re.compile(r'\s*\(\w+\)')
+_SPAN_PATTERN = re.compile(r'<\s*span.*?<\s*/\s*span\s*>')
+_YEAR_NUMERAL_PATTERN = re.compile(r'/\w*')
+
 
 def append_filename_to_path(path, filename):
     """Append a filename to a system file path.
@@ -100,7 +111,7 @@ def split_by_br(s):
         :obj:`list`: A list of strings split around the `<br>` tags.
     """
 
-    return re.sub(r'<\s*b\s*r\s*/?\s*>', '\t', s).split('\t')
+    return _BR_TAG_PATTERN.sub('\t', s).split('\t')
 
 
 def remove_tags(s, tag):
@@ -118,7 +129,7 @@ def remove_tags(s, tag):
         HTML information intact.
     """
 
-    return re.sub(rf'(<\s*{tag}.*?>|<\s*/\s*{tag}\s*>)', '', s)
+    return _get_tag_pattern(tag).sub('', s)
 
 
 def remove_tags_and_content(s, tag):
@@ -136,7 +147,35 @@ def remove_tags_and_content(s, tag):
         :obj:`str`: A string with all of the specified tags and their content removed.
     """
 
-    return re.sub(rf'<\s*{tag}.*?>(.|\r|\n)*<\s*/\s*{tag}\s*>', '', s)
+    return _get_tag_and_content_pattern(tag).sub('', s)
+
+
+@lru_cache(maxsize=None)
+def _get_tag_pattern(tag):
+    """Private function to get the compiled pattern matching the opening and closing tags of a type.
+
+    Args:
+        tag (:obj:`str`): The tag's type.
+
+    Returns:
+        :obj:`re.Pattern`: The compiled pattern.
+    """
+
+    return re.compile(rf'(<\s*{tag}.*?>|<\s*/\s*{tag}\s*>)')
+
+
+@lru_cache(maxsize=None)
+def _get_tag_and_content_pattern(tag):
+    """Private function to get the compiled pattern matching tags of a type and their content.
+
+    Args:
+        tag (:obj:`str`): The tag's type.
+
+    Returns:
+        :obj:`re.Pattern`: The compiled pattern.
+    """
+
+    return re.compile(rf'<\s*{tag}.*?>(.|\r|\n)*<\s*/\s*{tag}\s*>')
 
 
 def _get_id(node, prefix):
@@ -153,7 +192,7 @@ def _get_id(node, prefix):
         :obj:`str`: The IMDb ID, or `None` if none was found.
     """
     if node and 'href' in node.attributes:
-        id_match = re.search(rf'{prefix}\d+', node.attributes['href'])
+        id_match = _ID_PATTERNS[prefix].search(node.attributes['href'])
         if id_match:
             return id_match.group(0)
     return None
@@ -282,9 +321,7 @@ def get_episode_info(node):
         episode_count_str = None
         episode_year_start_str = None
         episode_year_end_str = None
-        episode_info = re.sub(
-            r'<\s*span.*?<\s*/\s*span\s*>', '', node.text()
-        ).strip().split(',')
+        episode_info = _SPAN_PATTERN.sub('', node.text()).strip().split(',')
         if len(episode_info) > 1:
             episode_count_str, episode_year_info = episode_info
             episode_year_info = episode_year_info.strip().split('-')
@@ -294,7 +331,7 @@ def get_episode_info(node):
                 episode_year_start_str, = episode_year_info
         else:
             episode_count_str, = episode_info
-        episode_count_match = re.search(r'\d+', episode_count_str)
+        episode_count_match = _DIGITS_PATTERN.search(episode_count_str)
         if episode_count_match:
             episode_count_str = episode_count_match.group(0)
         # Convert values to ints
@@ -321,7 +358,7 @@ def trim_name(name):
         :obj:`str`: The name with roman numerals removed, or `None` if name was `None`.
     """
 
-    return re.sub(r'\s*\(\w+\)', '', name) if name is not None else None
+    return _NAME_NUMERAL_PATTERN.sub('', name) if name is not None else None
 
 
 def trim_year(year):
@@ -338,7 +375,7 @@ def trim_year(year):
         :obj:`str`: The year with roman numerals removed, or `None` if year was `None`.
     """
 
-    return re.sub(r'/\w*', '', year) if year is not None else None
+    return _YEAR_NUMERAL_PATTERN.sub('', year) if year is not None else None
 
 
 def is_money_string(s):
@@ -353,7 +390,7 @@ def is_money_string(s):
         :obj:`bool`: If the string does represent a monetary value for not.
     """
 
-    return True if re.search(rf'({_SUPPORTED_DENOMINATIONS})[\d,]+', s) else False
+    return True if _MONEY_PATTERN.search(s) else False
 
 
 def trim_money_string(s):
@@ -368,9 +405,9 @@ def trim_money_string(s):
         :obj:`str`: The same monetary amount with excess characters removed.
     """
 
-    money_match = re.search(rf'({_SUPPORTED_DENOMINATIONS})[\d,]+', s)
+    money_match = _MONEY_PATTERN.search(s)
     if money_match:
-        return re.sub(rf'({_SUPPORTED_DENOMINATIONS}|,)+', '', money_match.group(0))
+        return _MONEY_SEPARATOR_PATTERN.sub('', money_match.group(0))
     return s
 
 def get_denomination(s):
@@ -390,7 +427,7 @@ def get_denomination(s):
     """
 
     if is_money_string(s):
-        denomination_match = re.search(rf'({_SUPPORTED_DENOMINATIONS})', s)
+        denomination_match = _DENOMINATION_PATTERN.search(s)
         if denomination_match:
             denomination = denomination_match.group(0)
             if denomination == '$':
@@ -409,12 +446,12 @@ def is_float(f):
         :obj:`bool`: If the object can be converted to a :obj:`float`.
     """
 
-    if not f:
+    if f is None or f == '':
         return False
     try:
         float(f)
         return True
-    except ValueError:
+    except (TypeError, ValueError):
         return False
 
 
@@ -428,12 +465,12 @@ def is_int(i):
         :obj:`bool`: If the object can be converted to an :obj:`int`.
     """
 
-    if not i:
+    if i is None or i == '':
         return False
     try:
         int(i)
         return True
-    except ValueError:
+    except (TypeError, ValueError):
         return False
 
 
@@ -0,0 +1,34 @@
+"""Module containing the IMDb web pages shared by the scraper tests."""
+
+FULL_CREDITS_PAGE = '''
+<div id="fullcredits_content">
+    <h4 class="dataHeaderWithBorder">Directed by</h4>
+    <table class="simpleCreditsTable">
+        <tr><td class="name"><a href="/name/nm0000184/">George Lucas</a></td><td class="credit"></td></tr>
+    </table>
+    <h4 class="dataHeaderWithBorder" id="cast">Cast</h4>
+    <table class="cast_list">
+        <tr>
+            <td class="primary_photo"></td><td><a href="/name/nm0000434/">Mark Hamill</a></td>
+            <td class="character">Luke Skywalker
+                <a class="toggle-episodes" onclick="toggle(this,'nm0000434','tt0076759','actor','tt_cl_t1')">2 episodes, 1977</a>
+            </td>
+        </tr>
+        <tr>
+            <td class="primary_photo"></td><td><a href="/name/nm0000148/">Harrison Ford</a></td>
+            <td class="character">Han Solo
+                <a class="toggle-episodes" onclick="toggle(this,'nm0000148','tt0076759','actor','tt_cl_t2')">1 episode, 1977</a>
+            </td>
+        </tr>
+    </table>
+    <h4 class="dataHeaderWithBorder">Writing Credits</h4>
+    <table class="simpleCreditsTable">
+        <tr><td class="name"><a href="/name/nm0000184/">George Lucas</a></td><td class="credit">(written by)</td></tr>
+    </table>
+</div>
+'''
+
+
+def episodes_page(*title_ids):
+    return ''.join(f'<div class="filmo-episodes"><a href="/title/{title_id}/">Episode</a> (1977) ... Role</div>'
+                   for title_id in title_ids)
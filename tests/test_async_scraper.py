@@ -0,0 +1,57 @@
+"""Module to test functionality of the AsyncPyMDbScraper."""
+
+import unittest
+import asyncio
+import threading
+import time
+from pymdb.async_scraper import AsyncPyMDbScraper
+
+
+class _FakeScraper:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def get_title(self, title_id, include_taglines=False):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        return (title_id, include_taglines)
+
+    def get_company(self, company_id):
+        for i in range(3):
+            yield f'{company_id}-{i}'
+
+    def close(self):
+        self.closed = True
+
+
+class TestAsyncPyMDbScraper(unittest.TestCase):
+    def test_concurrency_bounded(self):
+        fake = _FakeScraper()
+
+        async def scrape():
+            async with AsyncPyMDbScraper(max_concurrency=3, scraper=fake) as scraper:
+                return await asyncio.gather(*(scraper.get_title(f'tt{i}', include_taglines=True) for i in range(9)))
+
+        results = asyncio.get_event_loop().run_until_complete(scrape())
+        self.assertEqual(results, [(f'tt{i}', True) for i in range(9)])
+        self.assertLessEqual(fake.max_active, 3)
+        self.assertGreater(fake.max_active, 1)
+        self.assertTrue(fake.closed)
+
+    def test_generators_returned_as_lists(self):
+        async def scrape():
+            async with AsyncPyMDbScraper(scraper=_FakeScraper()) as scraper:
+                return await scraper.get_company('co1')
+
+        self.assertEqual(asyncio.get_event_loop().run_until_complete(scrape()), ['co1-0', 'co1-1', 'co1-2'])
+
+    def test_invalid_max_concurrency(self):
+        with self.assertRaises(ValueError):
+            AsyncPyMDbScraper(max_concurrency=0)
@@ -0,0 +1,177 @@
+"""Module to test functionality of the DatasetCache."""
+
+import unittest
+import mmap
+import os
+from unittest import mock
+from tempfile import TemporaryDirectory
+from pymdb.cache import DatasetCache
+from pymdb.parser import (
+    PyMDbParser,
+    _DATASETS,
+    _NAME_BASICS,
+    _TITLE_BASICS,
+    _TITLE_PRINCIPALS,
+    _to_typed_row
+)
+
+
+class TestDatasetCache(unittest.TestCase):
+    columns = (('title_id', None), ('start_year', 'q'), ('average_rating', 'd'))
+    rows = [('tt1', 1999, 7.5), ('tt2', None, None), ('tt3', 0, 0.0), (None, 2020, 1.0)]
+
+    def _write(self, tmpdir, block_size=2):
+        source = os.path.join(tmpdir, 'source.tsv')
+        with open(source, 'w+') as f:
+            f.write('source')
+        cache = DatasetCache(os.path.join(tmpdir, 'cache'), source, self.columns, block_size=block_size)
+        self.assertEqual(list(cache.write(iter(self.rows))), self.rows)
+        return source, cache
+
+    def test_write_and_read_rows(self):
+        with TemporaryDirectory() as tmpdir:
+            _, cache = self._write(tmpdir)
+            self.assertTrue(cache.is_valid())
+            self.assertEqual(list(cache.read_rows()), self.rows)
+
+    def test_read_blocks(self):
+        with TemporaryDirectory() as tmpdir:
+            _, cache = self._write(tmpdir)
+            blocks = list(cache.read_blocks(['start_year', 'title_id']))
+            self.assertEqual([row_count for row_count, _, _ in blocks], [2, 2])
+            _, columns, masks = blocks[1]
+            self.assertEqual(list(columns['start_year']), [0, 2020])
+            self.assertEqual(list(masks['title_id']), [0, 1])
+            self.assertEqual(columns['title_id'](), ['tt3', ''])
+            self.assertNotIn('average_rating', columns)
+
+    def test_unmapped_after_read(self):
+        with TemporaryDirectory() as tmpdir:
+            _, cache = self._write(tmpdir)
+            buffers = []
+            open_buffer = mmap.mmap
+
+            def open_mmap(*args, **kwargs):
+                buffers.append(open_buffer(*args, **kwargs))
+                return buffers[-1]
+
+            with mock.patch('pymdb.cache.mmap.mmap', side_effect=open_mmap):
+                self.assertEqual(list(cache.read_rows()), self.rows)
+                blocks = cache.read_blocks()
+                next(blocks)
+                blocks.close()
+            self.assertEqual(len(buffers), 2)
+            self.assertTrue(all(buffer.closed for buffer in buffers))
+
+    def test_invalid_after_source_changes(self):
+        with TemporaryDirectory() as tmpdir:
+            source, cache = self._write(tmpdir)
+            with open(source, 'a') as f:
+                f.write('changed')
+            self.assertFalse(cache.is_valid())
+
+    def test_not_written_when_not_read_in_full(self):
+        with TemporaryDirectory() as tmpdir:
+            source = os.path.join(tmpdir, 'source.tsv')
+            with open(source, 'w+') as f:
+                f.write('source')
+            cache = DatasetCache(tmpdir, source, self.columns)
+            rows = cache.write(iter(self.rows))
+            next(rows)
+            rows.close()
+            self.assertFalse(cache.is_valid())
+            self.assertEqual(os.listdir(tmpdir), ['source.tsv'])
+
+
+class TestParserCache(unittest.TestCase):
+    basics = 'tconst\ttitleType\tprimaryTitle\toriginalTitle\tisAdult\tstartYear\tendYear\truntimeMinutes\tgenres\n' + \
+             'tt1\tmovie\tTitle 1\tTitle 1\t0\t1999\t\\N\t90\tDrama,Comedy\n' + \
+             'tt2\ttvSeries\tTitle 2\tTitle 2\t1\t2005\t2010\t0\t\\N\n'
+
+    def _assert_title_basics(self, title_basics):
+        self.assertEqual(len(title_basics), 2)
+        actual1, actual2 = title_basics
+        self.assertEqual(actual1.title_id, 'tt1')
+        self.assertEqual(actual1.primary_title, 'Title 1')
+        self.assertFalse(actual1.is_adult)
+        self.assertEqual(actual1.start_year, 1999)
+        self.assertIsNone(actual1.end_year)
+        self.assertEqual(actual1.genres, ['Drama', 'Comedy'])
+        self.assertTrue(actual2.is_adult)
+        self.assertEqual(actual2.end_year, 2010)
+        self.assertEqual(actual2.runtime, 0)
+        self.assertEqual(actual2.genres, [])
+
+    def test_cached_title_basics(self):
+        with TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, _TITLE_BASICS.default_filename), 'w+') as f:
+                f.write(self.basics)
+            cache_dir = os.path.join(tmpdir, 'cache')
+            parser = PyMDbParser(cache_dir=cache_dir)
+            self._assert_title_basics(list(parser.get_title_basics(tmpdir)))
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            self.assertTrue(parser._get_cache(tmpdir, _TITLE_BASICS).is_valid())
+            self._assert_title_basics(list(parser.get_title_basics(tmpdir)))
+            movies = list(parser.get_title_basics(tmpdir, columns=['title_id'], where={'title_type': 'movie'}))
+            self.assertEqual([movie.title_id for movie in movies], ['tt1'])
+            self.assertIsNone(movies[0].primary_title)
+
+    def test_cached_batches(self):
+        with TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, _TITLE_BASICS.default_filename), 'w+') as f:
+                f.write(self.basics)
+            parser = PyMDbParser(cache_dir=os.path.join(tmpdir, 'cache'))
+            expected, = parser.get_title_basics_batches(tmpdir)
+            actual, = parser.get_title_basics_batches(tmpdir)
+            self.assertIsInstance(actual['start_year'], memoryview)
+            for column in expected.column_names:
+                self.assertEqual(list(actual[column]), list(expected[column]))
+                if expected.mask(column) is not None:
+                    self.assertEqual(list(actual.mask(column)), list(expected.mask(column)))
+            projected, = parser.get_title_basics_batches(tmpdir, columns=['genres'])
+            self.assertEqual(projected.column_names, ['genres'])
+            self.assertEqual(projected['genres'], [['Drama', 'Comedy'], None])
+
+    def test_cached_gzip_stream(self):
+        import gzip
+        with TemporaryDirectory() as tmpdir:
+            with gzip.open(os.path.join(tmpdir, f'{_NAME_BASICS.default_filename}.gz'), 'wb') as f:
+                f.write(b'nm1\tName\t1930\t\\N\tactor,writer\ttt1,tt2\n')
+            parser = PyMDbParser(gunzip_files=True, stream_gzip_files=True, cache_dir=os.path.join(tmpdir, 'cache'))
+            for _ in range(2):
+                name_basics, = parser.get_name_basics(tmpdir, contains_headers=False)
+                self.assertEqual(name_basics.birth_year, 1930)
+                self.assertIsNone(name_basics.death_year)
+                self.assertEqual(name_basics.known_for_titles, ['tt1', 'tt2'])
+
+    def test_cached_principals(self):
+        with TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, _TITLE_PRINCIPALS.default_filename), 'w+') as f:
+                f.write('tt1\t1\tnm1\tactor\t\\N\t["Han Solo"]\n')
+            parser = PyMDbParser(cache_dir=os.path.join(tmpdir, 'cache'))
+            for _ in range(2):
+                principal, = parser.get_title_principals(tmpdir, contains_headers=False)
+                self.assertEqual(principal.ordering, 1)
+                self.assertEqual(principal.characters, ['Han Solo'])
+
+    def test_typed_builders(self):
+        rows = {
+            'title.akas.tsv': [['tt1', '1', 'Title', 'US', None, 'imdbDisplay,working', None, '0'],
+                               ['tt1', None, None, None, None, None, 'literal', None]],
+            'title.basics.tsv': [['tt1', 'movie', 'Title', 'Title', '1', '1999', None, 'x', 'Drama,Comedy'],
+                                 ['tt2', None, None, None, None, None, None, None, None]],
+            'title.crew.tsv': [['tt1', 'nm1,nm2', None], ['tt2', None, 'nm3']],
+            'title.episode.tsv': [['tt2', 'tt1', '1', '12'], ['tt3', 'tt1', None, None]],
+            'title.principals.tsv': [['tt1', '1', 'nm1', 'actor', None, '["Han Solo","Self"]'],
+                                     ['tt1', None, 'nm2', None, 'director', 'unlisted'],
+                                     ['tt1', '3', 'nm3', None, None, None]],
+            'title.ratings.tsv': [['tt1', '8.6', '1000'], ['tt2', None, 'x']],
+            'name.basics.tsv': [['nm1', 'Name', '1930', None, 'actor, writer', 'tt1, tt2'],
+                                ['nm2', None, None, '2000', None, None]]
+        }
+        for filename, dataset in _DATASETS.items():
+            for row in rows[filename]:
+                expected = dataset.build(list(row))
+                actual = dataset.build_typed(_to_typed_row(list(row), dataset.numeric_columns))
+                for name in type(expected).__slots__:
+                    self.assertEqual(getattr(actual, name), getattr(expected, name), f'{filename} {name}')
@@ -0,0 +1,78 @@
+"""Module to test functionality of reading saved IMDb web pages."""
+
+import unittest
+import gzip
+import os
+from tempfile import TemporaryDirectory
+from pymdb.corpus import read_directory, read_warc
+
+_TITLE_PAGE = '<html><body><div class="title_wrapper"><h1>Star Wars</h1></div></body></html>'
+
+
+def _warc_record(url, http_response, warc_type='response'):
+    return (
+        f'WARC/1.0\r\nWARC-Type: {warc_type}\r\nWARC-Target-URI: {url}\r\n'
+        f'Content-Type: application/http; msgtype=response\r\nContent-Length: {len(http_response)}\r\n\r\n'
+    ).encode('utf8') + http_response + b'\r\n\r\n'
+
+
+def _http_response(body, status='200 OK', headers=''):
+    return f'HTTP/1.1 {status}\r\nContent-Type: text/html; charset=utf-8\r\n{headers}\r\n'.encode('utf8') + body
+
+
+class TestReadDirectory(unittest.TestCase):
+    def test_read_directory(self):
+        with TemporaryDirectory() as temp_dir:
+            files = {
+                os.path.join('title', 'tt0076759', 'index.html'): _TITLE_PAGE,
+                os.path.join('title', 'tt0076759', 'fullcredits.html'): 'credits',
+                os.path.join('search', 'title', 'index.html?companies=co0071326&start=1'): 'company',
+                os.path.join('title', 'tt0076759', 'poster.jpg'): 'image',
+            }
+            for path, text in files.items():
+                os.makedirs(os.path.join(temp_dir, os.path.dirname(path)), exist_ok=True)
+                with open(os.path.join(temp_dir, path), mode='w', encoding='utf8') as f:
+                    f.write(text)
+
+            pages = list(read_directory(temp_dir))
+            self.assertEqual(pages, [
+                ('https://www.imdb.com/search/title/?companies=co0071326&start=1', 'company'),
+                ('https://www.imdb.com/title/tt0076759/fullcredits', 'credits'),
+                ('https://www.imdb.com/title/tt0076759/', _TITLE_PAGE),
+            ])
+
+
+class TestReadWarc(unittest.TestCase):
+    def test_read_warc(self):
+        chunked_body = b'5\r\nStar \r\n4\r\nWars\r\n0\r\n\r\n'
+        records = [
+            _warc_record('http://www.imdb.com/title/tt0076759/', b'GET /title/tt0076759/ HTTP/1.1\r\n\r\n',
+                         warc_type='request'),
+            _warc_record('<https://www.imdb.com/title/tt0076759/>', _http_response(_TITLE_PAGE.encode('utf8'))),
+            _warc_record('https://www.imdb.com/title/tt0000000/', _http_response(b'', status='404 Not Found')),
+            _warc_record('https://www.imdb.com/title/tt0080684/',
+                         _http_response(chunked_body, headers='Transfer-Encoding: chunked\r\n')),
+            _warc_record('https://www.imdb.com/title/tt0086190/',
+                         _http_response(gzip.compress('Return of the Jedi'.encode('utf8')),
+                                        headers='Content-Encoding: gzip\r\n')),
+        ]
+        with TemporaryDirectory() as temp_dir:
+            for warc_path, open_warc in ((os.path.join(temp_dir, 'pages.warc'), open),
+                                         (os.path.join(temp_dir, 'pages.warc.gz'), gzip.open)):
+                with open_warc(warc_path, mode='wb') as f:
+                    for record in records:
+                        f.write(record)
+
+                self.assertEqual(list(read_warc(warc_path)), [
+                    ('https://www.imdb.com/title/tt0076759/', _TITLE_PAGE),
+                    ('https://www.imdb.com/title/tt0080684/', 'Star Wars'),
+                    ('https://www.imdb.com/title/tt0086190/', 'Return of the Jedi'),
+                ])
+
+    def test_invalid_record(self):
+        with TemporaryDirectory() as temp_dir:
+            warc_path = os.path.join(temp_dir, 'pages.warc')
+            with open(warc_path, mode='wb') as f:
+                f.write(b'not a warc record\r\n')
+            with self.assertRaises(ValueError):
+                list(read_warc(warc_path))
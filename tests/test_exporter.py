@@ -0,0 +1,84 @@
+"""Module to test functionality of the PyMDbSQLiteExporter."""
+
+import unittest
+import os
+import sqlite3
+from tempfile import TemporaryDirectory
+from pymdb.exporter import PyMDbSQLiteExporter
+from pymdb.parser import (
+    PyMDbParser,
+    _NAME_BASICS,
+    _TITLE_BASICS,
+    _TITLE_PRINCIPALS
+)
+
+
+class TestPyMDbSQLiteExporter(unittest.TestCase):
+    basics = 'tt1\tmovie\tFirst\tFirst\t0\t1999\t\\N\t90\tDrama,Comedy\n' + \
+        'tt2\tshort\tSecond\tSecond\t1\t\\N\t\\N\t\\N\t\\N\n'
+    names = 'nm1\tFred Astaire\t1899\t1987\tsoundtrack,actor\ttt1,tt2\n'
+    principals = 'tt1\t1\tnm1\tactor\t\\N\t["Self","Host"]\ntt1\t2\tnm2\tdirector\t\\N\t\\N\n'
+
+    def _export(self, tmpdir, **kwargs):
+        for dataset, content in ((_TITLE_BASICS, self.basics), (_NAME_BASICS, self.names),
+                                 (_TITLE_PRINCIPALS, self.principals)):
+            with open(os.path.join(tmpdir, dataset.default_filename), 'w+') as f:
+                f.write(content)
+        db_path = os.path.join(tmpdir, 'imdb.db')
+        exporter = PyMDbSQLiteExporter(db_path, **kwargs)
+        counts = exporter.export(tmpdir, datasets=[
+            _TITLE_BASICS.default_filename, _NAME_BASICS.default_filename, _TITLE_PRINCIPALS.default_filename
+        ], contains_headers=False)
+        return db_path, counts
+
+    def _query(self, db_path, sql):
+        connection = sqlite3.connect(db_path)
+        try:
+            return connection.execute(sql).fetchall()
+        finally:
+            connection.close()
+
+    def test_export(self):
+        with TemporaryDirectory() as tmpdir:
+            db_path, counts = self._export(tmpdir, batch_size=1)
+            self.assertEqual(counts, {
+                _TITLE_BASICS.default_filename: 2, _NAME_BASICS.default_filename: 1,
+                _TITLE_PRINCIPALS.default_filename: 2
+            })
+            self.assertEqual(self._query(db_path, 'SELECT * FROM title_basics ORDER BY title_id'), [
+                ('tt1', 'movie', 'First', 'First', 0, 1999, None, 90),
+                ('tt2', 'short', 'Second', 'Second', 1, None, None, None)
+            ])
+            self.assertEqual(self._query(db_path, 'SELECT * FROM title_genres ORDER BY genre'),
+                             [('tt1', 'Comedy'), ('tt1', 'Drama')])
+            self.assertEqual(self._query(db_path, "SELECT title_id FROM name_known_for_titles WHERE name_id = 'nm1'"),
+                             [('tt1',), ('tt2',)])
+            self.assertEqual(self._query(db_path, 'SELECT * FROM title_principals_characters'),
+                             [('tt1', 1, 'Self'), ('tt1', 1, 'Host')])
+
+    def test_unbracketed_characters(self):
+        with TemporaryDirectory() as tmpdir:
+            self.principals = 'tt1\t1\tnm1\tself\t\\N\tSelf\n'
+            db_path, _ = self._export(tmpdir)
+            self.assertEqual(self._query(db_path, 'SELECT * FROM title_principals_characters'), [('tt1', 1, 'Self')])
+
+    def test_indexes(self):
+        with TemporaryDirectory() as tmpdir:
+            db_path, _ = self._export(tmpdir)
+            indexes = [name for name, in self._query(db_path, "SELECT name FROM sqlite_master WHERE type = 'index'")]
+            self.assertIn('title_basics_key', indexes)
+            self.assertIn('title_principals_name_id', indexes)
+            self.assertIn('name_known_for_titles_title_id', indexes)
+
+    def test_export_replaces_tables(self):
+        with TemporaryDirectory() as tmpdir:
+            self._export(tmpdir)
+            db_path, _ = self._export(tmpdir, parser=PyMDbParser())
+            self.assertEqual(self._query(db_path, 'SELECT COUNT(*) FROM title_basics'), [(2,)])
+            self.assertEqual(self._query(db_path, 'SELECT COUNT(*) FROM title_genres'), [(2,)])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            PyMDbSQLiteExporter('imdb.db', batch_size=0)
+        with self.assertRaises(ValueError):
+            PyMDbSQLiteExporter('imdb.db').export('', datasets=['unknown.tsv'])
@@ -0,0 +1,66 @@
+"""Module to test functionality of the extraction rules."""
+
+import unittest
+from selectolax.parser import HTMLParser
+from pymdb.extraction import LabelRule, extract_labeled_fields, get_rules, register_rules
+
+
+class TestLabelRule(unittest.TestCase):
+    def test_matches(self):
+        rule = LabelRule('runtime', 'runtime', lambda node: None)
+        self.assertTrue(rule.matches('runtime'))
+        self.assertTrue(rule.matches('total runtime'))
+        self.assertFalse(rule.matches('color'))
+        exact_rule = LabelRule('born', 'birth_date', lambda node: None, exact=True)
+        self.assertTrue(exact_rule.matches('born'))
+        self.assertFalse(exact_rule.matches('reborn'))
+
+
+class TestExtractLabeledFields(unittest.TestCase):
+    def test_register_rules(self):
+        register_rules('test_page', (
+            LabelRule('first', 'first', lambda node: node.text()),
+            LabelRule('first', 'first_length', lambda node: len(node.text())),
+            LabelRule('second', 'second', lambda node: None),
+        ))
+        self.assertEqual(len(get_rules('test_page')), 3)
+        tree = HTMLParser('<p>one</p><p>two</p><p>three</p>')
+        first, second, third = tree.css('p')
+        fields = extract_labeled_fields('test_page', (('first', first), ('second', second), ('first', third)))
+        self.assertEqual(fields, {'first': 'three', 'first_length': 5})
+
+    def test_unknown_page(self):
+        with self.assertRaises(KeyError):
+            extract_labeled_fields('unknown_page', ())
+
+    def test_tech_specs(self):
+        tree = HTMLParser('''
+            <table>
+                <tr><td class="label">Runtime</td><td>2 hr 1 min (121 min)</td></tr>
+                <tr><td class="label">Sound Mix</td><td>Dolby Stereo |  70 mm 6-Track</td></tr>
+                <tr><td class="label">Camera</td><td>Panavision Panaflex, Panavision Lenses and Arriflex 35 IIC</td></tr>
+                <tr><td class="label">Laboratory</td><td>DeLuxe, Hollywood<br/>Technicolor, London</td></tr>
+            </table>
+        ''')
+        rows = [(row.css_first('td.label').text().lower(), row.css_first('td.label ~ td')) for row in tree.css('tr')]
+        self.assertEqual(extract_labeled_fields('tech_specs', rows), {
+            'runtime': '121',
+            'sound_mix': ['Dolby Stereo', '70 mm 6-Track'],
+            'camera': ['Panavision Panaflex', 'Panavision Lenses', 'Arriflex 35 IIC'],
+            'laboratory': ['DeLuxe, Hollywood', 'Technicolor, London'],
+        })
+
+    def test_title_details(self):
+        tree = HTMLParser('''
+            <div class="txt-block"><h4>Budget:</h4> $11,000,000 (estimated)</div>
+            <div class="txt-block"><h4>Opening Weekend USA:</h4> $1,554,475, <span>29 May 1977</span></div>
+            <div class="txt-block"><h4>Production Co:</h4> <a href="/company/co0071326">Lucasfilm</a></div>
+        ''')
+        rows = [(block.css_first('h4').text().lower(), block) for block in tree.css('div.txt-block')]
+        self.assertEqual(extract_labeled_fields('title_details', rows), {
+            'budget': '11000000',
+            'budget_denomination': 'USD',
+            'opening_weekend_gross': '1554475',
+            'opening_weekend_date': '29 May 1977',
+            'production_companies': ['co0071326'],
+        })
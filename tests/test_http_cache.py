@@ -0,0 +1,96 @@
+"""Module to test functionality of the ResponseCache."""
+
+import unittest
+import os
+import time
+from tempfile import TemporaryDirectory
+from pymdb.http_cache import ResponseCache
+from pymdb.ratelimit import RateLimiter
+from pymdb.scraper import PyMDbScraper
+
+
+class _FakeResponse:
+    def __init__(self, status_code, text='', headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, headers))
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_memory_tier(self):
+        cache = ResponseCache(max_memory_bytes=10)
+        cache.store('a', '12345')
+        cache.store('b', '12345')
+        cache.get('a')
+        cache.store('c', '12345')
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        cache.store('d', '12345678901')
+        self.assertNotIn('d', cache)
+
+    def test_disk_tier(self):
+        with TemporaryDirectory() as tmpdir:
+            cache = ResponseCache(tmpdir, max_memory_bytes=0)
+            cache.store('https://www.imdb.com/title/tt1/', '<html></html>', etag='"abc"')
+            cache.close()
+            cache = ResponseCache(tmpdir)
+            response = cache.get('https://www.imdb.com/title/tt1/')
+            self.assertEqual(response.text, '<html></html>')
+            self.assertEqual(response.conditional_headers(), {'If-None-Match': '"abc"'})
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, 'responses.sqlite')))
+            cache.close()
+
+    def test_disk_eviction(self):
+        with TemporaryDirectory() as tmpdir:
+            cache = ResponseCache(tmpdir, max_memory_bytes=0, max_disk_bytes=500)
+            for url in ('a', 'b', 'c'):
+                cache.store(url, os.urandom(200).hex())
+            self.assertIsNone(cache.get('a'))
+            self.assertIsNotNone(cache.get('c'))
+            cache.close()
+
+    def test_ttl(self):
+        cache = ResponseCache(ttl=60, ttls=[(r'/fullcredits', 0)])
+        self.assertTrue(cache.is_fresh(cache.store('https://www.imdb.com/title/tt1/', 'page')))
+        response = cache.store('https://www.imdb.com/title/tt1/fullcredits', 'page')
+        self.assertFalse(cache.is_fresh(response))
+        time.sleep(0.01)
+        self.assertGreater(cache.refresh(response).stored_at, response.stored_at)
+
+
+class TestScraperCache(unittest.TestCase):
+    url = 'https://www.imdb.com/title/tt1/'
+
+    def test_fresh_response_skips_request(self):
+        session = _FakeSession([_FakeResponse(200, 'page', {'ETag': '"v1"'})])
+        scraper = PyMDbScraper(rate_limiter=RateLimiter(0), cache=ResponseCache(), transport=session)
+        self.assertEqual(scraper._get(self.url), 'page')
+        self.assertEqual(scraper._get(self.url), 'page')
+        self.assertEqual(len(session.requests), 1)
+
+    def test_stale_response_revalidated(self):
+        session = _FakeSession([
+            _FakeResponse(200, 'page', {'ETag': '"v1"'}), _FakeResponse(304), _FakeResponse(200, 'new page')
+        ])
+        scraper = PyMDbScraper(rate_limiter=RateLimiter(0), cache=ResponseCache(ttl=0), transport=session)
+        self.assertEqual(scraper._get(self.url), 'page')
+        self.assertEqual(scraper._get(self.url), 'page')
+        self.assertEqual(session.requests[1], (self.url, {'If-None-Match': '"v1"'}))
+        self.assertEqual(scraper._get(self.url), 'new page')
@@ -0,0 +1,202 @@
+"""Module to test functionality of the PyMDbIndex."""
+
+import unittest
+import os
+from array import array
+from tempfile import TemporaryDirectory
+from unittest import mock
+from pymdb.indexes import PyMDbGroupedIndex, PyMDbIndex, _sort_by_key
+from pymdb.parser import (
+    _NAME_BASICS,
+    _TITLE_AKAS,
+    _TITLE_BASICS,
+    _TITLE_EPISODE,
+    _TITLE_PRINCIPALS,
+    _TITLE_RATINGS
+)
+
+
+class TestPyMDbIndex(unittest.TestCase):
+    header = 'tconst\taverageRating\tnumVotes'
+    rows = ['tt0000001\t5.6\t1550', 'tt0000002\t6.1\t186', 'tt0000010\t\\N\t7']
+
+    def _write(self, tmpdir, rows=None, filename=_TITLE_RATINGS.default_filename):
+        path = os.path.join(tmpdir, filename)
+        with open(path, 'w+') as f:
+            f.write('\n'.join([self.header] + (rows or self.rows)) + '\n')
+        return path
+
+    def test_get(self):
+        with TemporaryDirectory() as tmpdir:
+            with PyMDbIndex(self._write(tmpdir)) as index:
+                self.assertEqual(len(index), 3)
+                rating = index.get('tt0000002')
+                self.assertEqual(rating.title_id, 'tt0000002')
+                self.assertEqual(rating.average_rating, 6.1)
+                self.assertEqual(rating.num_votes, 186)
+                self.assertIsNone(index.get('tt0000003'))
+                self.assertIsNone(index.get('nm0000001'))
+                self.assertIsNone(index.get('invalid'))
+                self.assertIn('tt0000010', index)
+                self.assertNotIn('tt0000011', index)
+
+    def test_get_many(self):
+        with TemporaryDirectory() as tmpdir:
+            with PyMDbIndex(self._write(tmpdir)) as index:
+                ratings = index.get_many(['tt0000010', 'tt0000001', 'tt9999999'])
+                self.assertEqual(sorted(ratings.keys()), ['tt0000001', 'tt0000010'])
+                self.assertEqual(ratings['tt0000001'].num_votes, 1550)
+                self.assertIsNone(ratings['tt0000010'].average_rating)
+
+    def test_zero_padding(self):
+        with TemporaryDirectory() as tmpdir:
+            with PyMDbIndex(self._write(tmpdir)) as index:
+                self.assertIsNone(index.get('tt2'))
+                self.assertIsNone(index.get('tt00000002'))
+                self.assertNotIn('tt10', index)
+                self.assertEqual(list(index.get_many(['tt1', 'tt0000001']).keys()), ['tt0000001'])
+
+    def test_padded_variants(self):
+        with TemporaryDirectory() as tmpdir:
+            with PyMDbIndex(self._write(tmpdir, rows=['tt0076759\t8.6\t1000', 'tt76759\t5.0\t10'])) as index:
+                self.assertEqual(index.get('tt0076759').num_votes, 1000)
+                self.assertEqual(index.get('tt76759').num_votes, 10)
+                self.assertIn('tt76759', index)
+                self.assertIsNone(index.get('tt00076759'))
+                ratings = index.get_many(['tt76759', 'tt0076759'])
+                self.assertEqual({title_id: rating.num_votes for title_id, rating in ratings.items()},
+                                 {'tt0076759': 1000, 'tt76759': 10})
+
+    def test_unsorted_rows(self):
+        with TemporaryDirectory() as tmpdir:
+            with PyMDbIndex(self._write(tmpdir, rows=list(reversed(self.rows)))) as index:
+                self.assertEqual(index.get('tt0000001').num_votes, 1550)
+                self.assertEqual(index.get('tt0000010').num_votes, 7)
+
+    def test_persisted_and_rebuilt(self):
+        with TemporaryDirectory() as tmpdir:
+            path = self._write(tmpdir)
+            with PyMDbIndex(path) as index:
+                self.assertTrue(os.path.exists(index.index_path))
+            mtime = os.stat(f'{path}.idx').st_mtime_ns
+            with PyMDbIndex(path) as index:
+                self.assertEqual(index.get('tt0000002').num_votes, 186)
+            self.assertEqual(os.stat(f'{path}.idx').st_mtime_ns, mtime)
+
+            with open(path, 'a') as f:
+                f.write('tt0000020\t7.0\t10\n')
+            with PyMDbIndex(path) as index:
+                self.assertEqual(len(index), 4)
+                self.assertEqual(index.get('tt0000020').num_votes, 10)
+
+    def test_name_basics(self):
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'names.tsv')
+            with open(path, 'w+') as f:
+                f.write('nm0000001\tFred Astaire\t1899\t1987\tsoundtrack,actor\ttt0050419,tt0053137\n')
+            with PyMDbIndex(path, dataset=_NAME_BASICS.default_filename, contains_headers=False) as index:
+                name = index.get('nm0000001')
+                self.assertEqual(name.primary_name, 'Fred Astaire')
+                self.assertEqual(name.known_for_titles, ['tt0050419', 'tt0053137'])
+                self.assertIsNone(index.get('tt0000001'))
+
+    def test_invalid_datasets(self):
+        with TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ValueError):
+                PyMDbIndex(self._write(tmpdir, filename='unknown.tsv'))
+            with self.assertRaises(ValueError):
+                PyMDbIndex(self._write(tmpdir, filename=_TITLE_AKAS.default_filename))
+            with self.assertRaises(ValueError):
+                PyMDbIndex(os.path.join(tmpdir, f'{_TITLE_BASICS.default_filename}.gz'))
+
+
+
+class TestPyMDbGroupedIndex(unittest.TestCase):
+
+    def _write(self, tmpdir, filename, rows):
+        path = os.path.join(tmpdir, filename)
+        with open(path, 'w+') as f:
+            f.write('\n'.join(['header'] + rows) + '\n')
+        return path
+
+    def test_akas(self):
+        rows = [
+            'tt0000001\t1\tTitle\tUS\ten\t\\N\t\\N\t1',
+            'tt0000001\t2\tTitre\tFR\tfr\timdbDisplay\t\\N\t0',
+            'tt0000002\t1\tOther\tUS\ten\t\\N\t\\N\t1',
+        ]
+        with TemporaryDirectory() as tmpdir:
+            with PyMDbGroupedIndex(self._write(tmpdir, _TITLE_AKAS.default_filename, rows)) as index:
+                self.assertEqual(index.columns, ['title_id'])
+                akas = index.get('tt0000001')
+                self.assertEqual([aka.localized_title for aka in akas], ['Title', 'Titre'])
+                self.assertEqual(akas[1].types, ['imdbDisplay'])
+                self.assertEqual(index.get('tt0000003'), [])
+                with self.assertRaises(ValueError):
+                    index.get('nm0000001', column='name_id')
+
+    def test_principals(self):
+        rows = [
+            'tt0000001\t1\tnm0000001\tactor\t\\N\t["Self"]',
+            'tt0000001\t2\tnm0000002\tdirector\t\\N\t\\N',
+            'tt0000002\t1\tnm0000001\tactor\t\\N\t\\N',
+            'tt0000001\t3\tnm0000003\twriter\t\\N\t\\N',
+        ]
+        with TemporaryDirectory() as tmpdir:
+            path = self._write(tmpdir, _TITLE_PRINCIPALS.default_filename, rows)
+            with PyMDbGroupedIndex(path) as index:
+                self.assertEqual(index.columns, ['title_id', 'name_id'])
+                principals = index.get('tt0000001')
+                self.assertEqual([principal.name_id for principal in principals],
+                                 ['nm0000001', 'nm0000002', 'nm0000003'])
+                principals = index.get('nm0000001', column='name_id')
+                self.assertEqual([principal.title_id for principal in principals], ['tt0000001', 'tt0000002'])
+                found = index.get_many(['nm0000002', 'nm0000004'], column='name_id')
+                self.assertEqual(list(found.keys()), ['nm0000002'])
+                self.assertEqual(index.get('tt1'), [])
+                self.assertEqual(index.get('nm2', column='name_id'), [])
+            self.assertTrue(os.path.exists(f'{path}.groups.idx'))
+            with PyMDbGroupedIndex(path) as index:
+                self.assertEqual(len(index.get('tt0000002')), 1)
+
+    def test_episodes(self):
+        rows = [
+            'tt0000010\ttt0000001\t1\t1',
+            'tt0000011\ttt0000002\t1\t1',
+            'tt0000012\ttt0000001\t1\t2',
+            'tt0000013\t\\N\t\\N\t\\N',
+        ]
+        with TemporaryDirectory() as tmpdir:
+            with PyMDbGroupedIndex(self._write(tmpdir, _TITLE_EPISODE.default_filename, rows)) as index:
+                episodes = index.get('tt0000001')
+                self.assertEqual([episode.title_id for episode in episodes], ['tt0000010', 'tt0000012'])
+                self.assertEqual(episodes[1].episode_number, 2)
+
+    def test_invalid_datasets(self):
+        with TemporaryDirectory() as tmpdir:
+            with self.assertRaises(ValueError):
+                PyMDbGroupedIndex(self._write(tmpdir, _TITLE_BASICS.default_filename, []))
+
+
+
+class TestSortByKey(unittest.TestCase):
+    def test_chunked_sort(self):
+        keys = array('Q', [5, 3, 9, 3, 1, 5, 0, 3])
+        values = array('Q', range(len(keys)))
+        with mock.patch('pymdb.indexes._SORT_CHUNK_SIZE', 3):
+            sorted_keys, sorted_values = _sort_by_key(keys, values)
+        self.assertEqual(list(sorted_keys), [0, 1, 3, 3, 3, 5, 5, 9])
+        self.assertEqual(list(sorted_values), [6, 4, 1, 3, 7, 0, 5, 2])
+
+    def test_large_keys(self):
+        keys = array('Q', [2 ** 63, 2 ** 62, 2 ** 63])
+        sorted_keys, sorted_values = _sort_by_key(keys, array('Q', [0, 1, 2]))
+        self.assertEqual(list(sorted_keys), [2 ** 62, 2 ** 63, 2 ** 63])
+        self.assertEqual(list(sorted_values), [1, 0, 2])
+
+    def test_empty(self):
+        sorted_keys, = _sort_by_key(array('Q'))
+        self.assertEqual(len(sorted_keys), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,11 +9,15 @@ from pymdb.parser import (
     _TITLE_CREW,
     _TITLE_EPISODE,
     _TITLE_PRINCIPALS,
-    _TITLE_RATINGS
+    _TITLE_RATINGS,
+    _parse_range,
+    _split_ranges
 )
 from pymdb.exceptions import InvalidParseFormat
+from pymdb.models import DatasetChange
 import gzip
 import os
+from array import array
 from tempfile import TemporaryDirectory
 
 
@@ -1183,3 +1187,358 @@ class TestBuildPath(unittest.TestCase):
             self.assertEqual(actual_result, correct_result)
             with open(actual_result, 'r') as f:
                 self.assertEqual(f.read(), self.content)
+
+
+class TestStreamGzip(unittest.TestCase):
+    content = TestGetTitleBasics.content
+
+    def test_stream_default_filenames(self):
+        parser = PyMDbParser(gunzip_files=True, stream_gzip_files=True)
+        with TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, f'{_TITLE_BASICS.default_filename}.gz')
+            with gzip.open(filename, 'wb') as f:
+                f.write(self.content.encode('utf-8'))
+            title_basics = list(parser.get_title_basics(tmpdir, contains_headers=False))
+            self.assertTrue(os.path.exists(filename))
+            self.assertEqual(os.listdir(tmpdir), [os.path.basename(filename)])
+        self.assertEqual(len(title_basics), 2)
+        self.assertEqual(title_basics[0].title_id, TestGetTitleBasics.title_id)
+        self.assertEqual(title_basics[0].genres, TestGetTitleBasics.genres.split(','))
+
+    def test_stream_custom_filenames(self):
+        parser = PyMDbParser(use_default_filenames=False, gunzip_files=True, stream_gzip_files=True)
+        with TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'test.gz')
+            with gzip.open(filename, 'wb') as f:
+                f.write(f'headers\n{self.content}'.encode('utf-8'))
+            title_basics = list(parser.get_title_basics(filename))
+            self.assertEqual(os.listdir(tmpdir), ['test.gz'])
+        self.assertEqual(len(title_basics), 2)
+
+    def test_stream_delete_after_read(self):
+        parser = PyMDbParser(use_default_filenames=False, gunzip_files=True, delete_gzip_files=True,
+                             stream_gzip_files=True)
+        with TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'test.gz')
+            with gzip.open(filename, 'wb') as f:
+                f.write(self.content.encode('utf-8'))
+            title_basics = parser.get_title_basics(filename, contains_headers=False)
+            next(title_basics)
+            self.assertTrue(os.path.exists(filename))
+            for _ in title_basics:
+                pass
+            self.assertFalse(os.path.exists(filename))
+
+    def test_stream_build_path(self):
+        parser = PyMDbParser(gunzip_files=True, stream_gzip_files=True)
+        self.assertEqual(parser._build_path('test_dir', 'test.tsv'), 'test_dir/test.tsv.gz')
+
+
+class TestParseParallel(unittest.TestCase):
+    row_count = 500
+
+    def _write_ratings(self, tmpdir):
+        filename = os.path.join(tmpdir, _TITLE_RATINGS.default_filename)
+        with open(filename, 'w+') as f:
+            f.write('tconst\taverageRating\tnumVotes\n')
+            for i in range(self.row_count):
+                f.write(f'tt{i:07d}\t{i % 10}.5\t{i}\n')
+        return filename
+
+    def test_ordered(self):
+        parser = PyMDbParser()
+        with TemporaryDirectory() as tmpdir:
+            self._write_ratings(tmpdir)
+            expected = [rating.title_id for rating in parser.get_title_ratings(tmpdir)]
+            actual = [rating.title_id for rating in parser.get_title_ratings(tmpdir, processes=2)]
+        self.assertEqual(len(actual), self.row_count)
+        self.assertEqual(actual, expected)
+
+    def test_unordered(self):
+        parser = PyMDbParser()
+        with TemporaryDirectory() as tmpdir:
+            self._write_ratings(tmpdir)
+            actual = [rating for rating in parser.get_title_ratings(tmpdir, processes=2, ordered=False)]
+        self.assertEqual(len(actual), self.row_count)
+        self.assertEqual(sorted(rating.num_votes for rating in actual), list(range(self.row_count)))
+
+    def test_ranges_align_to_lines(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = self._write_ratings(tmpdir)
+            for range_count in (1, 3, 7, 100):
+                rows = []
+                for start, end in _split_ranges(filename, range_count):
+                    rows.extend(_parse_range(filename, start, end, _TITLE_RATINGS, True))
+                self.assertEqual([rating.num_votes for rating in rows], list(range(self.row_count)))
+
+    def test_incorrect_column_count(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, _TITLE_RATINGS.default_filename)
+            with open(filename, 'w+') as f:
+                f.write('headers\ntest1\ttest2')
+            with self.assertRaises(InvalidParseFormat):
+                for _ in PyMDbParser().get_title_ratings(tmpdir, processes=2):
+                    pass
+
+    def test_streaming_gzip(self):
+        parser = PyMDbParser(gunzip_files=True, stream_gzip_files=True)
+        with self.assertRaises(ValueError):
+            next(parser.get_title_ratings('test_dir', processes=2))
+
+
+class TestGetBatches(unittest.TestCase):
+    def test_title_basics_batches(self):
+        parser = PyMDbParser()
+        with TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, _TITLE_BASICS.default_filename)
+            with open(filename, 'w+') as f:
+                f.write(TestGetTitleBasics.content * 3)
+            batches = list(parser.get_title_basics_batches(tmpdir, batch_size=4, contains_headers=False))
+        self.assertEqual([len(batch) for batch in batches], [4, 2])
+        batch = batches[0]
+        self.assertEqual(batch.column_names, [column for column, _ in _TITLE_BASICS.columns])
+        self.assertEqual(batch['title_id'], [TestGetTitleBasics.title_id] * 4)
+        self.assertIsInstance(batch['start_year'], array)
+        self.assertEqual(batch['start_year'].typecode, 'q')
+        self.assertEqual(list(batch['start_year']), [int(TestGetTitleBasics.start_year)] * 4)
+        self.assertEqual(list(batch['end_year']), [int(TestGetTitleBasics.end_year), 0] * 2)
+        self.assertEqual(list(batch.mask('end_year')), [0, 1] * 2)
+        self.assertEqual(list(batch['is_adult']), [0] * 4)
+        self.assertEqual(batch['genres'][0], TestGetTitleBasics.genres.split(','))
+        self.assertIsNone(batch.mask('genres'))
+
+    def test_title_ratings_batches(self):
+        parser = PyMDbParser(use_default_filenames=False)
+        with TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'test.tsv')
+            with open(filename, 'w+') as f:
+                f.write('headers\ntt1\t7.5\t10\ntt2\t\\N\tabc\n')
+            batch, = parser.get_title_ratings_batches(filename)
+        self.assertEqual(batch['average_rating'].typecode, 'd')
+        self.assertEqual(list(batch['average_rating']), [7.5, 0.0])
+        self.assertEqual(list(batch.mask('average_rating')), [0, 1])
+        self.assertEqual(list(batch['num_votes']), [10, 0])
+        self.assertEqual(list(batch.mask('num_votes')), [0, 1])
+
+    def test_title_principals_batches(self):
+        parser = PyMDbParser()
+        with TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, _TITLE_PRINCIPALS.default_filename)
+            with open(filename, 'w+') as f:
+                f.write(TestGetTitlePrincipals.content)
+            batch, = parser.get_title_principals_batches(tmpdir, contains_headers=False)
+        self.assertEqual(batch['characters'], [[TestGetTitlePrincipals.character1,
+                                                TestGetTitlePrincipals.character2], None])
+        self.assertEqual(batch['job'], [TestGetTitlePrincipals.job, None])
+
+    def test_parallel_batches(self):
+        parser = PyMDbParser()
+        with TemporaryDirectory() as tmpdir:
+            TestParseParallel()._write_ratings(tmpdir)
+            batches = list(parser.get_title_ratings_batches(tmpdir, batch_size=50, processes=2))
+        self.assertTrue(all(len(batch) <= 50 for batch in batches))
+        num_votes = [votes for batch in batches for votes in batch['num_votes']]
+        self.assertEqual(num_votes, list(range(TestParseParallel.row_count)))
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            next(PyMDbParser().get_title_ratings_batches('test_dir', batch_size=0))
+
+
+class TestColumnsAndWhere(unittest.TestCase):
+    content = 'tt1\tmovie\tTitle 1\tTitle 1\t0\t1999\t\\N\t90\tDrama,Comedy\n' + \
+              'tt2\tshort\tTitle 2\tTitle 2\t0\t2005\t\\N\t10\tShort\n' + \
+              'tt3\tmovie\tTitle 3\tTitle 3\t1\t2010\t\\N\t\\N\tAdult\n' + \
+              'tt4\tmovie\tTitle 4\tTitle 4\t0\t\\N\t\\N\t\\N\t\\N\n'
+
+    def _get_title_basics(self, **kwargs):
+        with TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, _TITLE_BASICS.default_filename)
+            with open(filename, 'w+') as f:
+                f.write(self.content)
+            return list(PyMDbParser().get_title_basics(tmpdir, contains_headers=False, **kwargs))
+
+    def test_columns(self):
+        title_basics = self._get_title_basics(columns=['title_id', 'start_year'])
+        self.assertEqual(len(title_basics), 4)
+        self.assertEqual(title_basics[0].title_id, 'tt1')
+        self.assertEqual(title_basics[0].start_year, 1999)
+        self.assertIsNone(title_basics[0].primary_title)
+        self.assertIsNone(title_basics[0].runtime)
+        self.assertEqual(title_basics[0].genres, [])
+
+    def test_where_value(self):
+        title_basics = self._get_title_basics(where={'title_type': 'movie'})
+        self.assertEqual([title.title_id for title in title_basics], ['tt1', 'tt3', 'tt4'])
+        self.assertEqual(title_basics[0].genres, ['Drama', 'Comedy'])
+
+    def test_where_function(self):
+        title_basics = self._get_title_basics(
+            where={'title_type': 'movie', 'start_year': lambda year: year is not None and year >= 2000}
+        )
+        self.assertEqual([title.title_id for title in title_basics], ['tt3'])
+
+    def test_where_bool_and_missing(self):
+        title_basics = self._get_title_basics(where={'is_adult': False, 'runtime': None})
+        self.assertEqual([title.title_id for title in title_basics], ['tt4'])
+
+    def test_batches(self):
+        with TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, _TITLE_BASICS.default_filename)
+            with open(filename, 'w+') as f:
+                f.write(self.content)
+            batch, = PyMDbParser().get_title_basics_batches(
+                tmpdir, contains_headers=False, columns=['start_year', 'title_id'], where={'title_type': 'movie'}
+            )
+        self.assertEqual(batch.column_names, ['start_year', 'title_id'])
+        self.assertEqual(batch['title_id'], ['tt1', 'tt3', 'tt4'])
+        self.assertEqual(list(batch.mask('start_year')), [0, 0, 1])
+
+    def test_unknown_column(self):
+        with self.assertRaises(ValueError):
+            self._get_title_basics(columns=['unknown'])
+        with self.assertRaises(ValueError):
+            self._get_title_basics(where={'unknown': 'value'})
+
+
+class TestJoinTitles(unittest.TestCase):
+    basics = 'tt1\tmovie\tFirst\tFirst\t0\t1999\t\\N\t90\tDrama\n' + \
+        'tt3\tmovie\tThird\tThird\t0\t2001\t\\N\t\\N\t\\N\n'
+    ratings = 'tt1\t7.5\t100\ntt2\t6.0\t10\n'
+    akas = 'tt1\t1\tPremier\tFR\tfr\t\\N\t\\N\t0\ntt1\t2\tFirst\tUS\ten\t\\N\t\\N\t1\n' + \
+        'tt3\t1\tThird\tUS\ten\t\\N\t\\N\t1\n'
+
+    def _write(self, tmpdir, datasets):
+        for dataset, content in datasets:
+            with open(os.path.join(tmpdir, dataset.default_filename), 'w+') as f:
+                f.write(content)
+
+    def test_join_titles(self):
+        with TemporaryDirectory() as tmpdir:
+            self._write(tmpdir, [(_TITLE_BASICS, self.basics), (_TITLE_RATINGS, self.ratings),
+                                 (_TITLE_AKAS, self.akas)])
+            records = list(PyMDbParser().join_titles(tmpdir, datasets=['basics', 'rating', 'akas'],
+                                                     contains_headers=False))
+        self.assertEqual([record.title_id for record in records], ['tt1', 'tt2', 'tt3'])
+        self.assertEqual(records[0].basics.primary_title, 'First')
+        self.assertEqual(records[0].rating.num_votes, 100)
+        self.assertEqual([aka.localized_title for aka in records[0].akas], ['Premier', 'First'])
+        self.assertIsNone(records[0].crew)
+        self.assertIsNone(records[1].basics)
+        self.assertEqual(records[1].akas, [])
+        self.assertIsNone(records[2].rating)
+        self.assertEqual(len(records[2].akas), 1)
+        self.assertEqual(records[2].principals, [])
+
+    def test_custom_filenames(self):
+        with TemporaryDirectory() as tmpdir:
+            basics = os.path.join(tmpdir, 'basics.tsv')
+            ratings = os.path.join(tmpdir, 'ratings.tsv')
+            with open(basics, 'w+') as f:
+                f.write(self.basics)
+            with open(ratings, 'w+') as f:
+                f.write(self.ratings)
+            parser = PyMDbParser(use_default_filenames=False)
+            records = list(parser.join_titles({'basics': basics, 'rating': ratings}, datasets=['basics', 'rating'],
+                                              contains_headers=False))
+        self.assertEqual([record.title_id for record in records], ['tt1', 'tt2', 'tt3'])
+
+    def test_unsorted_dataset(self):
+        with TemporaryDirectory() as tmpdir:
+            self._write(tmpdir, [(_TITLE_RATINGS, 'tt2\t6.0\t10\ntt1\t7.5\t100\n')])
+            with self.assertRaises(ValueError):
+                list(PyMDbParser().join_titles(tmpdir, datasets=['rating'], contains_headers=False))
+
+    def test_duplicate_title_id(self):
+        with TemporaryDirectory() as tmpdir:
+            self._write(tmpdir, [(_TITLE_RATINGS, 'tt1\t7.5\t100\ntt1\t6.0\t10\n')])
+            with self.assertRaises(ValueError):
+                list(PyMDbParser().join_titles(tmpdir, datasets=['rating'], contains_headers=False))
+
+    def test_unknown_dataset(self):
+        with self.assertRaises(ValueError):
+            list(PyMDbParser().join_titles('', datasets=['unknown']))
+        with self.assertRaises(ValueError):
+            list(PyMDbParser().join_titles('', datasets=[]))
+        with self.assertRaises(ValueError):
+            list(PyMDbParser().join_titles('', datasets=['rating', 'rating']))
+
+
+class TestGetChanges(unittest.TestCase):
+    old_ratings = 'tt1\t7.5\t100\ntt2\t6.0\t10\ntt3\t5.0\t1\n'
+    new_ratings = 'tt1\t7.5\t100\ntt3\t5.5\t2\ntt4\t8.0\t5\n'
+
+    def _write(self, tmpdir, name, content):
+        os.makedirs(os.path.join(tmpdir, name))
+        with open(os.path.join(tmpdir, name, _TITLE_RATINGS.default_filename), 'w+') as f:
+            f.write(content)
+        return os.path.join(tmpdir, name)
+
+    def test_get_changes(self):
+        with TemporaryDirectory() as tmpdir:
+            old_path = self._write(tmpdir, 'old', self.old_ratings)
+            new_path = self._write(tmpdir, 'new', self.new_ratings)
+            changes = list(PyMDbParser().get_changes(old_path, new_path, _TITLE_RATINGS.default_filename,
+                                                     contains_headers=False))
+        self.assertEqual([(change.change_type, change.key) for change in changes], [
+            (DatasetChange.REMOVED, ('tt2',)), (DatasetChange.CHANGED, ('tt3',)), (DatasetChange.ADDED, ('tt4',))
+        ])
+        self.assertEqual(changes[0].old.num_votes, 10)
+        self.assertIsNone(changes[0].new)
+        self.assertEqual(changes[1].old.average_rating, 5.0)
+        self.assertEqual(changes[1].new.average_rating, 5.5)
+        self.assertIsNone(changes[2].old)
+        self.assertEqual(changes[2].new.num_votes, 5)
+
+    def test_row_hashes(self):
+        with TemporaryDirectory() as tmpdir:
+            old_path = self._write(tmpdir, 'old', self.old_ratings)
+            new_path = self._write(tmpdir, 'new', self.new_ratings)
+            hashes_path = os.path.join(tmpdir, 'old.hashes')
+            parser = PyMDbParser()
+            self.assertEqual(len(list(parser.get_changes(new_path, old_path, _TITLE_RATINGS.default_filename,
+                                                         contains_headers=False, hashes_path=hashes_path))), 3)
+            changes = list(parser.get_changes(None, new_path, _TITLE_RATINGS.default_filename,
+                                              contains_headers=False, old_hashes_path=hashes_path))
+        self.assertEqual([(change.change_type, change.key) for change in changes], [
+            (DatasetChange.REMOVED, ('tt2',)), (DatasetChange.CHANGED, ('tt3',)), (DatasetChange.ADDED, ('tt4',))
+        ])
+        self.assertIsNone(changes[0].old)
+        self.assertIsNone(changes[1].old)
+        self.assertEqual(changes[1].new.num_votes, 2)
+
+    def test_ordering_key(self):
+        old_akas = 'tt1\t1\tA\tUS\ten\t\\N\t\\N\t1\ntt1\t2\tB\tFR\tfr\t\\N\t\\N\t0\n'
+        new_akas = 'tt1\t1\tA\tUS\ten\t\\N\t\\N\t1\ntt1\t2\tC\tFR\tfr\t\\N\t\\N\t0\n' + \
+            'tt1\t10\tD\tDE\tde\t\\N\t\\N\t0\n'
+        with TemporaryDirectory() as tmpdir:
+            old_path = os.path.join(tmpdir, 'old.tsv')
+            new_path = os.path.join(tmpdir, 'new.tsv')
+            with open(old_path, 'w+') as f:
+                f.write(old_akas)
+            with open(new_path, 'w+') as f:
+                f.write(new_akas)
+            changes = list(PyMDbParser(use_default_filenames=False).get_changes(
+                old_path, new_path, _TITLE_AKAS.default_filename, contains_headers=False
+            ))
+        self.assertEqual([(change.change_type, change.key) for change in changes], [
+            (DatasetChange.CHANGED, ('tt1', 2)), (DatasetChange.ADDED, ('tt1', 10))
+        ])
+        self.assertEqual(changes[0].new.localized_title, 'C')
+
+    def test_invalid_arguments(self):
+        parser = PyMDbParser()
+        with self.assertRaises(ValueError):
+            list(parser.get_changes('old', 'new', 'unknown.tsv'))
+        with self.assertRaises(ValueError):
+            list(parser.get_changes(None, 'new', _TITLE_RATINGS.default_filename))
+        with self.assertRaises(ValueError):
+            list(parser.get_changes('old', 'new', _TITLE_RATINGS.default_filename, old_hashes_path='hashes'))
+
+    def test_unsorted_dataset(self):
+        with TemporaryDirectory() as tmpdir:
+            old_path = self._write(tmpdir, 'old', self.old_ratings)
+            new_path = self._write(tmpdir, 'new', 'tt2\t6.0\t10\ntt1\t7.5\t100\n')
+            with self.assertRaises(ValueError):
+                list(PyMDbParser().get_changes(old_path, new_path, _TITLE_RATINGS.default_filename,
+                                               contains_headers=False))
@@ -0,0 +1,83 @@
+"""Module to test functionality of the RateLimiter."""
+
+import unittest
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pymdb.ratelimit import RateLimiter, get_shared_rate_limiter
+from pymdb.scraper import PyMDbScraper
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst(self):
+        limiter = RateLimiter(1000, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_interval(self):
+        limiter = RateLimiter(50)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.14)
+
+    def test_interval_counts_request_time(self):
+        limiter = RateLimiter(50)
+        limiter.acquire()
+        time.sleep(0.06)
+        start = time.monotonic()
+        limiter.acquire()
+        self.assertLess(time.monotonic() - start, 0.04)
+
+    def test_threads(self):
+        limiter = RateLimiter(30)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: limiter.acquire(), range(5)))
+        self.assertGreaterEqual(time.monotonic() - start, 0.11)
+
+    def test_acquire_async(self):
+        limiter = RateLimiter(30)
+
+        async def acquire_all():
+            await asyncio.gather(*(limiter.acquire_async() for _ in range(5)))
+
+        start = time.monotonic()
+        asyncio.get_event_loop().run_until_complete(acquire_all())
+        self.assertGreaterEqual(time.monotonic() - start, 0.11)
+
+    def test_pause(self):
+        limiter = RateLimiter(0)
+        limiter.pause(0.1)
+        start = time.monotonic()
+        limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        start = time.monotonic()
+        limiter.acquire()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    def test_pause_spaces_waiters(self):
+        limiter = RateLimiter(1000, burst=3)
+        limiter.pause(5)
+        delays = [limiter._reserve() for _ in range(6)]
+        for expected, delay in zip(range(5, 11), delays):
+            self.assertAlmostEqual(delay, expected, delta=0.05)
+
+    def test_pause_keeps_later_pause(self):
+        limiter = RateLimiter(1000)
+        limiter.pause(5)
+        limiter.pause(1)
+        self.assertAlmostEqual(limiter._reserve(), 5, delta=0.05)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(-1)
+        with self.assertRaises(ValueError):
+            RateLimiter(1000, burst=0)
+
+    def test_shared_rate_limiter(self):
+        self.assertIs(get_shared_rate_limiter(1234), get_shared_rate_limiter(1234))
+        self.assertIsNot(get_shared_rate_limiter(1234), get_shared_rate_limiter(1234, burst=2))
+        self.assertIs(PyMDbScraper(rate_limit=1234)._rate_limiter, PyMDbScraper(rate_limit=1234)._rate_limiter)
@@ -0,0 +1,169 @@
+"""Module to test functionality of the RetryPolicy."""
+
+import unittest
+import threading
+import time
+from email.utils import formatdate
+from io import BytesIO
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from requests import Response
+from requests.exceptions import ConnectionError, HTTPError
+from pymdb.ratelimit import RateLimiter
+from pymdb.retry import CircuitBreaker, RetryPolicy, _parse_retry_after
+from pymdb.scraper import PyMDbScraper
+from pymdb.transport import SessionTransport
+from tests.pages import FULL_CREDITS_PAGE
+
+def _response(status_code, headers=None, text=''):
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = text.encode('utf8')
+    response.raw = BytesIO(response._content)
+    response.encoding = 'utf8'
+    return response
+
+
+class _FakeSend:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.timeouts = []
+
+    def __call__(self, timeout):
+        self.timeouts.append(timeout)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_retries_until_success(self):
+        send = _FakeSend(_response(503), ConnectionError(), _response(200))
+        policy = RetryPolicy(backoff=0.01, timeout=5)
+        response = policy.send(send, RateLimiter(0))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(send.timeouts, [5, 5, 5])
+
+    def test_retries_run_out(self):
+        send = _FakeSend(_response(500), _response(500), _response(502))
+        policy = RetryPolicy(max_retries=2, backoff=0.01)
+        self.assertEqual(policy.send(send, RateLimiter(0)).status_code, 502)
+
+        send = _FakeSend(ConnectionError(), ConnectionError())
+        with self.assertRaises(ConnectionError):
+            RetryPolicy(max_retries=1, backoff=0.01).send(send, RateLimiter(0))
+
+    def test_not_retried(self):
+        send = _FakeSend(_response(404), _response(200))
+        self.assertEqual(RetryPolicy(backoff=0.01).send(send, RateLimiter(0)).status_code, 404)
+        self.assertEqual(len(send.results), 1)
+
+    def test_backoff(self):
+        policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+        self.assertEqual([policy.get_delay(attempt) for attempt in range(5)], [1, 2, 4, 5, 5])
+        policy = RetryPolicy(backoff=1, max_backoff=5)
+        for _ in range(20):
+            self.assertTrue(2 <= policy.get_delay(2) <= 4)
+
+    def test_retry_after(self):
+        limiter = RateLimiter(0)
+        send = _FakeSend(_response(429, {'Retry-After': '0'}), _response(200))
+        self.assertEqual(RetryPolicy(backoff=10).send(send, limiter).status_code, 200)
+        self.assertEqual(_parse_retry_after('120'), 120)
+        self.assertIsNone(_parse_retry_after('soon'))
+        self.assertIsNone(_parse_retry_after(None))
+        self.assertTrue(55 <= _parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_retries=-1)
+        with self.assertRaises(ValueError):
+            CircuitBreaker(threshold=0)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold(self):
+        limiter = RateLimiter(0)
+        breaker = CircuitBreaker(threshold=3, cooldown=0.1)
+        self.assertFalse(breaker.record_failure(limiter))
+        self.assertFalse(breaker.record_failure(limiter))
+        self.assertTrue(breaker.record_failure(limiter))
+        start = time.monotonic()
+        limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_success_resets(self):
+        limiter = RateLimiter(0)
+        breaker = CircuitBreaker(threshold=2, cooldown=10)
+        breaker.record_failure(limiter)
+        breaker.record_success()
+        self.assertFalse(breaker.record_failure(limiter))
+
+
+class _FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+
+    def get(self, request, headers=None, timeout=None):
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+class TestScraperRetries(unittest.TestCase):
+    def test_get_retries(self):
+        scraper = PyMDbScraper(rate_limiter=RateLimiter(0), retry_policy=RetryPolicy(backoff=0.01),
+                               transport=_FakeSession(_response(503), _response(200, text='<html></html>')))
+        self.assertEqual(scraper._get('https://www.imdb.com/title/tt0076759/'), '<html></html>')
+
+    def test_get_raises_after_retries(self):
+        scraper = PyMDbScraper(rate_limiter=RateLimiter(0), retry_policy=RetryPolicy(max_retries=1, backoff=0.01),
+                               transport=_FakeSession(_response(503), _response(503)))
+        with self.assertRaises(HTTPError):
+            scraper._get('https://www.imdb.com/title/tt0076759/')
+
+    def test_stream_retry_releases_connection(self):
+        requests_served = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                requests_served.append(self.path)
+                if len(requests_served) == 1:
+                    status_code, body = 503, b'x' * 100000
+                else:
+                    status_code, body = 200, FULL_CREDITS_PAGE.encode('utf8')
+                self.send_response(status_code)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), Handler)
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        try:
+            host, port = server.server_address[:2]
+            transport = SessionTransport(pool_maxsize=1, pool_block=True, base_url=f'http://{host}:{port}')
+            scraper = PyMDbScraper(rate_limiter=RateLimiter(0), transport=transport,
+                                   retry_policy=RetryPolicy(backoff=0.01, timeout=5))
+            credits = []
+            # A connection left checked out of the pool blocks the retry forever
+            scrape_thread = threading.Thread(
+                target=lambda: credits.extend(scraper.get_full_cast('tt0076759', stream=True)), daemon=True
+            )
+            scrape_thread.start()
+            scrape_thread.join(10)
+            self.assertFalse(scrape_thread.is_alive())
+            self.assertEqual(len(requests_served), 2)
+            self.assertEqual([credit.name_id for credit in credits], ['nm0000434', 'nm0000148'])
+            scraper.close()
+        finally:
+            server.shutdown()
+            server.server_close()
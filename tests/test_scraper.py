@@ -4,10 +4,16 @@ import unittest
 import re
 from collections import defaultdict
 from datetime import datetime
+from requests import Response
 from requests.exceptions import HTTPError
+from tempfile import TemporaryDirectory
+import os
 from pymdb.exceptions import InvalidCompanyId
+from pymdb.ratelimit import RateLimiter
 from pymdb.scraper import PyMDbScraper
-from pymdb import CreditScrape, NameCreditScrape, SearchResultName, SearchResultTitle
+from pymdb.transport import Transport, TransportResponse
+from tests.pages import FULL_CREDITS_PAGE, episodes_page
+from pymdb import CreditScrape, LazyTitleScrape, NameCreditScrape, SearchResultName, SearchResultTitle
 from pymdb.models.name import (
     ACTOR,
     ART_DEPARTMENT,
@@ -1793,3 +1799,383 @@ class TestGetTree(unittest.TestCase):
         request = 'https://postman-echo.com/status/524'
         with self.assertRaises(HTTPError):
             PyMDbScraper()._get_tree(request)
+
+
+class TestSession(unittest.TestCase):
+    def test_pooled_session(self):
+        with PyMDbScraper(pool_connections=2, pool_maxsize=4, pool_block=True) as scraper:
+            adapter = scraper._transport.session.get_adapter('https://www.imdb.com/')
+            self.assertEqual(adapter._pool_connections, 2)
+            self.assertEqual(adapter._pool_maxsize, 4)
+            self.assertTrue(adapter._pool_block)
+            self.assertEqual(scraper._transport.session.headers['user-agent'], PyMDbScraper._headers['user-agent'])
+            self.assertIs(scraper._transport.session.get_adapter('http://www.imdb.com/'), adapter)
+
+
+class _FakeTitleScraper(PyMDbScraper):
+    def get_title(self, title_id, include_taglines=False):
+        if title_id == 'tt_error':
+            raise HTTPError('404')
+        return f'{title_id} {include_taglines}'
+
+
+class TestScrapeMany(unittest.TestCase):
+    def test_get_titles(self):
+        with _FakeTitleScraper() as scraper:
+            results = list(scraper.get_titles(['tt1', 'tt_error', 'tt2'], include_taglines=True, max_workers=2))
+        results = {result.imdb_id: result for result in results}
+        self.assertEqual(results['tt1'].value, 'tt1 True')
+        self.assertTrue(results['tt2'].succeeded)
+        self.assertFalse(results['tt_error'].succeeded)
+        self.assertIsInstance(results['tt_error'].error, HTTPError)
+        self.assertIsNone(results['tt_error'].value)
+
+    def test_checkpoint(self):
+        with TemporaryDirectory() as tmpdir:
+            checkpoint_path = os.path.join(tmpdir, 'checkpoint.txt')
+            with _FakeTitleScraper() as scraper:
+                results = scraper.get_titles(['tt1', 'tt2', 'tt_error', 'tt3'], max_workers=1,
+                                             checkpoint_path=checkpoint_path)
+                first = next(results)
+                results.close()
+                results = list(scraper.get_titles(['tt1', 'tt2', 'tt_error', 'tt3'], max_workers=1,
+                                                  checkpoint_path=checkpoint_path))
+            self.assertNotIn(first.imdb_id, [result.imdb_id for result in results])
+            self.assertEqual(len(results), 3)
+            with open(checkpoint_path) as f:
+                self.assertEqual(sorted(f.read().split()), ['tt1', 'tt2', 'tt3'])
+
+    def test_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            list(PyMDbScraper().get_titles(['tt1'], max_workers=0))
+
+
+class _FakePageScraper(PyMDbScraper):
+    def __init__(self, pages, **kwargs):
+        super().__init__(**kwargs)
+        self.pages = pages
+        self.requests = []
+
+    def _get(self, request):
+        self.requests.append(request)
+        for pattern, page in self.pages.items():
+            if pattern in request:
+                return page
+        raise HTTPError(f'404 for {request}')
+
+
+class TestFullCreditsSingleFetch(unittest.TestCase):
+    def test_get_full_credits(self):
+        scraper = _FakePageScraper({'/fullcredits': FULL_CREDITS_PAGE})
+        credits = list(scraper.get_full_credits('tt0076759'))
+        self.assertEqual(len(scraper.requests), 1)
+        self.assertEqual([(credit.name_id, credit.job_title) for credit in credits], [
+            ('nm0000434', ACTOR), ('nm0000148', ACTOR), ('nm0000184', DIRECTOR), ('nm0000184', WRITER)
+        ])
+        self.assertEqual(credits[0].credit, 'Luke Skywalker')
+        self.assertEqual(credits[0].episode_count, 2)
+        self.assertEqual(credits[3].credit, 'written by')
+
+    def test_get_full_credits_as_dict(self):
+        scraper = _FakePageScraper({'/fullcredits': FULL_CREDITS_PAGE})
+        full_credits = scraper.get_full_credits_as_dict('tt0076759')
+        self.assertEqual(len(scraper.requests), 1)
+        self.assertEqual(len(full_credits[ACTOR]), 2)
+        self.assertEqual(len(full_credits[DIRECTOR]), 1)
+
+
+def _filmography_row(title_id, role, inline_title_id):
+    return f'''
+    <div class="filmo-row" id="actor-{title_id}">
+        <span class="year_column">1977</span><b><a href="/title/{title_id}/">Series</a></b> (TV Series)<br/>{role}
+        <div id="more-episodes-{title_id}-actor"></div>
+        <div class="filmo-episodes">
+            <div><a onclick="toggleFilmoEpisodes(this,'nm0000434','{title_id}','actor','nm_flmg_shw_1')">Show all</a></div>
+        </div>
+        <div class="filmo-episodes"><a href="/title/{inline_title_id}/">Episode</a> (1977) ... {role}</div>
+    </div>
+    '''
+
+
+class TestConcurrentEpisodes(unittest.TestCase):
+    def test_get_full_cast(self):
+        scraper = _FakePageScraper({
+            '/fullcredits': FULL_CREDITS_PAGE,
+            'nm0000434/episodes': episodes_page('tt0000001', 'tt0000002'),
+            'nm0000148/episodes': episodes_page('tt0000003'),
+        }, prefetch_workers=2)
+        credits = list(scraper.get_full_cast('tt0076759', include_episodes=True))
+        self.assertEqual(len(scraper.requests), 3)
+        self.assertEqual([(credit.name_id, credit.title_id) for credit in credits], [
+            ('nm0000434', 'tt0000001'), ('nm0000434', 'tt0000002'), ('nm0000434', 'tt0076759'),
+            ('nm0000148', 'tt0000003'), ('nm0000148', 'tt0076759')
+        ])
+
+    def test_get_full_cast_error(self):
+        scraper = _FakePageScraper({
+            '/fullcredits': FULL_CREDITS_PAGE,
+            'nm0000434/episodes': episodes_page('tt0000001'),
+        }, prefetch_workers=2)
+        with self.assertRaises(HTTPError):
+            list(scraper.get_full_cast('tt0076759', include_episodes=True))
+
+    def test_get_name_credits(self):
+        name_page = '<div id="filmography">' + _filmography_row('tt0000010', 'Luke', 'tt0000011') + \
+                    _filmography_row('tt0000020', 'Han', 'tt0000021') + '</div>'
+        scraper = _FakePageScraper({
+            'title=tt0000010': episodes_page('tt0000012', 'tt0000013'),
+            'title=tt0000020': '',
+            '/name/nm0000434/': name_page,
+        }, prefetch_workers=2)
+        credits = list(scraper.get_name_credits('nm0000434', include_episodes=True))
+        self.assertEqual(len(scraper.requests), 3)
+        self.assertEqual([credit.title_id for credit in credits], [
+            'tt0000012', 'tt0000013', 'tt0000010', 'tt0000020'
+        ])
+        self.assertEqual(credits[0].role, 'Role')
+
+    def test_get_name_credits_not_found(self):
+        name_page = '<div id="filmography">' + _filmography_row('tt0000010', 'Luke', 'tt0000011') + '</div>'
+        scraper = _FakePageScraper({'/name/nm0000434/': name_page}, prefetch_workers=2)
+        scraper._get = _not_found_episodes(scraper._get)
+        credits = list(scraper.get_name_credits('nm0000434', include_episodes=True))
+        self.assertEqual([credit.title_id for credit in credits], ['tt0000011', 'tt0000010'])
+
+
+def _not_found_episodes(get):
+    def _get(request):
+        if '/episodes/' in request:
+            response = Response()
+            response.status_code = 404
+            raise HTTPError('404', response=response)
+        return get(request)
+    return _get
+
+
+class _FakeCompanyScraper(PyMDbScraper):
+    def __init__(self, title_count, **kwargs):
+        super().__init__(**kwargs)
+        self.title_count = title_count
+        self.requests = []
+
+    def _get(self, request):
+        self.requests.append(request)
+        start = int(re.search(r'start=(\d+)', request).group(1))
+        end = min(start + 49, self.title_count)
+        rows = ''.join(
+            f'<span class="lister-item-header"><span class="lister-item-index">{i}.</span>'
+            f'<span><a href="/title/tt{i:07d}/">Title</a> <span class="lister-item-year">(2001)</span></span></span>'
+            for i in range(start, end + 1)
+        )
+        return f'''
+        <div class="article"><h1 class="header">Lucasfilm (Sorted by Popularity Ascending)</h1>
+            <div class="desc"><span>{start}-{end} of {self.title_count:,} titles.</span></div>
+            <div class="lister-list">{rows}</div>
+        </div>
+        '''
+
+
+class TestCompanyPrefetch(unittest.TestCase):
+    def test_get_company_in_order(self):
+        scraper = _FakeCompanyScraper(1234, prefetch_workers=3)
+        titles = list(scraper.get_company('co0071326'))
+        self.assertEqual([title.title_id for title in titles], [f'tt{i:07d}' for i in range(1, 1235)])
+        self.assertEqual(len(scraper.requests), 25)
+        self.assertEqual(titles[0].start_year, 2001)
+
+    def test_get_company_stops_early(self):
+        scraper = _FakeCompanyScraper(20000, prefetch_workers=2)
+        titles = scraper.get_company('co0071326')
+        first_titles = [next(titles) for _ in range(60)]
+        titles.close()
+        self.assertEqual(first_titles[-1].title_id, 'tt0000060')
+        self.assertLessEqual(len(scraper.requests), 7)
+
+
+_TITLE_PAGE = '''
+<div class="title_wrapper">
+    <h1>A New Hope <span id="titleYear">(1977)</span></h1>
+    <div class="subtext">PG <span class="ghost">|</span> <time>2h 1min</time></div>
+</div>
+<div class="summary_text">Luke Skywalker joins forces with a Jedi Knight.</div>
+<table class="cast_list">
+    <tr class="odd"><td></td><td><a href="/name/nm0000434/">Mark Hamill</a></td><td class="character">Luke</td></tr>
+    <tr class="even"><td></td><td><a href="/name/nm0000148/">Harrison Ford</a></td><td class="character">Han</td></tr>
+    <tr class="odd"><td></td><td><a href="/name/nm0000402/">Carrie Fisher</a></td><td class="character">Leia</td></tr>
+</table>
+<div id="titleDetails">
+    <div class="txt-block"><h4 class="inline">Country:</h4> <a href="/country/us">USA</a></div>
+    <div class="txt-block"><h4 class="inline">Language:</h4> <a href="/language/en">English</a></div>
+</div>
+'''
+
+
+class TestTitleSinglePass(unittest.TestCase):
+    def test_get_title(self):
+        scraper = _FakePageScraper({'/title/tt0076759/': _TITLE_PAGE})
+        title = scraper.get_title('tt0076759')
+        self.assertEqual(len(scraper.requests), 1)
+        self.assertEqual(title.display_title, 'A New Hope')
+        self.assertEqual(title.mpaa_rating, 'PG')
+        self.assertEqual(title.plot, 'Luke Skywalker joins forces with a Jedi Knight.')
+        self.assertEqual(title.country, 'USA')
+        self.assertEqual(title.language, 'English')
+        self.assertEqual([credit.name_id for credit in title.top_cast], ['nm0000434', 'nm0000148', 'nm0000402'])
+        self.assertEqual(title.top_cast[1].credit, 'Han')
+
+
+class TestScrapePages(unittest.TestCase):
+    def test_scrape_page(self):
+        scraper = PyMDbScraper()
+        title = scraper.scrape_page('https://www.imdb.com/title/tt0076759/', _TITLE_PAGE)
+        self.assertEqual(title.title_id, 'tt0076759')
+        self.assertEqual(title.display_title, 'A New Hope')
+        credits = scraper.scrape_page('https://www.imdb.com/title/tt0076759/fullcredits', FULL_CREDITS_PAGE)
+        self.assertEqual([(credit.name_id, credit.job_title) for credit in credits], [
+            ('nm0000434', ACTOR), ('nm0000148', ACTOR), ('nm0000184', DIRECTOR), ('nm0000184', WRITER)
+        ])
+        with self.assertRaises(ValueError):
+            scraper.scrape_page('https://www.imdb.com/title/tt0076759/taglines', '')
+
+    def test_scrape_pages(self):
+        pages = [
+            ('https://www.imdb.com/title/tt0076759/', _TITLE_PAGE),
+            ('https://www.imdb.com/title/tt0076759/taglines', ''),
+            ('https://www.imdb.com/title/tt0076759/fullcredits', FULL_CREDITS_PAGE),
+            ('https://www.imdb.com/title/tt0080684/fullcredits', '<div></div>'),
+        ] * 5
+        results = list(PyMDbScraper().scrape_pages(pages, max_workers=2, chunksize=3))
+        self.assertEqual(len(results), 15)
+        results_by_url = {result.url: result for result in results}
+        self.assertEqual(results_by_url['https://www.imdb.com/title/tt0076759/'].value.display_title, 'A New Hope')
+        self.assertEqual(len(results_by_url['https://www.imdb.com/title/tt0076759/fullcredits'].value), 4)
+        failed = results_by_url['https://www.imdb.com/title/tt0080684/fullcredits']
+        self.assertEqual(failed.imdb_id, 'tt0080684')
+        self.assertFalse(failed.succeeded)
+
+    def test_invalid_chunksize(self):
+        with self.assertRaises(ValueError):
+            list(PyMDbScraper().scrape_pages([], chunksize=0))
+
+
+class TestLazyTitle(unittest.TestCase):
+    def test_get_title_lazy(self):
+        scraper = _FakePageScraper({
+            '/taglines': '<div class="soda">May the Force be with you</div>',
+            '/title/tt0076759/': _TITLE_PAGE,
+        })
+        title = scraper.get_title('tt0076759', include_taglines=True, lazy=True)
+        self.assertIsInstance(title, LazyTitleScrape)
+        self.assertEqual(len(scraper.requests), 1)
+        self.assertFalse(title.is_loaded('display_title'))
+        self.assertEqual(title.display_title, 'A New Hope')
+        self.assertTrue(title.is_loaded('mpaa_rating'))
+        self.assertFalse(title.is_loaded('top_cast'))
+        self.assertEqual(title.mpaa_rating, 'PG')
+        self.assertEqual(title.country, 'USA')
+        self.assertEqual([credit.name_id for credit in title.top_cast], ['nm0000434', 'nm0000148', 'nm0000402'])
+        self.assertEqual(len(scraper.requests), 1)
+        self.assertEqual(title.taglines, ['May the Force be with you'])
+        self.assertEqual(len(scraper.requests), 2)
+
+    def test_get_title_lazy_matches_eager(self):
+        scraper = _FakePageScraper({'/title/tt0076759/': _TITLE_PAGE})
+        title = scraper.get_title('tt0076759')
+        lazy_title = scraper.get_title('tt0076759', lazy=True)
+        self.assertEqual(str(lazy_title), str(title))
+        self.assertEqual(lazy_title.taglines, [])
+
+    def test_set_lazy_field(self):
+        scraper = _FakePageScraper({'/title/tt0076759/': _TITLE_PAGE})
+        title = scraper.get_title('tt0076759', lazy=True)
+        title.release_date = '1977-05-25'
+        self.assertTrue(title.is_loaded('release_date'))
+        self.assertEqual(title.release_date, datetime(1977, 5, 25))
+        self.assertEqual(title.language, 'English')
+        self.assertEqual(title.release_date, datetime(1977, 5, 25))
+
+
+class _StreamingTransport(Transport):
+    def __init__(self, pages, chunk_size=64):
+        self.pages = pages
+        self.chunk_size = chunk_size
+        self.chunks_read = 0
+        self.closed = False
+
+    def get(self, url, headers=None, timeout=None):
+        for pattern, page in self.pages.items():
+            if pattern in url:
+                return TransportResponse(url, 200, page)
+        return TransportResponse(url, 404, '')
+
+    def stream(self, url, headers=None, timeout=None):
+        response = self.get(url, headers=headers, timeout=timeout)
+        transport = self
+
+        class _StreamingResponse:
+            status_code = response.status_code
+            headers = response.headers
+
+            def raise_for_status(self):
+                response.raise_for_status()
+
+            def iter_content(self, chunk_size=1, decode_unicode=False):
+                for chunk in response.iter_content(transport.chunk_size, decode_unicode):
+                    transport.chunks_read += 1
+                    yield chunk
+
+            def close(self):
+                transport.closed = True
+
+        return _StreamingResponse()
+
+
+class TestStreaming(unittest.TestCase):
+    def _scraper(self, pages, **kwargs):
+        transport = _StreamingTransport(pages)
+        return PyMDbScraper(rate_limiter=RateLimiter(0), transport=transport, **kwargs), transport
+
+    def test_get_full_credits_stream(self):
+        scraper, _ = self._scraper({'/fullcredits': FULL_CREDITS_PAGE})
+        for get_credits in (scraper.get_full_cast, scraper.get_full_crew):
+            self.assertEqual([str(credit) for credit in get_credits('tt0076759', stream=True)],
+                             [str(credit) for credit in get_credits('tt0076759')])
+
+    def test_get_full_cast_stops_after_cast(self):
+        page = FULL_CREDITS_PAGE + '<div>' + 'x' * 100000 + '</div>'
+        scraper, transport = self._scraper({'/fullcredits': page})
+        credits = list(scraper.get_full_cast('tt0076759', stream=True))
+        self.assertEqual(len(credits), 2)
+        self.assertLess(transport.chunks_read, 100)
+        self.assertTrue(transport.closed)
+
+    def test_get_name_credits_stream(self):
+        name_page = '<div id="filmography">' + _filmography_row('tt0000010', 'Luke', 'tt0000011') + \
+                    _filmography_row('tt0000020', 'Han', 'tt0000021') + '</div>'
+        scraper, _ = self._scraper({
+            'title=tt0000010': episodes_page('tt0000012', 'tt0000013'),
+            'title=tt0000020': '',
+            '/name/nm0000434/': name_page,
+        }, prefetch_workers=2)
+        credits = list(scraper.get_name_credits('nm0000434', include_episodes=True, stream=True))
+        self.assertEqual([credit.title_id for credit in credits], [
+            'tt0000012', 'tt0000013', 'tt0000010', 'tt0000020'
+        ])
+
+    def test_get_name_credits_stops_early(self):
+        name_page = '<div id="filmography">' + ''.join(
+            _filmography_row(f'tt{i:07d}', 'Role', f'tt{i + 1:07d}') for i in range(0, 2000, 2)
+        ) + '</div>'
+        scraper, transport = self._scraper({'/name/nm0000434/': name_page})
+        credits = scraper.get_name_credits('nm0000434', stream=True)
+        first_credits = [next(credits) for _ in range(3)]
+        credits.close()
+        self.assertEqual([credit.title_id for credit in first_credits], ['tt0000000', 'tt0000002', 'tt0000004'])
+        self.assertLess(transport.chunks_read, 50)
+        self.assertTrue(transport.closed)
+
+    def test_stream_not_found(self):
+        scraper, transport = self._scraper({})
+        with self.assertRaises(HTTPError):
+            list(scraper.get_name_credits('nm0000434', stream=True))
+        self.assertTrue(transport.closed)
@@ -0,0 +1,96 @@
+"""Module to test functionality of the scraper transports."""
+
+import unittest
+import os
+from tempfile import TemporaryDirectory
+from requests.exceptions import HTTPError
+from pymdb.ratelimit import RateLimiter
+from pymdb.scraper import PyMDbScraper
+from pymdb.transport import (
+    FixtureServer,
+    RecordingTransport,
+    ReplayTransport,
+    SessionTransport,
+    Transport,
+    TransportResponse,
+)
+from tests.pages import FULL_CREDITS_PAGE
+
+_TITLE_URL = 'https://www.imdb.com/title/tt0076759/fullcredits'
+_MISSING_URL = 'https://www.imdb.com/title/tt0000000/fullcredits'
+_SEARCH_URL = 'https://v2.sg.media-imdb.com/suggestion/s/star wars.json'
+_SEARCH_RESULTS = '{"d": [{"id": "tt0076759", "rank": 1, "l": "Star Wars", "q": "feature", "s": "Mark Hamill", "y": 1977}]}'
+
+
+class _FakeTransport(Transport):
+    def __init__(self, responses):
+        self.responses = responses
+        self.closed = False
+
+    def get(self, url, headers=None, timeout=None):
+        if url in self.responses:
+            return TransportResponse(url, 200, self.responses[url], {'Content-Type': 'text/html', 'X-Other': '1'})
+        return TransportResponse(url, 404, 'not found')
+
+    def close(self):
+        self.closed = True
+
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.archive_path = os.path.join(self.temp_dir.name, 'responses.jsonl.gz')
+        inner = _FakeTransport({_TITLE_URL: FULL_CREDITS_PAGE, _SEARCH_URL: _SEARCH_RESULTS})
+        with RecordingTransport(self.archive_path, inner) as recorder:
+            self.assertEqual(recorder.get(_TITLE_URL).text, FULL_CREDITS_PAGE)
+            self.assertEqual(recorder.get(_MISSING_URL).status_code, 404)
+        with RecordingTransport(self.archive_path, inner) as recorder:
+            recorder.get(_SEARCH_URL)
+        self.assertTrue(inner.closed)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_replay(self):
+        transport = ReplayTransport(self.archive_path)
+        self.assertEqual(len(transport), 3)
+        self.assertIn(_TITLE_URL, transport)
+        response = transport.get(_TITLE_URL)
+        self.assertEqual(response.text, FULL_CREDITS_PAGE)
+        self.assertEqual(response.headers['content-type'], 'text/html')
+        self.assertNotIn('X-Other', response.headers)
+        with self.assertRaises(HTTPError):
+            transport.get(_MISSING_URL).raise_for_status()
+        self.assertEqual(transport.get('https://www.imdb.com/unknown').status_code, 404)
+
+    def test_scraper_replay(self):
+        scraper = PyMDbScraper(rate_limiter=RateLimiter(0), transport=ReplayTransport(self.archive_path))
+        credits = list(scraper.get_full_credits('tt0076759'))
+        self.assertEqual([credit.name_id for credit in credits], ['nm0000434', 'nm0000148', 'nm0000184', 'nm0000184'])
+        self.assertEqual(scraper.get_search_results('star wars')[0].imdb_id, 'tt0076759')
+        with self.assertRaises(HTTPError):
+            list(scraper.get_full_credits('tt0000000'))
+
+    def test_fixture_server(self):
+        with FixtureServer(self.archive_path) as server:
+            transport = SessionTransport(base_url=server.url)
+            scraper = PyMDbScraper(rate_limiter=RateLimiter(0), transport=transport)
+            with scraper:
+                credits = list(scraper.get_full_credits('tt0076759'))
+                self.assertEqual(len(credits), 4)
+                self.assertEqual(scraper.get_search_results('star wars')[0].imdb_id, 'tt0076759')
+                response = transport.get('https://www.imdb.com/unknown')
+                self.assertEqual(response.status_code, 404)
+
+    def test_fixture_server_stream(self):
+        with FixtureServer(self.archive_path) as server:
+            transport = SessionTransport(base_url=server.url)
+            scraper = PyMDbScraper(rate_limiter=RateLimiter(0), transport=transport)
+            with scraper:
+                self.assertEqual(len(list(scraper.get_full_cast('tt0076759', stream=True))), 2)
+                self.assertEqual(len(list(scraper.get_full_crew('tt0076759', stream=True))), 2)
+
+    def test_response_iter_content(self):
+        response = TransportResponse(_TITLE_URL, 200, 'Star Wars é')
+        self.assertEqual(list(response.iter_content(4, decode_unicode=True)), ['Star', ' War', 's é'])
+        self.assertEqual(b''.join(response.iter_content(4)), 'Star Wars é'.encode('utf8'))
@@ -585,6 +585,13 @@ class TestIsFloat(unittest.TestCase):
     def test_is_float_none(self):
         self.assertFalse(is_float(None))
 
+    def test_is_float_zero(self):
+        self.assertTrue(is_float(0.0))
+
+    def test_is_float_non_scalar(self):
+        self.assertFalse(is_float([]))
+        self.assertFalse(is_float({}))
+
 
 class TestIsInt(unittest.TestCase):
     def test_is_int_integer(self):
@@ -602,6 +609,14 @@ class TestIsInt(unittest.TestCase):
     def test_is_int_none(self):
         self.assertFalse(is_int(None))
 
+    def test_is_int_zero(self):
+        self.assertTrue(is_int(0))
+        self.assertTrue(is_int('0'))
+
+    def test_is_int_non_scalar(self):
+        self.assertFalse(is_int([]))
+        self.assertFalse(is_int({}))
+
 
 class TestToBool(unittest.TestCase):
     def test_to_bool_boolean_true(self):
@@ -631,6 +646,10 @@ class TestToBool(unittest.TestCase):
     def test_to_bool_none(self):
         self.assertFalse(to_bool(None))
 
+    def test_to_bool_non_scalar(self):
+        self.assertFalse(to_bool([]))
+        self.assertTrue(to_bool(['1']))
+
 
 class TestToDatetime(unittest.TestCase):
     _correct_date = datetime(1999, 8, 21)